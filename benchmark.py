@@ -0,0 +1,335 @@
+# Synthetic-scale benchmarks of the transform and write stages.
+#
+#   python benchmark.py [--scales small,state,sa3,sa2] [--cases CASE,...] [--repeat N] [--compare REPORT]
+#
+# synthetic_observations() generates frames shaped exactly like extract_data(..., layout='long')
+# returns them (categorical label columns, TIME_PERIOD as int32 period ordinals, float64
+# OBS_VALUE), with a configurable number of regions, building types, work types, sectors and
+# periods. Every case (label mapping, vintage stitching, reshape and rolling year-end sums both on
+# frames and on a panel.Panel, the whole build_app/build_act transforms and the CSV/Parquet
+# writes) is timed at each scale: the best and median wall time of --repeat runs, the CPU time,
+# and the peak memory traced by tracemalloc on one extra run (numpy and pandas buffers are
+# traced; Arrow's own allocations are not). The scaling
+# exponent of each case is the slope of log(time) against log(rows) over the scales, ~1 for linear.
+#
+# The data depends only on the scale, the seed and END_PERIOD, never on today's date, so results
+# written to BUILD_BENCHMARK_DIR (tagged with the git commit) can be compared across commits:
+# --compare prints the ratio of each timing to an earlier report.
+import argparse
+import gc
+import json
+import os
+import platform
+import shutil
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+import build_act
+import build_app
+import codelist
+import output
+import schema
+from dhandler import map_codes
+from instrument import git_commit, reset
+from panel import Panel
+from transform import rolling_sum, stitch_vintages, to_measure_columns
+
+BENCHMARK_DIR = os.environ.get("BUILD_BENCHMARK_DIR", "benchmarks")
+
+# Last period generated, fixed so that reruns on later dates generate the same data
+END_PERIOD = "2024-12"
+SEED = 0
+
+# Share of observations left missing, as ABS does for confidential or not yet published cells
+MISSING = 0.02
+
+# regions: up to 9 are states, more are SA2 areas (~2,400 publish building approvals)
+SCALES = {
+    "small": dict(regions=9, building_types=3, work_types=1, sectors=1, start="2016-07"),
+    "state": dict(regions=9, building_types=11, work_types=3, sectors=3, start="1955-01"),
+    "sa3": dict(regions=340, building_types=11, work_types=1, sectors=1, start="2016-07"),
+    "sa2": dict(regions=2400, building_types=11, work_types=1, sectors=1, start="2016-07"),
+}
+
+# First period of the 2021 onwards SA2 vintage; the 2016-21 vintage overlaps it by VINTAGE_OVERLAP months
+VINTAGE_START = "2021-07"
+VINTAGE_OVERLAP = 6
+
+APP_MEASURES = ["1", "2"]
+ACT_MEASURES = ["M1", "M2", "M3", "M4", "M5", "M6", "M7", "M8"]
+APP_KEYS = ["MEASURE", "SECTOR", "WORK_TYPE", "BUILDING_TYPE", "REGION_TYPE", "REGION"]
+APP_DIMS = ["REGION", "REGION_TYPE", "WORK_TYPE", "SECTOR", "BUILDING_TYPE"]
+
+# The first n codes of a dimension, skipping codes whose label repeats an earlier one (e.g. '0'
+# and 'AUS' are both 'Australia'), so every generated series is distinct after mapping
+def _codes(dim, n, length=None):
+    seen, codes = set(), []
+    for code, label in codelist.labels(dim).items():
+        if (length is None or len(code) == length) and label not in seen and code != "AUS":
+            seen.add(label)
+            codes.append(code)
+    if n > len(codes):
+        raise ValueError(f"{dim} has only {len(codes)} distinct codes, {n} asked for")
+    return codes[:n]
+
+def _region_codes(regions):
+    # States are the one-digit codes 1-9, SA2 areas the nine-digit ones
+    return _codes("REGION", regions, length=1 if regions <= 9 else 9)
+
+# Long observations shaped like extract_data(api, layout='long') for BA_SA2 ('app', monthly) or
+# BUILDING_ACTIVITY ('act', quarterly): one row per series and period, with the dataflow's dtypes
+# (schema.py). The dimension columns are mapped to categorical labels as extract_data does, unless
+# codes is set, which leaves the raw codes as strings (the input of dhandler.map_codes)
+def synthetic_observations(dataset="app", regions=9, building_types=3, work_types=1, sectors=1, start="2016-07", end=END_PERIOD, seed=SEED, codes=False):
+    if dataset == "app":
+        dims = {
+            "MEASURE": APP_MEASURES,
+            "SECTOR": _codes("SECTOR", sectors),
+            "WORK_TYPE": _codes("WORK_TYPE", work_types),
+            "BUILDING_TYPE": _codes("BUILDING_TYPE", building_types),
+            "REGION_TYPE": ["STE" if regions <= 9 else "SA2"],
+            "REGION": _region_codes(regions),
+        }
+        resource_id, periods = "BA_SA2", pd.period_range(start, end, freq="M")
+    elif dataset == "act":
+        dims = {
+            "MEASURE": ACT_MEASURES,
+            "REGION": _region_codes(regions),
+            "PRICE_ADJ": ["CUR"],
+            "BLD_WORK_TYPE": _codes("BLD_WORK_TYPE", work_types),
+            "SECTOR_OWN": _codes("SECTOR_OWN", sectors),
+            "TYPE_BLDG": _codes("TYPE_BLDG", building_types),
+            "TSEST": ["10"],
+        }
+        resource_id, periods = "BUILDING_ACTIVITY", pd.period_range(start, end, freq="Q")
+    else:
+        raise ValueError(f"Unknown dataset {dataset!r}, expected 'app' or 'act'")
+
+    series = pd.MultiIndex.from_product(list(dims.values()), names=list(dims)).to_frame(index=False)
+    for col in series.columns:
+        series[col] = pd.Categorical(series[col]) if codes else map_codes(series[col], col)
+    rows = np.repeat(np.arange(len(series)), len(periods))
+    data = series.iloc[rows].reset_index(drop=True)
+    if codes:
+        data = data.astype("str")
+
+    rng = np.random.default_rng(seed)
+    values = rng.integers(0, 1000, len(data)).astype("float64")
+    values[rng.random(len(data)) < MISSING] = np.nan
+    data["TIME_PERIOD"] = np.tile(periods.asi8.astype(schema.PERIOD), len(series))
+    data["OBS_VALUE"] = values
+    return schema.enforce(data, resource_id) if not codes else data
+
+# The 2016-21 and 2021 onwards vintages of app observations, overlapping by VINTAGE_OVERLAP months,
+# with the newer vintage's values revised
+def synthetic_vintages(data, seed=SEED):
+    start = pd.Period(VINTAGE_START, freq="M").ordinal
+    old = data[data["TIME_PERIOD"] < start + VINTAGE_OVERLAP].reset_index(drop=True)
+    new = data[data["TIME_PERIOD"] >= start].reset_index(drop=True)
+    rng = np.random.default_rng(seed + 1)
+    new["OBS_VALUE"] = new["OBS_VALUE"] + rng.integers(-5, 5, len(new))
+    return old, new
+
+# Inputs of the cases at one scale, generated the first time a case asks for them
+class Inputs(dict):
+    def __init__(self, spec, seed=SEED):
+        super().__init__()
+        self.spec = spec
+        self.seed = seed
+
+    def __missing__(self, key):
+        if key == "app":
+            value = synthetic_observations("app", seed=self.seed, **self.spec)
+        elif key == "app_codes":
+            value = synthetic_observations("app", seed=self.seed, codes=True, **self.spec)
+        elif key == "act":
+            value = synthetic_observations("act", seed=self.seed, **self.spec)
+        elif key == "vintages":
+            value = synthetic_vintages(self["app"], self.seed)
+        elif key == "reshaped":
+            value = to_measure_columns(self["app"], APP_DIMS)
+        elif key == "panel":
+            value = Panel.from_long(self["app"], APP_DIMS)
+        elif key == "build_app":
+            value = build_app.transform(self["vintages"])
+        else:
+            raise KeyError(key)
+        self[key] = value
+        return value
+
+def _map_labels(data):
+    return {col: map_codes(data[col], col) for col in APP_KEYS}
+
+# As write_output does, the writes include rendering the period labels
+def _write_csv(data):
+    return output.write_csv(schema.render(data, "build_app"), "build_app", index=True)
+
+def _write_parquet(data):
+    return output.write_parquet(schema.render(data, "build_app"), "build_app", partition_cols=["State", "Year"], period="Month")
+
+# name -> (input the case runs on, function timed on it)
+CASES = {
+    "map": ("app_codes", _map_labels),
+    "stitch": ("vintages", lambda vintages: stitch_vintages(list(vintages), APP_KEYS)),
+    "reshape": ("app", lambda data: to_measure_columns(data, APP_DIMS)),
+    "rolling": ("reshaped", lambda data: rolling_sum(data, APP_DIMS, ["Number of dwelling units", "Value of building jobs"], window=12)),
+    # The same reshape and year-end sums on a dense panel, as build_app and build_act run them
+    "panel.reshape": ("app", lambda data: Panel.from_long(data, APP_DIMS).to_frame()),
+    "panel.rolling": ("panel", lambda panel: panel.select(["Number of dwelling units", "Value of building jobs"]).rolling_sum(12)),
+    "build_app.transform": ("vintages", build_app.transform),
+    "build_act.transform": ("act", build_act.transform),
+    "write.csv": ("build_app", _write_csv),
+    "write.parquet": ("build_app", _write_parquet),
+}
+
+# Best and median wall time and the CPU time of repeat runs, then the traced peak of one more run
+def measure(func, arg, repeat=3):
+    walls, cpus = [], []
+    for _ in range(repeat):
+        gc.collect()
+        wall, cpu = time.perf_counter(), time.process_time()
+        func(arg)
+        walls.append(time.perf_counter() - wall)
+        cpus.append(time.process_time() - cpu)
+
+    gc.collect()
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    func(arg)
+    peak = tracemalloc.get_traced_memory()[1] - baseline
+    if not tracing:
+        tracemalloc.stop()
+    return {
+        "wall_s_min": round(min(walls), 6),
+        "wall_s_median": round(float(np.median(walls)), 6),
+        "cpu_s_min": round(min(cpus), 6),
+        "traced_peak_bytes": int(peak),
+    }
+
+# Slope of log(wall time) against log(rows) per case, over the scales it ran at
+def scaling(results):
+    exponents = {}
+    for case in dict.fromkeys(result["case"] for result in results):
+        points = [(result["rows"], result["wall_s_min"]) for result in results if result["case"] == case and result["wall_s_min"] > 0]
+        if len({rows for rows, _ in points}) >= 2:
+            rows, walls = np.log(np.array(points, dtype="float64")).T
+            exponents[case] = round(float(np.polyfit(rows, walls, 1)[0]), 3)
+    return exponents
+
+def _dirty():
+    try:
+        return bool(subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True, text=True, timeout=10,
+        ).stdout.strip())
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+def _versions():
+    versions = {"python": platform.python_version(), "numpy": np.__version__, "pandas": pd.__version__}
+    if output.pa is not None:
+        versions["pyarrow"] = output.pa.__version__
+    return versions
+
+def run(scales, cases, repeat=3, seed=SEED):
+    results = []
+    workdir = tempfile.mkdtemp(prefix="benchmark_")
+    cwd = os.getcwd()
+    try:
+        # The write cases write into a scratch directory
+        os.chdir(workdir)
+        for scale in scales:
+            inputs = Inputs(SCALES[scale], seed)
+            for case in cases:
+                source, func = CASES[case]
+                if case == "write.parquet" and output.pq is None:
+                    print(f"{scale:>6} {case:<20} skipped, needs pyarrow")
+                    continue
+                data = inputs[source]
+                if isinstance(data, tuple):
+                    rows = sum(len(frame) for frame in data)
+                elif isinstance(data, Panel):
+                    rows = data.values.shape[0] * data.values.shape[1]  # rows of the reshaped frame
+                else:
+                    rows = len(data)
+                result = {"case": case, "scale": scale, "rows": rows, **measure(func, data, repeat)}
+                result["rows_per_s"] = round(rows / result["wall_s_min"]) if result["wall_s_min"] else None
+                results.append(result)
+                reset()  # the instrumented stages keep their own records; not needed here
+                print(
+                    f"{scale:>6} {case:<20} {rows:>10,} rows {result['wall_s_min']:>9.3f}s "
+                    f"(median {result['wall_s_median']:.3f}s) {result['traced_peak_bytes'] / 2**20:>9.1f} MiB"
+                )
+            del inputs
+            gc.collect()
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    return {
+        "git_commit": git_commit(),
+        "dirty": _dirty(),
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "versions": _versions(),
+        "machine": {"platform": platform.platform(), "processor": platform.machine(), "cpus": os.cpu_count()},
+        "end_period": END_PERIOD,
+        "seed": seed,
+        "repeat": repeat,
+        "scales": {scale: SCALES[scale] for scale in scales},
+        "results": results,
+        "scaling": scaling(results),
+    }
+
+def write_report(report, benchmark_dir=None):
+    benchmark_dir = benchmark_dir or BENCHMARK_DIR
+    os.makedirs(benchmark_dir, exist_ok=True)
+    commit = (report["git_commit"] or "unknown")[:12]
+    stamp = datetime.fromisoformat(report["created_at"])
+    path = os.path.join(benchmark_dir, f"{commit}_{stamp:%Y%m%dT%H%M%S}.json")
+    with open(path, "w") as file:
+        json.dump(report, file, indent=2)
+    return path
+
+# Ratio of each best wall time to the same case and scale in an earlier report (< 1 is faster)
+def compare(report, baseline):
+    before = {(result["case"], result["scale"]): result for result in baseline["results"]}
+    print(f"Compared with {(baseline['git_commit'] or 'unknown')[:12]} ({baseline['created_at']})")
+    for result in report["results"]:
+        old = before.get((result["case"], result["scale"]))
+        if old is None or old["rows"] != result["rows"]:
+            continue
+        ratio = result["wall_s_min"] / old["wall_s_min"] if old["wall_s_min"] else float("nan")
+        print(f"{result['scale']:>6} {result['case']:<20} {old['wall_s_min']:>9.3f}s -> {result['wall_s_min']:>9.3f}s  x{ratio:.2f}")
+
+def _names(value, known, what):
+    names = [name.strip() for name in value.split(",") if name.strip()]
+    unknown = [name for name in names if name not in known]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown {what}: {', '.join(unknown)} (expected {', '.join(known)})")
+    return names
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time the transform and write stages on synthetic data at several scales")
+    parser.add_argument("--scales", type=lambda value: _names(value, SCALES, "scales"), default=list(SCALES), help="comma-separated scales (default: all)")
+    parser.add_argument("--cases", type=lambda value: _names(value, CASES, "cases"), default=list(CASES), help="comma-separated cases (default: all)")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per case (default: %(default)s)")
+    parser.add_argument("--seed", type=int, default=SEED, help="random seed of the synthetic data (default: %(default)s)")
+    parser.add_argument("--compare", metavar="REPORT", help="earlier benchmark report to compare against")
+    args = parser.parse_args()
+
+    report = run(args.scales, args.cases, args.repeat, args.seed)
+    print("Scaling exponents (time ~ rows^k):", ", ".join(f"{case} {k}" for case, k in report["scaling"].items()))
+    print(f"Report written to {write_report(report)}")
+    if args.compare:
+        with open(args.compare) as file:
+            compare(report, json.load(file))
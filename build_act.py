@@ -1,81 +1,65 @@
-import pandas as pd
 import sys
 
 # Add the path to the directory where the custom modules are located
 sys.path.append("D:/Purdon2")
-from dhandler import extract_data, construct_building_activity_url
+from dhandler import extract_data
+from panel import Panel
+from output import write_output
+from schema import enforce, period_end
+from instrument import write_report
 
 # Define the API URL, the reason why I put current and original prices in the URL
 # is to reduce the size of the DataFrame, otherwise,
-# it will be too large and encounter internet error (504)
+# it will be too large and encounter internet error (504).
+# Any '+'-joined dimension in the key is split automatically by extract_data
+# into smaller concurrent queries if ABS still answers with a 504 or times out
 api_url = "https://data.api.abs.gov.au/rest/data/ABS,BUILDING_ACTIVITY,1.0.0/..CUR....10.Q?dimensionAtObservation=AllDimensions"
 
 # # Previous URL
 # api_url = "https://api.data.abs.gov.au/data/ABS,BUILDING_ACTIVITY,1.0.0/..CUR....10.Q?dimensionAtObservation=AllDimensions"
 
-# Extract the data
-data = extract_data(api_url)
-
-# Unpivot (melt) the DataFrame to convert quarterly columns into rows, be careful with the duplicates
-unpivoted_df = pd.melt(
-    data,
-    id_vars=[
-        "MEASURE",
-        "REGION",
-        "PRICE_ADJ",
-        "BLD_WORK_TYPE",
-        "SECTOR_OWN",
-        "TYPE_BLDG",
-        "TSEST",
-    ],
-    var_name="Quarter",
-    value_name="VALUE",
-)
-
-# Pivot the data to convert measure columns into various columns
-pivoted_df = unpivoted_df.pivot(
-    index=[
-        "REGION",
-        "PRICE_ADJ",
-        "BLD_WORK_TYPE",
-        "SECTOR_OWN",
-        "TYPE_BLDG",
-        "TSEST",
-        "Quarter",
-    ],
-    columns=["MEASURE"],
-    values="VALUE",
-).reset_index()
-
-# Sort the pivoted DataFrame based on several fields, prepare for calculating moving Sums
-pivoted_df.sort_values(
-    by=[
-        "REGION",
-        "PRICE_ADJ",
-        "BLD_WORK_TYPE",
-        "SECTOR_OWN",
-        "TYPE_BLDG",
-        "TSEST",
-        "Quarter",
-    ],
-    inplace=True,
-)
-
-# Define the list of measures for the moving sum calculation
-measures = [
-    "Number of dwelling units commenced",
-    "Number of dwelling units completed",
-    "Number of dwelling units under construction",
-    "Value of work done during quarter",
-    "Value of work yet to be done",
-    "Value of work commenced",  # Newly added measure
-    "Value of work completed",  # Newly added measure
-    "Value of work under construction",  # Newly added measure
-]
-
-# Compute 4-quarter moving sum for selected columns
-pivoted_df[
-    [
+# The build runs as three stages, fetch -> transform -> write, which run_pipeline.py schedules
+# alongside the other builders; running this script directly runs them in turn
+
+# Only the latest quarters are requested on a routine run and merged into the history kept from
+# the previous run; pass full_refresh (--full-refresh) to refetch everything, which is also the
+# only way to pick up ABS revisions older than dhandler.REVISION_PERIODS quarters
+def fetch(full_refresh=False):
+    # Extract the data as long-form observations (one row per series and quarter)
+    data = extract_data(api_url, layout="long", incremental=True, full_refresh=full_refresh)
+
+    # The dimension columns arrive as categoricals (see dhandler.map_codes) and stay categorical
+    # through the reshape and groupby below
+    return data
+
+def transform(data):
+    # Lay the observations out as a [series, quarter, measure] panel (see panel.py)
+    panel = Panel.from_long(
+        data,
+        [
+            "REGION",
+            "PRICE_ADJ",
+            "BLD_WORK_TYPE",
+            "SECTOR_OWN",
+            "TYPE_BLDG",
+            "TSEST",
+        ],
+    )
+
+    # Define the list of measures for the moving sum calculation
+    measures = [
+        "Number of dwelling units commenced",
+        "Number of dwelling units completed",
+        "Number of dwelling units under construction",
+        "Value of work done during quarter",
+        "Value of work yet to be done",
+        "Value of work commenced",  # Newly added measure
+        "Value of work completed",  # Newly added measure
+        "Value of work under construction",  # Newly added measure
+    ]
+
+    # Compute 4-quarter moving sum for selected columns, along the quarter axis
+    year_end_columns = [
         "Year-End Dwelling Units Commenced",
         "Year-End Dwelling Units Completed",
         "Year-End Dwelling Units Under Construction",
@@ -85,47 +69,58 @@ pivoted_df[
         "Year-End Work Completed",
         "Year-End Work Under Construction",
     ]
-] = pivoted_df.groupby(
-    ["REGION", "PRICE_ADJ", "BLD_WORK_TYPE", "SECTOR_OWN", "TYPE_BLDG", "TSEST"]
-)[
-    measures
-].transform(
-    lambda x: x.rolling(window=4).sum()
-)
-
-# Filter the DataFrame for rows where 'PRICE_ADJ' is 'Current Prices' and 'Adjustment Type' is 'Original'
-build_act = pivoted_df[
-    (pivoted_df["PRICE_ADJ"] == "Current Prices") & (pivoted_df["TSEST"] == "Original")
-].copy()
-
-
-# Rename columns for final presentation
-build_act.rename(
-    columns={
-        "Number of dwelling units commenced": "Dwelling Units Commenced",
-        "Number of dwelling units completed": "Dwelling Units Completed",
-        "Number of dwelling units under construction": "Dwelling Units Under Construction",
-        "Value of work commenced": "Work Commenced",
-        "Value of work completed": "Work Completed",
-        "Value of work under construction": "Work Under Construction",
-        "Value of work done during quarter": "Work Done",
-        "Value of work yet to be done": "Work Yet to be Done",
-        "REGION": "State",
-        "PRICE_ADJ": "Price Adjustment",
-        "BLD_WORK_TYPE": "Building Work Type",
-        "SECTOR_OWN": "Sector",
-        "TYPE_BLDG": " Building Type",
-        "TSEST": "Adjustment Type",
-    },
-    inplace=True,
-)
-
-# Remove leading/trailing whitespaces from column names in the DataFrame
-build_act.columns = build_act.columns.str.strip()
-
-# Convert "Quarter" to datetime and strip the time portion
-build_act["Quarter Time"] = pd.PeriodIndex(build_act["Quarter"], freq='Q').to_timestamp(how='end')
-build_act["Quarter Time"] = build_act["Quarter Time"].dt.normalize()
-
-build_act.to_csv("build_act.csv", index=False)
-print(build_act.dtypes)
+    year_end = panel.select(measures, year_end_columns).rolling_sum(4)
+
+    # One row per series and quarter, sorted, with the measures and their moving sums as columns
+    pivoted_df = panel.join(year_end).to_frame(period="Quarter")
+
+    # Filter the DataFrame for rows where 'PRICE_ADJ' is 'Current Prices' and 'Adjustment Type' is 'Original'
+    build_act = pivoted_df[
+        (pivoted_df["PRICE_ADJ"] == "Current Prices") & (pivoted_df["TSEST"] == "Original")
+    ].copy()
+
+
+    # Rename columns for final presentation
+    build_act.rename(
+        columns={
+            "Number of dwelling units commenced": "Dwelling Units Commenced",
+            "Number of dwelling units completed": "Dwelling Units Completed",
+            "Number of dwelling units under construction": "Dwelling Units Under Construction",
+            "Value of work commenced": "Work Commenced",
+            "Value of work completed": "Work Completed",
+            "Value of work under construction": "Work Under Construction",
+            "Value of work done during quarter": "Work Done",
+            "Value of work yet to be done": "Work Yet to be Done",
+            "REGION": "State",
+            "PRICE_ADJ": "Price Adjustment",
+            "BLD_WORK_TYPE": "Building Work Type",
+            "SECTOR_OWN": "Sector",
+            "TYPE_BLDG": " Building Type",
+            "TSEST": "Adjustment Type",
+        },
+        inplace=True,
+    )
+
+    # Remove leading/trailing whitespaces from column names in the DataFrame
+    build_act.columns = build_act.columns.str.strip()
+
+    # Counts as Int32, values as float64 and the quarter as an int32 period ordinal (see schema.py);
+    # write_output renders the quarter back to its label
+    build_act = enforce(build_act, 'build_act')
+    build_act["Quarter Time"] = period_end(build_act["Quarter"], "Q")
+    return build_act
+
+def write(build_act):
+    # Save in the configured output formats (the CSV and its delta unless BUILD_OUTPUT_FORMATS
+    # says otherwise); Parquet output is partitioned by state and year
+    write_output(build_act, 'build_act', partition_cols=['State', 'Year'], period='Quarter')
+    print(build_act.dtypes)
+
+def main():
+    write(transform(fetch(full_refresh="--full-refresh" in sys.argv)))
+
+    # Per-stage timings and memory of this run (see instrument.py)
+    write_report('build_act')
+
+if __name__ == "__main__":
+    main()
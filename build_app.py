@@ -1,50 +1,80 @@
 # Sometimes a request to a URL fails and then succeeds moments later
-import pandas as pd
 import sys
 
 # Add the path to the directory where the custom modules are located
 sys.path.append("D:/Purdon2")
-from dhandler import extract_data, construct_building_activity_url
+from dhandler import extract_data
+from transform import stitch_vintages
+from panel import Panel
+from output import write_output
+from schema import enforce, period_end
+from instrument import write_report
 
 # Define the API URL, the reason why I put dwelling sorts in the URL
 # is to reduce the size of the DataFrame, otherwise,
-# it will be too large and encounter internet error (504)
+# it will be too large and encounter internet error (504).
+# extract_data also splits the building types into smaller concurrent
+# queries by itself whenever ABS still answers with a 504 or times out
 api_urls = {
     '2016_2021':"https://data.api.abs.gov.au/rest/data/ABS,BA_SA2_2016-21,1.0.0/...TOT+150+130+134+133+132+131+120+122+121+110.AUS+STE..M?dimensionAtObservation=AllDimensions",
     '2021_onwards': 'https://data.api.abs.gov.au/rest/data/ABS,BA_SA2,2.0.0/...TOT+150+130+134+133+132+131+120+122+121+110.AUS+STE..M?dimensionAtObservation=AllDimensions'
 }
 
-# Extract the data
-data_2016_2021 = extract_data(api_urls['2016_2021'])
-data_2021_onwards = extract_data(api_urls['2021_onwards'])
+# The build runs as three stages, fetch -> transform -> write, which run_pipeline.py schedules
+# alongside the other builders; running this script directly runs them in turn
 
-# Merge concatenated DataFrames for each year
-merged_data = None
-merged_data = pd.merge(data_2016_2021, data_2021_onwards, on=["MEASURE", "SECTOR", "WORK_TYPE", "BUILDING_TYPE", "REGION_TYPE", "REGION"], how="outer")
+# Only the latest months are requested on a routine run and merged into the history kept from
+# the previous run; pass full_refresh (--full-refresh) to refetch everything (e.g. after an SA2 rebase),
+# which is also the only way to pick up ABS revisions older than dhandler.REVISION_PERIODS months
+def fetch(full_refresh=False):
+    # Extract the data as long-form observations (one row per series and month)
+    data_2016_2021 = extract_data(api_urls['2016_2021'], layout="long", incremental=True, full_refresh=full_refresh)
+    data_2021_onwards = extract_data(api_urls['2021_onwards'], layout="long", incremental=True, full_refresh=full_refresh)
 
-# Perform unpivot (melt) (month columns to rows)
-unpivoted_data = pd.melt(merged_data, id_vars=["MEASURE", "SECTOR", "WORK_TYPE", "BUILDING_TYPE", "REGION_TYPE", "REGION"], var_name="Month", value_name="VALUE")
+    # The dimension columns arrive as categoricals (see dhandler.map_codes) and stay categorical
+    # through the reshape and groupby below
+    return data_2016_2021, data_2021_onwards
 
-# # Pivot the data as adding measures as columns
-build_app = unpivoted_data.pivot(index=["REGION", "REGION_TYPE", "WORK_TYPE", "SECTOR", "BUILDING_TYPE", "Month"], columns="MEASURE", values="VALUE").reset_index()
+def transform(raw):
+    data_2016_2021, data_2021_onwards = raw
 
-# Sort the DataFrame
-build_app.sort_values(by=["REGION", "REGION_TYPE", "WORK_TYPE", "SECTOR", "BUILDING_TYPE", "Month"], inplace=True)
+    # Stitch the two vintages series by series; where they overlap the newer 2021 onwards vintage wins
+    observations = stitch_vintages([data_2016_2021, data_2021_onwards], ["MEASURE", "SECTOR", "WORK_TYPE", "BUILDING_TYPE", "REGION_TYPE", "REGION"])
 
-# Calculate moving Sums
-build_app[['Year-End Dwelling Units', 'Year-End Building Jobs Value']] = build_app.groupby(["REGION_TYPE", "REGION", "WORK_TYPE", "SECTOR", "BUILDING_TYPE"])[['Number of dwelling units', 'Value of building jobs']].transform(lambda x: x.rolling(window=12).sum())
+    # Lay the observations out as a [series, month, measure] panel (see panel.py)
+    panel = Panel.from_long(observations, ["REGION", "REGION_TYPE", "WORK_TYPE", "SECTOR", "BUILDING_TYPE"])
 
-# Rename columns for clarity
-build_app.rename(columns={'Number of dwelling units': 'Dwelling Units', 
-                             'Value of building jobs': 'Building Jobs Value',
-                             "REGION": 'State', 
-                             'REGION_TYPE': 'Region Type',
-                             "WORK_TYPE": 'Building Work Type', 
-                             'SECTOR': 'Sector', 
-                             "BUILDING_TYPE": 'Building Type'}, inplace=True)
+    # Calculate moving Sums along the month axis
+    year_end = panel.select(['Number of dwelling units', 'Value of building jobs'], ['Year-End Dwelling Units', 'Year-End Building Jobs Value']).rolling_sum(12)
 
-build_app["Month Time"] = pd.to_datetime(build_app["Month"], format="%Y-%m") + pd.DateOffset(days=31)
-build_app["Month Time"] = build_app["Month Time"] - pd.to_timedelta(build_app["Month Time"].dt.day, unit="D")
-build_app.to_csv('build_app.csv')
+    # One row per series and month, sorted, with the measures and their moving sums as columns
+    build_app = panel.join(year_end).to_frame(period="Month")
 
+    # Rename columns for clarity
+    build_app.rename(columns={'Number of dwelling units': 'Dwelling Units', 
+                                 'Value of building jobs': 'Building Jobs Value',
+                                 "REGION": 'State', 
+                                 'REGION_TYPE': 'Region Type',
+                                 "WORK_TYPE": 'Building Work Type', 
+                                 'SECTOR': 'Sector', 
+                                 "BUILDING_TYPE": 'Building Type'}, inplace=True)
 
+    # Counts as Int32, values as float64 and the month as an int32 period ordinal (see schema.py);
+    # write_output renders the month back to its label
+    build_app = enforce(build_app, 'build_app')
+    build_app["Month Time"] = period_end(build_app["Month"], "M")
+    return build_app
+
+def write(build_app):
+    # Save in the configured output formats (the CSV and its delta unless BUILD_OUTPUT_FORMATS
+    # says otherwise); Parquet output is partitioned by state and year
+    write_output(build_app, 'build_app', index=True, partition_cols=['State', 'Year'], period='Month')
+
+def main():
+    write(transform(fetch(full_refresh="--full-refresh" in sys.argv)))
+
+    # Per-stage timings and memory of this run (see instrument.py)
+    write_report('build_app')
+
+if __name__ == "__main__":
+    main()
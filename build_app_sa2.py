@@ -5,19 +5,20 @@
 # Further Development required, not finalised yet
 import sys
 import pandas as pd
-import asyncio
-import aiohttp
 
 # Add the path to the directory where your custom modules are located
 sys.path.append("D:/Purdon")  # Add the directory
 
-from dhandler2 import extract_data
-import pandas as pd
+from datetime import date
+from transform import stitch_vintages
+from schema import render
+from workqueue import WorkQueue, run
+from instrument import write_report
 
-# Define the base URLs
+# Define the base URLs, one per SA2 vintage
 base_urls = {
-    '2016_2021':'https://data.api.abs.gov.au/rest/data/ABS,BA_SA2_2016-21,1.0.0/...130.SA2..M?dimensionAtObservation=AllDimensions',
-    #'2021_onwards': 'https://api.data.abs.gov.au/data/ABS,BA_SA2,2.0.0/'
+    '2016_2021': 'https://data.api.abs.gov.au/rest/data/ABS,BA_SA2_2016-21,1.0.0/',
+    '2021_onwards': 'https://data.api.abs.gov.au/rest/data/ABS,BA_SA2,2.0.0/',
 }
 # https://data.api.abs.gov.au/rest/data/ABS,BA_SA2_2016-21,1.0.0/...700+TOT+100+150+130+134+133+132+131+120+122+121+110.SA2.102011028.M?dimensionAtObservation=AllDimensions
 
@@ -38,51 +39,58 @@ building_type = {
     "Total Non-Residential": "700"
 }
 
-merged_data = None
-# Define an asynchronous function to run extract_data for each API URL
-async def extract_data_async(session, url, retries=3, delay=5):
-    data = await asyncio.to_thread(extract_data, url, retries, delay)
-    return data
-
-async def fetch_and_merge_data():
-    # Initialize an empty DataFrame for all merged data
-    merged_data = pd.DataFrame()
-
-    # Loop over each building type and extract data
-    async with aiohttp.ClientSession() as session:
-        tasks = []
-        for key, value in building_type.items():
-            for val in value:
-                url = f'https://data.api.abs.gov.au/rest/data/ABS,BA_SA2_2016-21,1.0.0/...{val}.SA2..M?dimensionAtObservation=AllDimensions'
-                tasks.append(extract_data_async(session, url))
-        
-        # Wait for all tasks to complete
-        results = await asyncio.gather(*tasks)
-
-        # Concatenate all the results into one DataFrame
-        for result in results:
-            if result is not None:
-                merged_data = pd.concat([merged_data, result], ignore_index=True, sort=False)
-
-    # Return the merged data
-    return merged_data
-
-# Run the asynchronous data fetching and merging
-async def main():
-    merged_data = await fetch_and_merge_data()
-    print(merged_data.head())
-
-# Start the asynchronous event loop
+# Region types to crawl; LGA vintages (e.g. 'LGA2024') can be appended here
+region_types = ['SA2']
+
+# Seconds a single building type/vintage request (retries included) may take before it is skipped
+REQUEST_DEADLINE = 900
+
+# The build runs as three stages, fetch -> transform -> write, which run_pipeline.py schedules
+# alongside the other builders; running this script directly runs them in turn
+
+# One request per vintage, region type and building type. The crawl is recorded in a persistent
+# work queue of long-form slices (one per month), so a rerun after a failure only fetches what is
+# still outstanding; pass restart (--restart) to throw the checkpoints away and start the month's
+# crawl over. The checkpoints only serve resuming an interrupted crawl: once every slice is in,
+# the queue is retired, so the next run asks ABS again (incrementally) and sees a new release. Routine runs only fetch the latest months; pass full_refresh (--full-refresh) after
+# an SA2 rebase or to pick up revisions older than dhandler.REVISION_PERIODS months
+def fetch(full_refresh=False, restart=False):
+    queue = WorkQueue(f"build_app_sa2_long_{date.today():%Y-%m}")
+    if restart:
+        queue.reset()
+        queue = WorkQueue(queue.name)
+    queue.plan({
+        f'{vintage}_{region_type}_{value}': f'{base_url}...{value}.{region_type}..M?dimensionAtObservation=AllDimensions'
+        for vintage, base_url in base_urls.items()
+        for region_type in region_types
+        for value in building_type.values()
+    })
+
+    outstanding = run(queue, deadline=REQUEST_DEADLINE, layout="long", incremental=True, full_refresh=full_refresh)
+    if outstanding:
+        raise RuntimeError(f"{outstanding} requests still outstanding, rerun build_app_sa2.py to resume")
+
+    # Each vintage's slices come back in planned order and are assembled with a single concat
+    vintages = [pd.concat(queue.results(f'{vintage}_'), ignore_index=True, sort=False) for vintage in base_urls]
+    queue.reset()
+    return vintages
+
+# The vintages are stitched series by series, the 2021 onwards vintage winning where they overlap
+def transform(vintages):
+    return stitch_vintages(vintages, ["MEASURE", "SECTOR", "WORK_TYPE", "BUILDING_TYPE", "REGION_TYPE", "REGION"])
+
+def write(merged_data):
+    print(render(merged_data, 'build_app_sa2').head())
+
+def main():
+    try:
+        raw = fetch(full_refresh="--full-refresh" in sys.argv, restart="--restart" in sys.argv)
+    except RuntimeError as error:
+        sys.exit(str(error))
+    write(transform(raw))
+
+    # Per-stage timings and memory of this run (see instrument.py)
+    write_report('build_app_sa2')
+
 if __name__ == "__main__":
-    asyncio.run(main())
-
-for key, value in building_type.items():
-    # Extract the data
-    data1 = extract_data(f'https://data.api.abs.gov.au/rest/data/ABS,BA_SA2_2016-21,1.0.0/...{value}.SA2..M?dimensionAtObservation=AllDimensions')
-    data2 = extract_data(f'https://data.api.abs.gov.au/rest/data/ABS,BA_SA2,2.0.0/...{value}.SA2..M?dimensionAtObservation=AllDimensions')
-
-    # Concatenate DataFrames for each year
-    merged_data_temp = pd.concat([data1, data2], ignore_index=True, sort=False)
-    
-    # Combine all merged data into one DataFrame
-    merged_data = pd.concat([merged_data, merged_data_temp], ignore_index=True, sort=False)
+    main()
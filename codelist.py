@@ -0,0 +1,104 @@
+# Codelist store for the ABS dimensions used by the builders. Each dimension is stored once, as a
+# code -> label JSON file under codelists/, and is only read the first time it is needed, so the
+# state-level builders never pay for the ~3,000 entry REGION table. Dimension IDs that ABS uses
+# for the same codelist in different dataflows (e.g. SECTOR_OWN in BUILDING_ACTIVITY) are aliases.
+import json
+import os
+import threading
+from collections.abc import Mapping
+
+CODELIST_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "codelists")
+
+# Manifest written by codelist_sync.py describing the synced codelist version
+VERSION_FILE = "VERSION"
+
+# Synonymous dimension IDs -> the dimension whose codelist they share
+ALIASES = {
+    "SECTOR_OWN": "SECTOR",
+    "BLD_WORK_TYPE": "WORK_TYPE",
+    "TYPE_BLDG": "BUILDING_TYPE",
+}
+
+_labels = {}
+_codes = {}
+_stored_dims = None
+_lock = threading.Lock()
+
+def canonical(dim):
+    return ALIASES.get(dim, dim)
+
+def _path(dim):
+    return os.path.join(CODELIST_DIR, canonical(dim) + ".json")
+
+# Dimension IDs stored on disk (listed once, not loaded)
+def _stored():
+    global _stored_dims
+    if _stored_dims is None:
+        _stored_dims = frozenset(name[:-5] for name in os.listdir(CODELIST_DIR) if name.endswith(".json"))
+    return _stored_dims
+
+def dimensions():
+    return sorted(_stored()) + sorted(alias for alias, dim in ALIASES.items() if dim in _stored())
+
+def has(dim):
+    return canonical(dim) in _stored()
+
+# code -> label mapping of a dimension, loaded on first access
+def labels(dim):
+    dim = canonical(dim)
+    if dim not in _labels:
+        with _lock:
+            if dim not in _labels:
+                with open(_path(dim), encoding="utf-8") as file:
+                    _labels[dim] = json.load(file)
+    return _labels[dim]
+
+# label -> codes mapping of a dimension (a label can have several codes, e.g. 'Australia' in REGION)
+def codes(dim):
+    dim = canonical(dim)
+    if dim not in _codes:
+        reverse = {}
+        for code, name in labels(dim).items():
+            reverse.setdefault(name, []).append(code)
+        _codes[dim] = reverse
+    return _codes[dim]
+
+def label(dim, code, default=None):
+    return labels(dim).get(code, default)
+
+def code(dim, name, default=None):
+    found = codes(dim).get(name)
+    return found[0] if found else default
+
+# Version of the codelists on disk as recorded by the last sync (None if never synced)
+def version():
+    try:
+        with open(os.path.join(CODELIST_DIR, VERSION_FILE)) as file:
+            return json.load(file)["version"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+# Forget loaded codelists, e.g. after they were regenerated on disk
+def reload():
+    global _stored_dims
+    with _lock:
+        _stored_dims = None
+        _labels.clear()
+        _codes.clear()
+
+# Read-only dict-like view of every codelist, keyed by dimension ID (aliases included), that
+# loads each dimension lazily. This is what fmapping.field_index is
+class FieldIndex(Mapping):
+    def __getitem__(self, dim):
+        if not has(dim):
+            raise KeyError(dim)
+        return labels(dim)
+
+    def __contains__(self, dim):
+        return isinstance(dim, str) and has(dim)
+
+    def __iter__(self):
+        return iter(dimensions())
+
+    def __len__(self):
+        return len(dimensions())
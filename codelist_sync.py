@@ -0,0 +1,121 @@
+# Synchronise the codelists under codelists/ with the ABS structure endpoint.
+#
+#   python codelist_sync.py [--base-url URL] [FLOW ...]
+#
+# Fetches the data structure (and every codelist it references) of BA_SA2, BA_SA2_2016-21 and
+# BUILDING_ACTIVITY once, keeps each synced set as a version under the cache directory, and
+# regenerates codelists/*.json so extract_data maps new SA2/LGA codes without network calls.
+# Codes are only ever added or relabelled, never removed, because older vintages still use them.
+# Structure queries go to the same SDMX API origin as extract_data's data queries, so
+# ABS_API_BASE (see dhandler.route) points both at a stand-in such as mockabs.py; --base-url
+# replaces that origin for this run only.
+import argparse
+import hashlib
+import json
+import os
+import shutil
+from datetime import datetime, timezone
+
+import sdmx
+
+import codelist
+import httpcache
+from dhandler import API_ORIGIN, CONNECT_TIMEOUT, READ_TIMEOUT, get_session, route
+
+FLOWS = ["BUILDING_ACTIVITY", "BA_SA2_2016-21", "BA_SA2"]  # later flows win on conflicting labels
+STRUCTURE_XML = "application/vnd.sdmx.structure+xml;version=2.1"
+VERSIONS_DIR = "codelists"
+
+# Structure URL of a dataflow, on base_url if given, else on the origin dhandler.route sends API requests to
+def structure_url(flow, base_url=None):
+    url = f"{API_ORIGIN}/dataflow/ABS/{flow}/latest"
+    if base_url:
+        return base_url.rstrip("/") + url[len(API_ORIGIN):]
+    return route(url)
+
+def fetch_structure(flow, base_url=None):
+    url = structure_url(flow, base_url)
+    path = httpcache.fetch(
+        url,
+        params={"references": "all"},
+        headers={"Accept": STRUCTURE_XML},
+        session=get_session(),
+        timeout=(CONNECT_TIMEOUT, READ_TIMEOUT),
+    )
+    return sdmx.read_sdmx(path)
+
+# {dimension: {code: label}} and {dimension: 'CL_ID(version)'} for every enumerated dimension
+def read_codelists(message):
+    tables, sources = {}, {}
+    for dsd in message.structure.values():
+        for dim in dsd.dimensions:
+            representation = dim.local_representation
+            enumerated = representation.enumerated if representation is not None else None
+            if enumerated is None:
+                continue
+            # The DSD may only hold a reference; the codes themselves are in message.codelist
+            enumerated = message.codelist.get(enumerated.id, enumerated)
+            name = codelist.canonical(dim.id)
+            tables.setdefault(name, {}).update({code.id: str(code.name) for code in enumerated})
+            sources[name] = f"{enumerated.id}({enumerated.version})"
+    return tables, sources
+
+def _content_version(tables):
+    digest = hashlib.sha256(json.dumps(tables, sort_keys=True, ensure_ascii=False).encode()).hexdigest()
+    return digest[:12]
+
+def _write_table(path, table):
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(table, file, ensure_ascii=False, indent=0)
+        file.write("\n")
+
+def sync(flows=FLOWS, base_url=None):
+    base_url = base_url or route(API_ORIGIN + "/").rstrip("/")
+    merged, sources = {}, {}
+    for flow in flows:
+        print(f"Fetching structure of {flow}")
+        tables, flow_sources = read_codelists(fetch_structure(flow, base_url))
+        for name, table in tables.items():
+            merged.setdefault(name, {}).update(table)
+        sources[flow] = flow_sources
+
+    # Start from the current tables so codes ABS no longer lists keep their labels
+    added = 0
+    for name, table in merged.items():
+        current = dict(codelist.labels(name)) if codelist.has(name) else {}
+        added += len(set(table) - set(current))
+        current.update(table)
+        merged[name] = current
+
+    version = _content_version(merged)
+    if version == codelist.version():
+        print(f"Codelists already at version {version}")
+        return version
+
+    # Keep the synced set as a version in the cache, then regenerate the lookup tables
+    version_dir = os.path.join(httpcache.CACHE_DIR, VERSIONS_DIR, version)
+    os.makedirs(version_dir, exist_ok=True)
+    for name, table in merged.items():
+        _write_table(os.path.join(version_dir, name + ".json"), table)
+    manifest = {
+        "version": version,
+        "synced_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "base_url": base_url,
+        "sources": sources,
+    }
+    with open(os.path.join(version_dir, codelist.VERSION_FILE), "w") as file:
+        json.dump(manifest, file, indent=2)
+
+    for name in merged:
+        shutil.copyfile(os.path.join(version_dir, name + ".json"), os.path.join(codelist.CODELIST_DIR, name + ".json"))
+    shutil.copyfile(os.path.join(version_dir, codelist.VERSION_FILE), os.path.join(codelist.CODELIST_DIR, codelist.VERSION_FILE))
+    codelist.reload()
+    print(f"Codelists updated to version {version} ({added} new codes)")
+    return version
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Synchronise codelists/ with the ABS structure endpoint")
+    parser.add_argument("flows", nargs="*", default=FLOWS, help="dataflows to sync (default: %(default)s)")
+    parser.add_argument("--base-url", help=f"SDMX API origin to use instead of {API_ORIGIN} (default: ABS_API_BASE if set)")
+    args = parser.parse_args()
+    sync(args.flows, args.base_url)
@@ -0,0 +1,109 @@
+# Change-only publication of the builder outputs (the 'delta' output format, see output.py).
+# A fresh output is compared with the snapshot kept from the previous publication using
+# vectorised row fingerprints (pd.util.hash_pandas_object): one 64-bit hash of the key columns
+# (the dimension and period labels) and one of the value columns per row. Rows whose key is new
+# are inserts, keys that disappeared are deletes, and keys whose value hash changed are updates.
+# <name>_delta.csv lists them with the old and new values, so a downstream refresh can apply the
+# handful of revised periods instead of reloading the whole output.
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+import httpcache
+
+SNAPSHOT_DIR = "published"
+
+CHANGE = "change"
+OLD_SUFFIX = " (old)"
+NEW_SUFFIX = " (new)"
+
+def _snapshot_path(name):
+    return os.path.join(httpcache.CACHE_DIR, SNAPSHOT_DIR, f"{name}.pkl")
+
+def load_snapshot(name):
+    path = _snapshot_path(name)
+    if not os.path.exists(path):
+        return None
+    return pd.read_pickle(path)
+
+def save_snapshot(name, data):
+    path = _snapshot_path(name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    data.to_pickle(tmp_path)
+    os.replace(tmp_path, path)
+
+# Text and categorical columns identify a row; everything else (measures, derived dates) is a value
+def key_columns(data):
+    return [
+        col for col in data.columns
+        if isinstance(data[col].dtype, pd.CategoricalDtype)
+        or pd.api.types.is_string_dtype(data[col])
+        or pd.api.types.is_object_dtype(data[col])
+    ]
+
+# Numbers are hashed as float64 so a value keeps its fingerprint when its dtype changes (e.g. a
+# count published as float64 before schema.py made it Int32)
+def _fingerprint(data, columns):
+    if not columns:
+        return np.zeros(len(data), dtype=np.uint64)
+    frame = data[columns]
+    numeric = [col for col in columns if pd.api.types.is_numeric_dtype(frame[col]) and not pd.api.types.is_bool_dtype(frame[col])]
+    if numeric:
+        frame = frame.astype({col: "float64" for col in numeric})
+    return pd.util.hash_pandas_object(frame, index=False).to_numpy()
+
+# Rows inserted, updated and deleted going from old to new, one row per change with the key
+# columns, then '<value> (old)' and '<value> (new)' for every value column
+def diff(old, new, keys=None):
+    keys = keys or key_columns(new)
+    values = [col for col in new.columns if col not in keys]
+    new = new.reset_index(drop=True)
+    old = old.reset_index(drop=True) if old is not None else new.iloc[:0]
+
+    new_keys, old_keys = _fingerprint(new, keys), _fingerprint(old, keys)
+    old_index = pd.Index(old_keys)
+    if not old_index.is_unique or not pd.Index(new_keys).is_unique:
+        raise ValueError(f"Rows are not unique on the key columns {keys}")
+    positions = old_index.get_indexer(new_keys)
+    matched = positions >= 0
+
+    changed = np.zeros(len(new), dtype=bool)
+    changed[matched] = _fingerprint(new, values)[matched] != _fingerprint(old, values)[positions[matched]]
+    inserted = np.flatnonzero(~matched)
+    updated = np.flatnonzero(changed)
+    deleted = np.flatnonzero(~np.isin(old_keys, new_keys))
+
+    def block(change, rows_new, rows_old, key_source):
+        frame = key_source[keys].iloc[rows_new if key_source is new else rows_old].reset_index(drop=True)
+        for col in values:
+            frame[col + OLD_SUFFIX] = old[col].iloc[rows_old].to_numpy() if rows_old is not None else np.nan
+            frame[col + NEW_SUFFIX] = new[col].iloc[rows_new].to_numpy() if rows_new is not None else np.nan
+        frame.insert(0, CHANGE, change)
+        return frame
+
+    return pd.concat(
+        [
+            block("insert", inserted, None, new),
+            block("update", updated, positions[updated], new),
+            block("delete", None, deleted, old),
+        ],
+        ignore_index=True,
+    )
+
+# Write <name>_delta.csv against the previous snapshot, then make data the new snapshot.
+# Returns the delta path
+def publish_delta(data, name):
+    snapshot = load_snapshot(name)
+    if snapshot is not None and list(snapshot.columns) != list(data.columns):
+        print(f"{name}: columns changed since the last snapshot, publishing every row as inserted")
+        snapshot = None
+    delta = diff(snapshot, data)
+    path = f"{name}_delta.csv"
+    delta.to_csv(path, index=False)
+    save_snapshot(name, data)
+    counts = delta[CHANGE].value_counts()
+    print(f"{name}: {counts.get('insert', 0)} inserted, {counts.get('update', 0)} updated, {counts.get('delete', 0)} deleted")
+    return path
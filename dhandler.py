@@ -1,67 +1,461 @@
 import sdmx
+import numpy as np
 import pandas as pd
 from urllib.parse import urlparse
 from fmapping import field_index
-from requests.exceptions import HTTPError
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError as RequestsConnectionError, HTTPError, ReadTimeout
+from urllib3.exceptions import ReadTimeoutError
+from concurrent.futures import ThreadPoolExecutor
+from collections import namedtuple
+import json
+import os
+import threading
 import time
 from datetime import date
 from dateutil.relativedelta import relativedelta
+import shutil
+import httpcache
+import schema
+import sdmxcsv
+import statestore
+from instrument import stage
 
-# Define a function to extract data from the API
-def extract_data(api, retries=3, delay=5, timeout=120):
-    for attempt in range(retries):
+# Connection pool shared by every extract_data call, so repeated requests to the ABS API
+# (e.g. the paired vintages in build_app.py or the per building type loop in build_app_sa2.py)
+# reuse warm keep-alive connections instead of paying a new TCP+TLS handshake each time.
+# The defaults can be overridden through the environment or configure_pool()
+POOL_SIZE = int(os.environ.get("ABS_POOL_SIZE", 8))
+CONNECT_TIMEOUT = float(os.environ.get("ABS_CONNECT_TIMEOUT", 10))
+READ_TIMEOUT = float(os.environ.get("ABS_READ_TIMEOUT", 120))
+
+# Upper bound on requests in flight against any one host, shared by every thread (every
+# extract_data request, split sub-queries and work queue crawls included, and download_file go
+# through it)
+MAX_IN_FLIGHT_PER_HOST = int(os.environ.get("ABS_MAX_IN_FLIGHT_PER_HOST", 4))
+
+# Default decoding of extract_data responses, 'sdmx' (SDMX-ML) or 'csv' (streamed SDMX-CSV)
+INGEST_MODE = os.environ.get("ABS_INGEST_MODE", "sdmx")
+
+# Where requests are actually sent. ABS_API_BASE replaces the SDMX API origin the sdmx client
+# builds URLs for, ABS_WEB_BASE the www.abs.gov.au origin of the xlsx releases; the path and query
+# are kept. Leave them unset for ABS itself, or point them at a stand-in such as mockabs.py
+API_ORIGIN = "https://api.data.abs.gov.au"
+WEB_ORIGIN = "https://www.abs.gov.au"
+API_BASE = os.environ.get("ABS_API_BASE")
+WEB_BASE = os.environ.get("ABS_WEB_BASE")
+
+def route(url):
+    for origin, base in ((API_ORIGIN, API_BASE), (WEB_ORIGIN, WEB_BASE)):
+        if base and url.startswith(origin + "/"):
+            return base.rstrip("/") + url[len(origin):]
+    return url
+
+_session = None
+_session_lock = threading.Lock()
+_local = threading.local()
+_host_slots = {}
+
+def configure_pool(pool_size=None, connect_timeout=None, read_timeout=None, max_in_flight_per_host=None):
+    global POOL_SIZE, CONNECT_TIMEOUT, READ_TIMEOUT, MAX_IN_FLIGHT_PER_HOST, _session
+    with _session_lock:
+        if pool_size is not None:
+            POOL_SIZE = pool_size
+        if max_in_flight_per_host is not None:
+            MAX_IN_FLIGHT_PER_HOST = max_in_flight_per_host
+            _host_slots.clear()
+        if connect_timeout is not None:
+            CONNECT_TIMEOUT = connect_timeout
+        if read_timeout is not None:
+            READ_TIMEOUT = read_timeout
+        # Drop the current session so the next request builds one with the new settings
+        if _session is not None:
+            _session.close()
+            _session = None
+        _local.__dict__.clear()
+
+def get_session():
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = sdmx.session.Session(timeout=READ_TIMEOUT)
+            adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, pool_block=True)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+        return _session
+
+def _host_slot(url):
+    host = urlparse(url).netloc
+    with _session_lock:
+        if host not in _host_slots:
+            _host_slots[host] = threading.BoundedSemaphore(MAX_IN_FLIGHT_PER_HOST)
+        return _host_slots[host]
+
+def get_client():
+    # sdmx.Client keeps per-instance state (its message cache), so each thread gets its own
+    # client, but all of them send through the one pooled session
+    session = get_session()
+    client = getattr(_local, "client", None)
+    if client is None or client.session is not session:
+        client = sdmx.Client('ABS', session=session)
+        _local.client = client
+    return client
+
+# Learned safe sizes for splitting large queries, persisted per dataflow so later runs start at
+# the right granularity (see _fetch_adaptive). They live in a subdirectory of the cache so they
+# are never taken for an httpcache record. A size shrinks whenever a chunk is rejected as too
+# large and doubles again after CHUNK_GROW_AFTER chunked fetches in a row went through, so one
+# transient 504 does not pin a dataflow to small chunks (and many requests) for good
+CHUNK_SIZES_DIR = "adaptive"
+CHUNK_SIZES_FILE = "chunk_sizes.json"
+CHUNK_GROW_AFTER = int(os.environ.get("ABS_CHUNK_GROW_AFTER", 10))
+_chunk_sizes_lock = threading.Lock()
+
+def _chunk_sizes_path():
+    return os.path.join(httpcache.CACHE_DIR, CHUNK_SIZES_DIR, CHUNK_SIZES_FILE)
+
+# resource id -> {"size": codes per chunk, "successes": chunked fetches since it last changed}
+def _load_chunk_sizes():
+    try:
+        with open(_chunk_sizes_path()) as file:
+            sizes = json.load(file)
+    except (OSError, ValueError):
+        return {}
+    return {rid: entry if isinstance(entry, dict) else {"size": entry, "successes": 0} for rid, entry in sizes.items()}
+
+def _save_chunk_sizes(sizes):
+    os.makedirs(os.path.dirname(_chunk_sizes_path()), exist_ok=True)
+    tmp_path = f"{_chunk_sizes_path()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w") as file:
+        json.dump(sizes, file, indent=2)
+    os.replace(tmp_path, _chunk_sizes_path())
+
+def get_chunk_size(resource_id):
+    with _chunk_sizes_lock:
+        entry = _load_chunk_sizes().get(resource_id)
+        return None if entry is None else entry["size"]
+
+def remember_chunk_size(resource_id, size):
+    with _chunk_sizes_lock:
+        sizes = _load_chunk_sizes()
+        if resource_id in sizes and sizes[resource_id]["size"] <= size:
+            return
+        sizes[resource_id] = {"size": size, "successes": 0}
+        _save_chunk_sizes(sizes)
+
+# A fetch split at the learned size went through; after CHUNK_GROW_AFTER of them, try chunks twice as large
+def chunk_fetched(resource_id, size):
+    with _chunk_sizes_lock:
+        sizes = _load_chunk_sizes()
+        entry = sizes.get(resource_id)
+        if entry is None or entry["size"] != size:
+            return
+        entry["successes"] += 1
+        if entry["successes"] >= CHUNK_GROW_AFTER:
+            sizes[resource_id] = {"size": size * 2, "successes": 0}
+        _save_chunk_sizes(sizes)
+
+# Split an SDMX key such as '...TOT+150+130.AUS+STE..M' on the '+'-joined dimension with the
+# most codes, into sub-keys holding at most chunk_size codes of that dimension each
+def split_key(key, chunk_size):
+    dims = key.split('.')
+    codes = [dim.split('+') for dim in dims]
+    widest = max(range(len(dims)), key=lambda i: len(codes[i]))
+    if len(codes[widest]) <= max(chunk_size, 1):
+        return [key]
+    keys = []
+    for i in range(0, len(codes[widest]), chunk_size):
+        parts = list(dims)
+        parts[widest] = '+'.join(codes[widest][i:i + chunk_size])
+        keys.append('.'.join(parts))
+    return keys
+
+def _widest_dimension(key):
+    return max(len(dim.split('+')) for dim in key.split('.'))
+
+# ABS answers a query that matches no observations (e.g. no new periods since startPeriod) with a
+# 404 NoRecordsFound
+def _no_records(error):
+    return isinstance(error, HTTPError) and error.response is not None and error.response.status_code == 404
+
+# ABS answers queries whose result is too large with a 504 or by not answering in time, either
+# before the headers (ReadTimeout) or while the body streams, which requests raises as a
+# ConnectionError wrapping urllib3's ReadTimeoutError
+def _is_oversized(error):
+    if isinstance(error, ReadTimeout):
+        return True
+    if isinstance(error, RequestsConnectionError) and error.args and isinstance(error.args[0], ReadTimeoutError):
+        return True
+    return isinstance(error, HTTPError) and error.response is not None and error.response.status_code == 504
+
+# Cap the read timeout so a request never outlives its deadline (a monotonic clock time)
+def _remaining(timeout, expires):
+    if expires is None:
+        return timeout
+    remaining = expires - time.monotonic()
+    if remaining <= 0:
+        raise TimeoutError("Request deadline exceeded")
+    connect_timeout, read_timeout = timeout
+    return (min(connect_timeout, remaining), min(read_timeout, remaining))
+
+# Categorical dtype holding every label of a field_index dimension. Categories are sorted so that
+# sorting a label column still orders it alphabetically, as it did with plain strings
+_label_dtypes = {}
+
+def label_dtype(dim):
+    labels = field_index[dim]
+    # Rebuild when the codelist was reloaded, e.g. by codelist_sync.py
+    if dim not in _label_dtypes or _label_dtypes[dim][0] is not labels:
+        _label_dtypes[dim] = (labels, pd.CategoricalDtype(sorted(set(labels.values()))))
+    return _label_dtypes[dim][1]
+
+# Map a column of codes to a Categorical of labels. Only the distinct codes are looked up, so the
+# long labels are stored once per category rather than once per row
+def map_codes(values, dim):
+    dtype = label_dtype(dim)
+    codes = pd.Categorical(values)
+    positions = dtype.categories.get_indexer(codes.categories.map(field_index[dim]))
+    unknown = codes.categories[positions < 0]
+    if len(unknown):
+        print(f"Unknown {dim} codes {list(unknown[:10])} map to NaN, run codelist_sync.py to update the codelists")
+    return pd.Categorical.from_codes(np.where(codes.codes >= 0, positions[codes.codes], -1), dtype=dtype)
+
+# Settings of one extract_data call, shared by every sub-query it splits into
+_Job = namedtuple("_Job", "api resource_id retries delay timeout expires ingest layout params")
+
+# Fetch one key in one request and turn it into the labelled frame the builders expect
+def _fetch_frame(job, key):
+    # Reuse the pooled ABS SDMX client for this thread
+    client = get_client()
+
+    # Let the client build the request, then send it through the on-disk cache so an
+    # unchanged dataset only costs a conditional GET
+    request = client.data(
+    resource_id=job.resource_id, 
+    key=key, 
+    params={
+        'dimensionAtObservation': 'AllDimensions',
+        **job.params,
+        },
+    dry_run=True,
+    )
+    url = route(request.url)
+    headers = dict(request.headers)
+    if job.ingest == "csv":
+        headers["Accept"] = sdmxcsv.SDMX_CSV
+    with stage("fetch") as record, _host_slot(url):
+        path = httpcache.fetch(url, headers=headers, session=client.session, timeout=_remaining(job.timeout, job.expires))
+        record.bytes = os.path.getsize(path)
+
+    with stage("decode") as record:
         try:
-            # Create an ABS SDMX client with custom timeout
-            client = sdmx.Client('ABS')
-            client.session.request = client.session.request.__func__.__get__(client.session, type(client.session))
-            client.session.timeout = timeout  # Set the timeout for the session
-
-            # Parse the URL to extract parts
-            parsed_url = urlparse(api)
-            
-            # Extract the path segments (split by '/')
-            path_segments = parsed_url.path.split('/')
-
-            # Automatically detect the resource_id and key
-            resource_id = path_segments[3].split(',')[1] # Extract 'BA_SA2_2016-21' from the second segment
-            key = path_segments[4] # Extract the '1.9.1.110..1+2+3+4+5+6+7+8+AUS.M' part
-
-            # Use client.data to fetch the dataset
-            data_response = client.data(
-            resource_id=resource_id, 
-            key=key, 
-            params={
-                'dimensionAtObservation': 'AllDimensions'
-                }
-            )
+            if job.ingest == "csv":
+                # Stream the SDMX-CSV body straight into columnar buffers
+                data = sdmxcsv.read_sdmx_csv(path)
+            else:
+                data_response = sdmx.read_sdmx(path)
+        except Exception:
+            # Never keep a body we cannot parse (e.g. an ABS html error page)
+            httpcache.invalidate(url, headers=headers)
+            raise
 
+        if job.ingest == "csv":
+            # Already long; lay it out like to_pandas does unless long-form was asked for
+            data = sdmxcsv.to_long(data) if job.layout == "long" else sdmxcsv.long_to_wide(data)
+        elif job.layout == "long":
+            # One row per observation, exactly as ABS sends it with dimensionAtObservation=AllDimensions
+            data = sdmxcsv.to_long(sdmx.to_pandas(data_response).reset_index(name=sdmxcsv.OBS_VALUE))
+        else:
             # Convert the data to a pandas DataFrame
             data = sdmx.to_pandas(data_response,
                             datetime=dict(dim="TIME_PERIOD", freq="FREQ", axis=1),
                             )
-            
+
             # Reset Index to Turn It Into Columns
             data = data.reset_index()
+        record.rows = len(data)
+
+    # Apply the mapping to each column based on the field_index, as categorical label columns
+    with stage("map") as record:
+        for col in data.columns:
+            if col in field_index:
+                data[col] = map_codes(data[col], col)
+        record.rows = len(data)
+    
+    # Make sure all columns are strings as time series columns might be integers
+    data.columns = data.columns.astype(str)
+
+    # Long frames get the dataflow's dtype policy, periods as int32 ordinals (see schema.py)
+    if job.layout == "long":
+        data = schema.enforce(data, job.resource_id)
 
-            # Apply the mapping to each column based on the field_index
-            for col in data.columns:
-                if col in field_index:
-                    data[col] = data[col].map(field_index[col])
-            
-            # Make sure all columns are strings as time series columns might be integers
-            data.columns = data.columns.astype(str)
+    return data
 
+# Fetch several sub-keys concurrently and concatenate them back into one frame, in key order
+def _fetch_keys(job, keys):
+    with ThreadPoolExecutor(max_workers=min(len(keys), POOL_SIZE)) as executor:
+        futures = [executor.submit(_fetch_adaptive, job, key) for key in keys]
+        frames = [future.result() for future in futures]
+    return pd.concat(frames, ignore_index=True, sort=False)
+
+# Fetch a key, bisecting its widest dimension whenever ABS rejects the result as too large.
+# Other errors are retried as before; the last one is raised once retries run out
+def _fetch_adaptive(job, key):
+    chunk_size = get_chunk_size(job.resource_id)
+    if chunk_size is not None:
+        keys = split_key(key, chunk_size)
+        if len(keys) > 1:
+            data = _fetch_keys(job, keys)
+            chunk_fetched(job.resource_id, chunk_size)
             return data
-        
+
+    for attempt in range(job.retries):
+        try:
+            return _fetch_frame(job, key)
         except (HTTPError, Exception) as e:
-            print(f"Error processing API {api}: {e}")
-            if attempt < retries - 1:
-                print(f"Retrying in {delay} seconds...")
-                time.sleep(delay)
+            width = _widest_dimension(key)
+            if _is_oversized(e) and width > 1:
+                half = (width + 1) // 2
+                print(f"Query too large for {job.resource_id} ({e}), splitting into chunks of {half} codes")
+                remember_chunk_size(job.resource_id, half)
+                return _fetch_keys(job, split_key(key, half))
+            print(f"Error processing API {job.api}: {e}")
+            if _no_records(e):
+                raise
+            if attempt < job.retries - 1 and (job.expires is None or time.monotonic() + job.delay < job.expires):
+                print(f"Retrying in {job.delay} seconds...")
+                time.sleep(job.delay)
             else:
-                print("Max retries reached. Skipping this request.")
-                return None
-            
+                raise
+
+# Define a function to extract data from the API
+# deadline, if given, is the number of seconds the whole extraction (retries and split
+# sub-queries included) may take before it gives up. ingest picks how the response is decoded:
+# 'sdmx' parses SDMX-ML through the sdmx message objects, 'csv' asks ABS for SDMX-CSV and streams
+# it in chunks (much lower peak memory for SA2-level pulls); both return the same frame.
+# layout='wide' returns one row per series with a column per period (the default, as before);
+# layout='long' returns one row per observation with TIME_PERIOD and OBS_VALUE columns, which
+# panel.Panel.from_long (or transform.to_measure_columns) reshapes without a wide round trip.
+# With incremental=True only the latest periods are requested and merged into the history kept
+# by statestore; full_refresh=True refetches everything and resets that history
+def extract_data(api, retries=3, delay=5, timeout=None, deadline=None, ingest=None, layout="wide", incremental=False, full_refresh=False):
+    # Timeout is a (connect, read) pair, defaulting to the pool settings
+    if timeout is None:
+        timeout = (CONNECT_TIMEOUT, READ_TIMEOUT)
+    expires = None if deadline is None else time.monotonic() + deadline
+
+    # Parse the URL to extract parts
+    parsed_url = urlparse(api)
+    
+    # Extract the path segments (split by '/')
+    path_segments = parsed_url.path.split('/')
+
+    # Automatically detect the resource_id and key
+    resource_id = path_segments[3].split(',')[1] # Extract 'BA_SA2_2016-21' from the second segment
+    key = path_segments[4] # Extract the '1.9.1.110..1+2+3+4+5+6+7+8+AUS.M' part
+
+    job = _Job(api, resource_id, retries, delay, timeout, expires, ingest or INGEST_MODE, layout, {})
+    if incremental:
+        return _extract_incremental(job, key, full_refresh)
+    try:
+        return _fetch_adaptive(job, key)
+    except Exception:
+        print("Max retries reached. Skipping this request.")
+        return None
+
+# Number of periods before the watermark that are requested again on an incremental run, so
+# that ABS revisions to the latest months/quarters are picked up. Revisions to anything older are
+# never seen by a routine run; only a full refresh (--full-refresh) picks them up
+REVISION_PERIODS = int(os.environ.get("ABS_REVISION_PERIODS", 3))
+
+def _period_columns(data):
+    return [col for col in data.columns if col not in field_index]
+
+# The watermark is kept as a period label; long frames of a dataflow with a schema hold ordinals
+def _last_period(data, layout, freq=None):
+    if layout == "long":
+        periods = data.loc[data[sdmxcsv.OBS_VALUE].notna(), sdmxcsv.TIME_PERIOD]
+        if not len(periods):
+            return None
+        if pd.api.types.is_integer_dtype(periods):
+            return schema.period_labels([periods.max()], freq)[0]
+        return periods.max()
+    periods = [col for col in _period_columns(data) if data[col].notna().any()]
+    return max(periods) if periods else None
+
+# SDMX startPeriod for the first period to refetch ('2021-07' monthly, '2021-Q3' quarterly)
+def _start_period(last_period, periods_back):
+    period = pd.Period(last_period) - periods_back
+    if period.freqstr.startswith("Q"):
+        return f"{period.year}-Q{period.quarter}"
+    return period.strftime("%Y-%m")
+
+# Replace the periods covered by a fresh slice in the stored history, keeping everything older
+def _merge_slice(history, data, layout, start):
+    if layout == "long":
+        start = start.replace("-Q", "Q")
+        if pd.api.types.is_integer_dtype(history[sdmxcsv.TIME_PERIOD]):
+            start = pd.Period(start).ordinal
+        history = history[history[sdmxcsv.TIME_PERIOD] < start]
+        return pd.concat([history, data], ignore_index=True)
+    dims = [col for col in history.columns if col in field_index]
+    refreshed = _period_columns(data)
+    merged = history.drop(columns=[col for col in refreshed if col in history.columns]).set_index(dims)
+    merged = merged.join(data.set_index(dims), how="outer")
+    merged = merged[sorted(merged.columns)]
+    return merged.reset_index()
+
+# Fetch only the periods from the watermark (less a revision window) onwards and merge them into
+# the history stored by the previous run. A full refresh, e.g. after a rebase such as the
+# 2016 -> 2021 SA2 change, drops the stored history and fetches the whole series again.
+# A slice with no observations (nothing released since the watermark) leaves the history as it
+# is, and so does a failed slice: the stored history is returned rather than nothing
+def _extract_incremental(job, key, full_refresh):
+    watermark = None if full_refresh else statestore.get_watermark(job.resource_id, key)
+    history = None if watermark is None else statestore.load_history(job.resource_id, key, job.layout)
+
+    start = None
+    if history is not None:
+        start = _start_period(watermark[0], REVISION_PERIODS)
+        print(f"Fetching {job.resource_id} {key} from {start}")
+        job = job._replace(params={'startPeriod': start})
+    try:
+        data = _fetch_adaptive(job, key)
+    except Exception as e:
+        if history is None:
+            print("Max retries reached. Skipping this request.")
+            return None
+        if _no_records(e):
+            print(f"No new observations for {job.resource_id} {key} from {start}")
+        else:
+            print(f"Warning: fetching {job.resource_id} {key} from {start} failed ({e}), using the stored history up to {watermark[0]}")
+        return history
+
+    if history is not None and not len(data):
+        print(f"No new observations for {job.resource_id} {key} from {start}")
+        return history
+    if history is not None:
+        data = _merge_slice(history, data, job.layout, start)
+    statestore.save_history(job.resource_id, key, data, job.layout)
+    last_period = _last_period(data, job.layout, schema.freq(job.resource_id))
+    if last_period is not None:
+        statestore.set_watermark(job.resource_id, key, last_period)
+    return data
+
+# Download a file (e.g. an ABS xlsx release) through the on-disk cache
+def download_file(url, filename):
+    url = route(url)
+    try:
+        with stage("fetch") as record, _host_slot(url):
+            path = httpcache.fetch(url, session=get_session(), timeout=(CONNECT_TIMEOUT, READ_TIMEOUT))
+            record.bytes = os.path.getsize(path)
+    except HTTPError as e:
+        print("Failed to download the file:", e.response.status_code)
+        return
+    shutil.copyfile(path, filename)
+    print("File downloaded successfully!")
+
 # To extract data from work not commenced and dwellings not commenced, as it releases quarterly, we need to get the end of the two prior quarter
 def get_end_of_two_quarters_ago():
     today = date.today()
@@ -0,0 +1,136 @@
+# Local fact store the builders upsert their output into (the 'factstore' output format, see
+# output.py). Every value is one row of a SQLite table keyed by dataset, region, region type, work
+# type, sector, building type, period and measure, so a rerun only writes the values that actually
+# changed, the old value of every change is kept in fact_history, and consumers can query a
+# state/period slice through the indexes instead of parsing a whole CSV.
+import os
+import sqlite3
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+FACTSTORE_DB = os.environ.get("BUILD_FACTSTORE", "facts.db")
+
+DIMENSIONS = ["region", "region_type", "work_type", "sector", "building_type"]
+
+# Builder output columns each dimension is read from (first match wins); a dimension the dataset
+# does not have (e.g. region type in build_act) is stored as ''
+DIMENSION_COLUMNS = {
+    "region": ["State", "Region"],
+    "region_type": ["Region Type"],
+    "work_type": ["Building Work Type"],
+    "sector": ["Sector"],
+    "building_type": ["Building Type"],
+}
+
+KEY = ["dataset"] + DIMENSIONS + ["period", "measure"]
+
+INDEXES = {
+    "facts_dataset_period": "facts (dataset, period)",
+    "facts_dataset_region_period": "facts (dataset, region, period)",
+    "facts_dataset_building_type": "facts (dataset, building_type, period)",
+}
+
+def connect(path=None):
+    connection = sqlite3.connect(path or FACTSTORE_DB, timeout=30)
+    connection.execute("PRAGMA journal_mode = WAL")
+    connection.execute("PRAGMA synchronous = NORMAL")
+    connection.execute(
+        f"""CREATE TABLE IF NOT EXISTS facts (
+            {", ".join(f"{col} TEXT NOT NULL" for col in KEY)},
+            value REAL,
+            updated_at TEXT NOT NULL,
+            PRIMARY KEY ({", ".join(KEY)})
+        ) WITHOUT ROWID"""
+    )
+    connection.execute(
+        f"""CREATE TABLE IF NOT EXISTS fact_history (
+            {", ".join(f"{col} TEXT NOT NULL" for col in KEY)},
+            old_value REAL,
+            new_value REAL,
+            changed_at TEXT NOT NULL
+        )"""
+    )
+    # Keep the value every update replaces
+    connection.execute(
+        f"""CREATE TRIGGER IF NOT EXISTS facts_history AFTER UPDATE OF value ON facts
+        BEGIN
+            INSERT INTO fact_history VALUES ({", ".join(f"old.{col}" for col in KEY)}, old.value, new.value, new.updated_at);
+        END"""
+    )
+    _create_indexes(connection)
+    return connection
+
+def _create_indexes(connection):
+    for name, columns in INDEXES.items():
+        connection.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {columns}")
+
+def _drop_indexes(connection):
+    for name in INDEXES:
+        connection.execute(f"DROP INDEX IF EXISTS {name}")
+
+# Long (key..., value) rows from a builder output frame: every numeric column is a measure, the
+# dimension columns are found through DIMENSION_COLUMNS and missing values are left out
+def to_facts(data, dataset, period):
+    measures = [col for col in data.columns if pd.api.types.is_numeric_dtype(data[col]) and col != period]
+    values = data[measures].to_numpy(dtype="float64", na_value=np.nan)
+    rows, cols = np.nonzero(~np.isnan(values))
+
+    facts = {"dataset": np.full(len(rows), dataset, dtype=object)}
+    for dim in DIMENSIONS:
+        source = next((col for col in DIMENSION_COLUMNS[dim] if col in data.columns), None)
+        column = data[source].astype(str).to_numpy(dtype=object) if source else np.full(len(data), "", dtype=object)
+        facts[dim] = column[rows]
+    facts["period"] = data[period].astype(str).to_numpy(dtype=object)[rows]
+    facts["measure"] = np.array(measures, dtype=object)[cols]
+    facts["value"] = values[rows, cols]
+    return pd.DataFrame(facts)
+
+# First load of a dataset: replace its rows in one transaction with the secondary indexes
+# dropped and rebuilt once afterwards
+def bulk_load(connection, facts, updated_at):
+    datasets = facts["dataset"].unique().tolist()
+    with connection:
+        _drop_indexes(connection)
+        connection.executemany("DELETE FROM facts WHERE dataset = ?", [(dataset,) for dataset in datasets])
+        connection.executemany(
+            f"INSERT INTO facts VALUES ({', '.join('?' * (len(KEY) + 2))})",
+            ((*row, updated_at) for row in facts[KEY + ["value"]].itertuples(index=False, name=None)),
+        )
+        _create_indexes(connection)
+    return len(facts)
+
+# Stage the rows in a temporary table and upsert them, touching only rows whose value changed.
+# Returns the number of rows inserted or updated
+def upsert(connection, facts, updated_at):
+    with connection:
+        connection.execute(f"CREATE TEMP TABLE IF NOT EXISTS staging ({', '.join(KEY)}, value REAL)")
+        connection.execute("DELETE FROM staging")
+        connection.executemany(
+            f"INSERT INTO staging VALUES ({', '.join('?' * (len(KEY) + 1))})",
+            facts[KEY + ["value"]].itertuples(index=False, name=None),
+        )
+        # rowcount leaves out the fact_history rows the trigger inserts
+        changed = connection.execute(
+            f"""INSERT INTO facts SELECT {", ".join(KEY)}, value, ? FROM staging WHERE true
+            ON CONFLICT ({", ".join(KEY)}) DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at
+            WHERE facts.value IS NOT excluded.value""",
+            (updated_at,),
+        ).rowcount
+        connection.execute("DELETE FROM staging")
+    return changed
+
+# Write a builder output frame into the fact store; the bulk path is used when the dataset has no
+# rows yet. Returns the number of rows written
+def write_facts(data, dataset, period, path=None):
+    facts = to_facts(data, dataset, period)
+    updated_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    connection = connect(path)
+    try:
+        loaded = connection.execute("SELECT 1 FROM facts WHERE dataset = ? LIMIT 1", (dataset,)).fetchone()
+        if loaded is None:
+            return bulk_load(connection, facts, updated_at)
+        return upsert(connection, facts, updated_at)
+    finally:
+        connection.close()
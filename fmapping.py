@@ -1,3424 +1,7 @@
-field_index = {
-    "MEASURE": {
-        "1": "Number of dwelling units",
-        "2": "Value of building jobs",
-        "3": "Number of building jobs valued $50,000 or more",
-        "M1": "Value of work done during quarter",
-        "M2": "Value of work yet to be done",
-        "M3": "Value of work commenced",
-        "M4": "Value of work completed",
-        "M5": "Value of work under construction",
-        "M6": "Number of dwelling units commenced",
-        "M7": "Number of dwelling units completed",
-        "M8": "Number of dwelling units under construction",
-    },
-    "SECTOR": {"9": "Total Sector", "1": "Private Sector", "5": "Public Sector"},
-    "SECTOR_OWN": {"9": "Total Sector", "1": "Private Sector", "5": "Public Sector"},
-    "WORK_TYPE": {
-        "TOT": "Total Work",
-        "1": "New",
-        "2": "Alterations and Additions",
-        "7": "Conversions",
-        "8": "Alterations and Additions including conversions",
-    },
-    "BLD_WORK_TYPE": {
-        "TOT": "Total Work",
-        "1": "New",
-        "2": "Alterations and Additions",
-        "7": "Conversions",
-        "8": "Alterations and Additions including conversions",
-    },
-    "BUILDING_TYPE": {
-        "TOT": "All Buildings",
-        "110": "Houses",
-        "120": "Semi-detached, row or terrace houses, townhouses - Total",
-        "121": "Semi-detached, row or terrace houses, townhouses - One storey",
-        "122": "Semi-detached, row or terrace houses, townhouses - Two or more storeys",
-        "130": "Apartments - Total including those attached to a house",
-        "131": "Apartments - In a one or two storey block",
-        "132": "Apartments - In a three storey block",
-        "133": "Apartments - In a four to eight storey block",
-        "134": "Apartments - In a nine or more storey block",
-        "100": "Total Residential",
-        "150": "Total Other Residential",
-        "210": "Retail and wholesale trade buildings",
+# field_index maps each ABS dimension ID to its {code: label} codelist. The codelists live in
+# codelists/*.json and are loaded lazily by codelist.FieldIndex, so importing this module no
+# longer builds the full SA2/LGA REGION table up front; use codelist.label/codelist.code for
+# single lookups in either direction
+from codelist import FieldIndex
 
-
-'220': 'Transport buildings',
-'230': 'Offices',
-'290': 'Commercial buildings n.e.c.',
-'200': 'Commercial Buildings - Total',
-'310': 'Factories and other secondary production buildings',
-'320': 'Warehouses',
-'330': 'Agricultural and aquacultural buildings',
-'390': 'Other industrial buildings n.e.c.',
-'300': 'Industrial Buildings - Total',
-'410': 'Education buildings',
-        '420':  'Religion buildings',
-'430':'Aged care facilities',
-'440':'Health buildings',
-        '450':'Entertainment and recreation buildings',
-'469':'Short term accommodation buildings',
-
-        '490': 'Other non-residential n.e.c.',
-        '400': 'Other Non-residential - Total',
-        "700": "Total Non-Residential",
-        '800': 'Dwellings excluding new residential',
-        "850": "Dwelling excluding houses"
-    },
-    "TYPE_BLDG": {
-        "TOT": "All Buildings",
-        "110": "Houses",
-        "120": "Semi-detached, row or terrace houses, townhouses - Total",
-        "121": "Semi-detached, row or terrace houses, townhouses - One storey",
-        "122": "Semi-detached, row or terrace houses, townhouses - Two or more storeys",
-        "130": "Apartments - Total including those attached to a house",
-        "131": "Apartments - In a one or two storey block",
-        "132": "Apartments - In a three storey block",
-        "133": "Apartments - In a four to eight storey block",
-        "134": "Apartments - In a nine or more storey block",
-        "100": "Total Residential",
-        "150": "Total Other Residential",
-        "210": "Retail and wholesale trade buildings",
-
-
-'220': 'Transport buildings',
-'230': 'Offices',
-'290': 'Commercial buildings n.e.c.',
-'200': 'Commercial Buildings - Total',
-'310': 'Factories and other secondary production buildings',
-'320': 'Warehouses',
-'330': 'Agricultural and aquacultural buildings',
-'390': 'Other industrial buildings n.e.c.',
-'300': 'Industrial Buildings - Total',
-'410': 'Education buildings',
-        '420':  'Religion buildings',
-'430':'Aged care facilities',
-'440':'Health buildings',
-        '450':'Entertainment and recreation buildings',
-'469':'Short term accommodation buildings',
-
-        '490': 'Other non-residential n.e.c.',
-        '400': 'Other Non-residential - Total',
-        "700": "Total Non-Residential",
-        '800': 'Dwellings excluding new residential',
-        "850": "Dwelling excluding houses"
-    },
-    "REGION_TYPE": {
-        "AUS": "Australia",
-        "STE": "States and Territories",
-        "SA2": "Statistical Areas Level 2",
-        "SA3": "Statistical Areas Level 3",
-        "SA4": "Statistical Areas Level 4",
-        "LGA2018": "Local Government Areas",
-        "LGA2019": "Local Government Areas",
-        "LGA2020": "Local Government Areas",
-        "LGA2021": "Local Government Areas",
-        "LGA2022": "Local Government Areas",
-        "LGA2023": "Local Government Areas",
-        "LGA2024": "Local Government Areas",
-    },
-    "REGION": {
-        "AUS": "Australia",
-        "0": "Australia",
-        "1": "New South Wales",
-        "2": "Victoria",
-        "3": "Queensland",
-        "4": "South Australia",
-        "5": "Western Australia",
-        "6": "Tasmania",
-        "7": "Northern Territory",
-        "8": "Australian Capital Territory",
-        "9": "Other Territories",
-        "10050": "Albury",
-        "10180": "Armidale",
-        "10130": "Armidale",  # 2018 outdated code
-        "10250": "Ballina",
-        "10300": "Balranald",
-        "10470": "Bathurst",
-        "10500": "Bayside (NSW)",
-        "10550": "Bega Valley",
-        "10600": "Bellingen",
-        "10650": "Berrigan",
-        "10750": "Blacktown",
-        "10800": "Bland",
-        "10850": "Blayney",
-        "10900": "Blue Mountains",
-        "10950": "Bogan",
-        "11150": "Bourke",
-        "11200": "Brewarrina",
-        "11250": "Broken Hill",
-        "11300": "Burwood",
-        "11350": "Byron",
-        "11400": "Cabonne",
-        "11450": "Camden",
-        "11500": "Campbelltown (NSW)",
-        "11520": "Canada Bay",
-        "11570": "Canterbury-Bankstown",
-        "11600": "Carrathool",
-        "11650": "Central Coast (NSW)",
-        "11700": "Central Darling",
-        "11720": "Cessnock",
-        "11730": "Clarence Valley",
-        "11750": "Cobar",
-        "11800": "Coffs Harbour",
-        "12000": "Coolamon",
-        "12150": "Coonamble",
-        "12160": "Cootamundra-Gundagai",
-        "12350": "Cowra",
-        "12380": "Cumberland",
-        "12390": "Dubbo",
-        "12700": "Dungog",
-        "12730": "Edward River",
-        "12750": "Eurobodalla",
-        "12850": "Fairfield",
-        "12870": "Federation",
-        "12900": "Forbes",
-        "12930": "Georges River",
-        "12950": "Gilgandra",
-        "13010": "Glen Innes Severn",
-        "13310": "Goulburn Mulwaree",
-        "13340": "Greater Hume",
-        "13450": "Griffith",
-        "13550": "Gunnedah",
-        "13660": "Gwydir",
-        "13800": "Hawkesbury",
-        "13850": "Hay",
-        "13910": "Hilltops",
-        "14000": "Hornsby",
-        "14100": "Hunters Hill",
-        "14170": "Inner West",
-        "14220": "Inverell",
-        "14200": "Inverell",  # 2018 outdated code
-        "14300": "Junee",
-        "14350": "Kempsey",
-        "14400": "Kiama",
-        "14500": "Ku-ring-gai",
-        "14550": "Kyogle",
-        "14600": "Lachlan",
-        "14650": "Lake Macquarie",
-        "14700": "Lane Cove",
-        "14750": "Leeton",
-        "14850": "Lismore",
-        "14870": "Lithgow",
-        "14900": "Liverpool",
-        "14920": "Liverpool Plains",
-        "14950": "Lockhart",
-        "15050": "Maitland",
-        "15240": "Mid-Coast",
-        "15270": "Mid-Western",
-        "15300": "Moree Plains",
-        "15350": "Mosman",
-        "15520": "Murray River",
-        "15560": "Murrumbidgee",
-        "15650": "Muswellbrook",
-        "15700": "Nambucca Valley",
-        "15750": "Narrabri",
-        "15800": "Narrandera",
-        "15850": "Narromine",
-        "15900": "Newcastle",
-        "15950": "North Sydney",
-        "15990": "Northern Beaches",
-        "16100": "Oberon",
-        "16150": "Orange",
-        "16200": "Parkes",
-        "16260": "Parramatta",
-        "16350": "Penrith",
-        "16380": "Port Macquarie-Hastings",
-        "16400": "Port Stephens",
-        "16490": "Queanbeyan-Palerang",
-        "16550": "Randwick",
-        "16610": "Richmond Valley",
-        "16700": "Ryde",
-        "16900": "Shellharbour",
-        "16950": "Shoalhaven",
-        "17000": "Singleton",
-        "17040": "Snowy Monaro",
-        "17080": "Snowy Valleys",
-        "17100": "Strathfield",
-        "17150": "Sutherland",
-        "17200": "Sydney",
-        "17310": "Tamworth",
-        "17350": "Temora",
-        "17400": "Tenterfield",
-        "17420": "The Hills",
-        "17550": "Tweed",
-        "17620": "Upper Hunter",
-        "17640": "Upper Lachlan",
-        "17650": "Uralla",
-        "17750": "Wagga Wagga",
-        "17850": "Walcha",
-        "17900": "Walgett",
-        "17950": "Warren",
-        "18020": "Warrumbungle",
-        "18050": "Waverley",
-        "18100": "Weddin",
-        "18200": "Wentworth",
-        "18250": "Willoughby",
-        "18350": "Wingecarribee",
-        "18400": "Wollondilly",
-        "18450": "Wollongong",
-        "18500": "Woollahra",
-        "18710": "Yass Valley",
-        "19399": "Unincorporated NSW",
-        "19499": "No usual address (NSW)",
-        "19799": "Migratory - Offshore - Shipping (NSW)",
-        "20110": "Alpine",
-        "20260": "Ararat",
-        "20570": "Ballarat",
-        "20660": "Banyule",
-        "20740": "Bass Coast",
-        "20830": "Baw Baw",
-        "20910": "Bayside (Vic.)",
-        "21010": "Benalla",
-        "21110": "Boroondara",
-        "21180": "Brimbank",
-        "21270": "Buloke",
-        "21370": "Campaspe",
-        "21450": "Cardinia",
-        "21610": "Casey",
-        "21670": "Central Goldfields",
-        "21750": "Colac Otway",
-        "21830": "Corangamite",
-        "21890": "Darebin",
-        "22110": "East Gippsland",
-        "22170": "Frankston",
-        "22250": "Gannawarra",
-        "22310": "Glen Eira",
-        "22410": "Glenelg",
-        "22490": "Golden Plains",
-        "22620": "Greater Bendigo",
-        "22670": "Greater Dandenong",
-        "22750": "Greater Geelong",
-        "22830": "Greater Shepparton",
-        "22910": "Hepburn",
-        "22980": "Hindmarsh",
-        "23110": "Hobsons Bay",
-        "23190": "Horsham",
-        "23270": "Hume",
-        "23350": "Indigo",
-        "23430": "Kingston (Vic.)",
-        "23670": "Knox",
-        "23810": "Latrobe (Vic.)",
-        "23940": "Loddon",
-        "24130": "Macedon Ranges",
-        "24210": "Manningham",
-        "24250": "Mansfield",
-        "24330": "Maribyrnong",
-        "24410": "Maroondah",
-        "24600": "Melbourne",
-        "24650": "Melton",
-        "24700": "Merri-bek",
-        "24780": "Mildura",
-        "24850": "Mitchell",
-        "24900": "Moira",
-        "24970": "Monash",
-        "25060": "Moonee Valley",
-        "25150": "Moorabool",
-        "25250": "Moreland",  # 2018 outdated code
-        "25340": "Mornington Peninsula",
-        "25430": "Mount Alexander",
-        "25490": "Moyne",
-        "25620": "Murrindindi",
-        "25710": "Nillumbik",
-        "25810": "Northern Grampians",
-        "25900": "Port Phillip",
-        "25990": "Pyrenees",
-        "26080": "Queenscliffe",
-        "26170": "South Gippsland",
-        "26260": "Southern Grampians",
-        "26350": "Stonnington",
-        "26430": "Strathbogie",
-        "26490": "Surf Coast",
-        "26610": "Swan Hill",
-        "26670": "Towong",
-        "26700": "Wangaratta",
-        "26730": "Warrnambool",
-        "26810": "Wellington",
-        "26890": "West Wimmera",
-        "26980": "Whitehorse",
-        "27070": "Whittlesea",
-        "27170": "Wodonga",
-        "27260": "Wyndham",
-        "27350": "Yarra",
-        "27450": "Yarra Ranges",
-        "27630": "Yarriambiack",
-        "29399": "Unincorporated Vic",
-        "29499": "No usual address (Vic.)",
-        "29799": "Migratory - Offshore - Shipping (Vic.)",
-        "30250": "Aurukun",
-        "30300": "Balonne",
-        "30370": "Banana",
-        "30410": "Barcaldine",
-        "30450": "Barcoo",
-        "30760": "Blackall Tambo",
-        "30900": "Boulia",
-        "31000": "Brisbane",
-        "31750": "Bulloo",
-        "31820": "Bundaberg",
-        "31900": "Burdekin",
-        "31950": "Burke",
-        "32080": "Cairns",
-        "32250": "Carpentaria",
-        "32260": "Cassowary Coast",
-        "32270": "Central Highlands (Qld)",
-        "32310": "Charters Towers",
-        "32330": "Cherbourg",
-        "32450": "Cloncurry",
-        "32500": "Cook",
-        "32600": "Croydon",
-        "32750": "Diamantina",
-        "32770": "Doomadgee",
-        "32810": "Douglas",
-        "33100": "Etheridge",
-        "33200": "Flinders (Qld)",
-        "33220": "Fraser Coast",
-        "33360": "Gladstone",
-        "33430": "Gold Coast",
-        "33610": "Goondiwindi",
-        "33620": "Gympie",
-        "33800": "Hinchinbrook",
-        "33830": "Hope Vale",
-        "33960": "Ipswich",
-        "33980": "Isaac",
-        "34420": "Kowanyama",
-        "34530": "Livingstone",
-        "34570": "Lockhart River",
-        "34580": "Lockyer Valley",
-        "34590": "Logan",
-        "34710": "Longreach",
-        "34770": "Mackay",
-        "34800": "McKinlay",
-        "34830": "Mapoon",
-        "34860": "Maranoa",
-        "34880": "Mareeba",
-        "35010": "Moreton Bay",
-        "35250": "Mornington",
-        "35300": "Mount Isa",
-        "35600": "Murweh",
-        "35670": "Napranum",
-        "35740": "Noosa",
-        "35760": "North Burnett",
-        "35780": "Northern Peninsula Area",
-        "35790": "Palm Island",
-        "35800": "Paroo",
-        "36070": "Pormpuraaw",
-        "36150": "Quilpie",
-        "36250": "Redland",
-        "36300": "Richmond",
-        "36370": "Rockhampton",
-        "36510": "Scenic Rim",
-        "36580": "Somerset",
-        "36630": "South Burnett",
-        "36660": "Southern Downs",
-        "36720": "Sunshine Coast",
-        "36820": "Tablelands",
-        "36910": "Toowoomba",
-        "36950": "Torres",
-        "36960": "Torres Strait Island",
-        "37010": "Townsville",
-        "37300": "Weipa",
-        "37310": "Western Downs",
-        "37340": "Whitsunday",
-        "37400": "Winton",
-        "37550": "Woorabinda",
-        "37570": "Wujal Wujal",
-        "37600": "Yarrabah",
-        "39499": "No usual address (Qld)",
-        "39799": "Migratory - Offshore - Shipping (Qld)",
-        "40070": "Adelaide",
-        "40120": "Adelaide Hills",
-        "40150": "Adelaide Plains",
-        "40220": "Alexandrina",
-        "40250": "Anangu Pitjantjatjara Yankunytjatjara",
-        "40310": "Barossa",
-        "40430": "Barunga West",
-        "40520": "Berri Barmera",
-        "40700": "Burnside",
-        "40910": "Campbelltown (SA)",
-        "41010": "Ceduna",
-        "41060": "Charles Sturt",
-        "41140": "Clare and Gilbert Valleys",
-        "41190": "Cleve",
-        "41330": "Coober Pedy",
-        "41560": "Copper Coast",
-        "41750": "Elliston",
-        "41830": "Flinders Ranges",
-        "41960": "Franklin Harbour",
-        "42030": "Gawler",
-        "42110": "Goyder",
-        "42250": "Grant",
-        "42600": "Holdfast Bay",
-        "42750": "Kangaroo Island",
-        "43080": "Karoonda East Murray",
-        "43220": "Kimba",
-        "43360": "Kingston (SA)",
-        "43650": "Light",
-        "43710": "Lower Eyre Peninsula",
-        "43790": "Loxton Waikerie",
-        "44000": "Maralinga Tjarutja",
-        "44060": "Marion",
-        "44210": "Mid Murray",
-        "44340": "Mitcham",
-        "44550": "Mount Barker",
-        "44620": "Mount Gambier",
-        "44830": "Mount Remarkable",
-        "45040": "Murray Bridge",
-        "45090": "Naracoorte Lucindale",
-        "45120": "Northern Areas",
-        "45290": "Norwood Payneham and St Peters",
-        "45340": "Onkaparinga",
-        "45400": "Orroroo Carrieton",
-        "45540": "Peterborough",
-        "45680": "Playford",
-        "45890": "Port Adelaide Enfield",
-        "46090": "Port Augusta",
-        "46300": "Port Lincoln",
-        "46450": "Port Pirie",
-        "46510": "Prospect",
-        "46670": "Renmark Paringa",
-        "46860": "Robe",
-        "46970": "Roxby Downs",
-        "47140": "Salisbury",
-        "47290": "Southern Mallee",
-        "47490": "Streaky Bay",
-        "47630": "Tatiara",
-        "47700": "Tea Tree Gully",
-        "47800": "Coorong",
-        "47910": "Tumby Bay",
-        "47980": "Unley",
-        "48050": "Victor Harbor",
-        "48130": "Wakefield",
-        "48260": "Walkerville",
-        "48340": "Wattle Range",
-        "48410": "West Torrens",
-        "48540": "Whyalla",
-        "48640": "Wudinna",
-        "48750": "Yankalilla",
-        "48830": "Yorke Peninsula",
-        "49399": "Unincorporated SA",
-        "49499": "No usual address (SA)",
-        "49799": "Migratory - Offshore - Shipping (SA)",
-        "50080": "Albany",
-        "50210": "Armadale",
-        "50250": "Ashburton",
-        "50280": "Augusta Margaret River",
-        "50350": "Bassendean",
-        "50420": "Bayswater",
-        "50490": "Belmont",
-        "50560": "Beverley",
-        "50630": "Boddington",
-        "50770": "Boyup Brook",
-        "50840": "Bridgetown-Greenbushes",
-        "50910": "Brookton",
-        "50980": "Broome",
-        "51080": "Broomehill-Tambellup",
-        "51120": "Bruce Rock",
-        "51190": "Bunbury",
-        "51260": "Busselton",
-        "51310": "Cambridge",
-        "51330": "Canning",
-        "51400": "Capel",
-        "51470": "Carnamah",
-        "51540": "Carnarvon",
-        "51610": "Chapman Valley",
-        "51680": "Chittering",
-        "51710": "Christmas Island",
-        "51750": "Claremont",
-        "51820": "Cockburn",
-        "51860": "Cocos Islands",
-        "51890": "Collie",
-        "51960": "Coolgardie",
-        "52030": "Coorow",
-        "52100": "Corrigin",
-        "52170": "Cottesloe",
-        "52240": "Cranbrook",
-        "52310": "Cuballing",
-        "52380": "Cue",
-        "52450": "Cunderdin",
-        "52520": "Dalwallinu",
-        "52590": "Dandaragan",
-        "52660": "Dardanup",
-        "52730": "Denmark",
-        "52800": "Derby-West Kimberley",
-        "52870": "Donnybrook-Balingup",
-        "52940": "Dowerin",
-        "53010": "Dumbleyung",
-        "53080": "Dundas",
-        "53150": "East Fremantle",
-        "53220": "East Pilbara",
-        "53290": "Esperance",
-        "53360": "Exmouth",
-        "53430": "Fremantle",
-        "53570": "Gingin",
-        "53640": "Gnowangerup",
-        "53710": "Goomalling",
-        "53780": "Gosnells",
-        "53800": "Greater Geraldton",
-        "53920": "Halls Creek",
-        "53990": "Harvey",
-        "54060": "Irwin",
-        "54130": "Jerramungup",
-        "54170": "Joondalup",
-        "54200": "Kalamunda",
-        "54280": "Kalgoorlie-Boulder",
-        "54310": "Karratha",
-        "54340": "Katanning",
-        "54410": "Kellerberrin",
-        "54480": "Kent",
-        "54550": "Kojonup",
-        "54620": "Kondinin",
-        "54690": "Koorda",
-        "54760": "Kulin",
-        "54830": "Kwinana",
-        "54900": "Lake Grace",
-        "54970": "Laverton",
-        "55040": "Leonora",
-        "55110": "Mandurah",
-        "55180": "Manjimup",
-        "55250": "Meekatharra",
-        "55320": "Melville",
-        "55390": "Menzies",
-        "55460": "Merredin",
-        "55530": "Mingenew",
-        "55600": "Moora",
-        "55670": "Morawa",
-        "55740": "Mosman Park",
-        "55810": "Mount Magnet",
-        "55880": "Mount Marshall",
-        "55950": "Mukinbudin",
-        "56090": "Mundaring",
-        "56160": "Murchison",
-        "56230": "Murray",
-        "56300": "Nannup",
-        "56370": "Narembeen",
-        "56460": "Narrogin",
-        "56580": "Nedlands",
-        "56620": "Ngaanyatjarraku",
-        "56730": "Northam",
-        "56790": "Northampton",
-        "56860": "Nungarin",
-        "56930": "Peppermint Grove",
-        "57000": "Perenjori",
-        "57080": "Perth",
-        "57140": "Pingelly",
-        "57210": "Plantagenet",
-        "57280": "Port Hedland",
-        "57350": "Quairading",
-        "57420": "Ravensthorpe",
-        "57490": "Rockingham",
-        "57630": "Sandstone",
-        "57700": "Serpentine-Jarrahdale",
-        "57770": "Shark Bay",
-        "57840": "South Perth",
-        "57910": "Stirling",
-        "57980": "Subiaco",
-        "58050": "Swan",
-        "58190": "Tammin",
-        "58260": "Three Springs",
-        "58330": "Toodyay",
-        "58400": "Trayning",
-        "58470": "Upper Gascoyne",
-        "58510": "Victoria Park",
-        "58540": "Victoria Plains",
-        "58570": "Vincent",
-        "58610": "Wagin",
-        "58680": "Wandering",
-        "58760": "Wanneroo",
-        "58820": "Waroona",
-        "58890": "West Arthur",
-        "59030": "Westonia",
-        "59100": "Wickepin",
-        "59170": "Williams",
-        "59250": "Wiluna",
-        "59310": "Wongan-Ballidu",
-        "59320": "Woodanilling",
-        "59330": "Wyalkatchem",
-        "59340": "Wyndham-East Kimberley",
-        "59350": "Yalgoo",
-        "59360": "Yilgarn",
-        "59370": "York",
-        "59499": "No usual address (WA)",
-        "59799": "Migratory - Offshore - Shipping (WA)",
-        "60210": "Break O'Day",
-        "60410": "Brighton",
-        "60610": "Burnie",
-        "60810": "Central Coast (Tas.)",
-        "61010": "Central Highlands (Tas.)",
-        "61210": "Circular Head",
-        "61410": "Clarence",
-        "61510": "Derwent Valley",
-        "61610": "Devonport",
-        "61810": "Dorset",
-        "62010": "Flinders (Tas.)",
-        "62210": "George Town",
-        "62410": "Glamorgan-Spring Bay",
-        "62610": "Glenorchy",
-        "62810": "Hobart",
-        "63010": "Huon Valley",
-        "63210": "Kentish",
-        "63410": "King Island",
-        "63610": "Kingborough",
-        "63810": "Latrobe (Tas.)",
-        "64010": "Launceston",
-        "64210": "Meander Valley",
-        "64610": "Northern Midlands",
-        "64810": "Sorell",
-        "65010": "Southern Midlands",
-        "65210": "Tasman",
-        "65410": "Waratah-Wynyard",
-        "65610": "West Coast",
-        "65810": "West Tamar",
-        "69499": "No usual address (Tas.)",
-        "69799": "Migratory - Offshore - Shipping (Tas.)",
-        "70200": "Alice Springs",
-        "70420": "Barkly",
-        "70540": "Belyuen",
-        "70620": "Central Desert",
-        "70700": "Coomalie",
-        "71000": "Darwin",
-        "71150": "Darwin Waterfront Precinct",
-        "71300": "East Arnhem",
-        "72200": "Katherine",
-        "72300": "Litchfield",
-        "72330": "MacDonnell",
-        "72800": "Palmerston",
-        "73600": "Roper Gulf",
-        "74050": "Tiwi Islands",
-        "74550": "Victoria Daly",
-        "74560": "Wagait",
-        "74660": "West Arnhem",
-        "74680": "West Daly",
-        "79399": "Unincorporated NT",
-        "79499": "No usual address (NT)",
-        "79799": "Migratory - Offshore - Shipping (NT)",
-        "89399": "Unincorporated ACT",
-        "89499": "No usual address (ACT)",
-        "89799": "Migratory - Offshore - Shipping (ACT)",
-        "99399": "Unincorp. Other Territories",
-        "99499": "No usual address (OT)",
-        "99799": "Migratory - Offshore - Shipping (OT)",
-        "101021007": "Braidwood",
-        "101021008": "Karabar",
-        "101021009": "Queanbeyan",
-        "101021010": "Queanbeyan - East",
-        "101021610": "Googong",
-        "101021611": "Queanbeyan Surrounds",
-        "101021012": "Queanbeyan West - Jerrabomberra",
-        "101031013": "Bombala",
-        "101031014": "Cooma",
-        "101031015": "Cooma Surrounds",
-        "101031016": "Jindabyne - Berridale",
-        "101041017": "Batemans Bay",
-        "101041018": "Batemans Bay - South",
-        "101041019": "Bega - Tathra",
-        "101041020": "Bega-Eden Hinterland",
-        "101041021": "Broulee - Tomakin",
-        "101041022": "Deua - Wadbilliga",
-        "101041023": "Eden",
-        "101041024": "Eurobodalla Hinterland",
-        "101041025": "Merimbula - Tura Beach",
-        "101041026": "Moruya - Tuross Head",
-        "101041027": "Narooma - Bermagui",
-        "101051539": "Goulburn",
-        "101051540": "Goulburn Surrounds",
-        "101061541": "Yass",
-        "101061542": "Yass Surrounds",
-        "101061543": "Young",
-        "101061544": "Young Surrounds",
-        "102011028": "Avoca Beach - Copacabana",
-        "102011029": "Box Head - MacMasters Beach",
-        "102011030": "Calga - Kulnura",
-        "102011031": "Erina - Green Point",
-        "102011032": "Gosford - Springfield",
-        "102011033": "Kariong",
-        "102011034": "Kincumber - Picketts Valley",
-        "102011039": "Terrigal - North Avoca",
-        "102011035": "Narara",
-        "102011036": "Niagara Park - Lisarow",
-        "102011037": "Point Clare - Koolewong",
-        "102011038": "Saratoga - Davistown",
-        "102011040": "Umina - Booker Bay - Patonga",
-        "102011041": "Wamberal - Forresters Beach",
-        "102011042": "Woy Woy - Blackwall",
-        "102011043": "Wyoming",
-        "102021044": "Bateau Bay - Killarney Vale",
-        "102021045": "Blue Haven - San Remo",
-        "102021046": "Budgewoi - Buff Point - Halekulani",
-        "102021047": "Chittaway Bay - Tumbi Umbi",
-        "102021048": "Gorokan - Kanwal - Charmhaven",
-        "102021049": "Jilliby - Yarramalong",
-        "102021050": "Lake Munmorah - Mannering Park",
-        "102021051": "Ourimbah - Fountaindale",
-        "102021052": "Summerland Point - Gwandalan",
-        "102021053": "The Entrance",
-        "102021054": "Toukley - Norah Head",
-        "102021055": "Tuggerah - Kangy Angy",
-        "102021056": "Warnervale - Wadalba",
-        "102021057": "Wyong",
-        "103011612": "Bathurst - South",
-        "103011613": "Bathurst - West",
-        "103011059": "Bathurst - East",
-        "103011060": "Bathurst Surrounds",
-        "103011061": "Oberon",
-        "103021062": "Condobolin",
-        "103021063": "Cowra",
-        "103021064": "Cowra Surrounds",
-        "103021065": "Forbes",
-        "103021066": "Grenfell",
-        "103021067": "Parkes (NSW)",
-        "103021068": "Parkes Surrounds",
-        "103021069": "West Wyalong",
-        "103031070": "Lithgow",
-        "103031071": "Lithgow Surrounds",
-        "103031072": "Mudgee",
-        "103031073": "Mudgee Surrounds - East",
-        "103031074": "Mudgee Surrounds - West",
-        "103031075": "Wollangambe - Wollemi",
-        "103041076": "Blayney",
-        "103041077": "Orange",
-        "103041078": "Orange - North",
-        "103041079": "Orange Surrounds",
-        "104011080": "Grafton",
-        "104011081": "Grafton Surrounds",
-        "104011082": "Maclean - Yamba - Iluka",
-        "104021083": "Bellingen",
-        "104021084": "Coffs Harbour - North",
-        "104021085": "Coffs Harbour - South",
-        "104021086": "Coramba - Nana Glen - Bucca",
-        "104021087": "Dorrigo",
-        "104021088": "Korora - Emerald Beach",
-        "104021089": "Sawtell - Boambee",
-        "104021090": "Urunga",
-        "104021091": "Woolgoolga - Arrawarra",
-        "105011092": "Bourke - Brewarrina",
-        "105011093": "Cobar",
-        "105011094": "Coonamble",
-        "105011095": "Nyngan - Warren",
-        "105011096": "Walgett - Lightning Ridge",
-        "105021097": "Broken Hill",
-        "105021098": "Far West",
-        "105031099": "Coonabarabran",
-        "105031100": "Dubbo - East",
-        "105031101": "Dubbo - South",
-        "105031102": "Dubbo - West",
-        "105031103": "Dubbo Surrounds",
-        "105031104": "Gilgandra",
-        "105031105": "Narromine",
-        "105031106": "Wellington",
-        "106011107": "Branxton - Greta - Pokolbin",
-        "106011108": "Cessnock",
-        "106011109": "Cessnock Surrounds",
-        "106011110": "Dungog",
-        "106011111": "Kurri Kurri - Abermain",
-        "106011112": "Singleton",
-        "106011113": "Singleton Surrounds",
-        "106021114": "Maitland",
-        "106021614": "East Maitland - Metford",
-        "106021617": "Tenambit - East Maitland",
-        "106021618": "Thornton - Millers Forest",
-        "106021116": "Maitland - North",
-        "106021615": "Rutherford (North) - Aberglasslyn",
-        "106021616": "Rutherford (South) - Telarah",
-        "106031119": "Anna Bay",
-        "106031120": "Lemon Tree Passage - Tanilba Bay",
-        "106031121": "Nelson Bay Peninsula",
-        "106031122": "Raymond Terrace",
-        "106031123": "Seaham - Woodville",
-        "106031124": "Tea Gardens - Hawks Nest",
-        "106031125": "Williamtown - Medowie - Karuah",
-        "106041126": "Muswellbrook",
-        "106041127": "Muswellbrook Surrounds",
-        "106041128": "Scone",
-        "106041129": "Scone Surrounds",
-        "107011131": "Dapto - Avondale",
-        "107011132": "Horsley - Kembla Grange",
-        "107011133": "Port Kembla Industrial",
-        "107011134": "Unanderra - Mount Kembla",
-        "107011545": "Berkeley - Lake Heights - Cringila",
-        "107011546": "Port Kembla - Warrawong",
-        "107011547": "Windang - Primbee",
-        "107021135": "Illawarra Catchment Reserve",
-        "107031136": "Albion Park - Macquarie Pass",
-        "107031137": "Albion Park Rail",
-        "107031138": "Kiama",
-        "107031139": "Kiama Downs - Minnamurra",
-        "107031140": "Kiama Hinterland - Gerringong",
-        "107031141": "Shellharbour - Flinders",
-        "107031142": "Shellharbour - Oak Flats",
-        "107031143": "Warilla",
-        "107041144": "Balgownie - Fairy Meadow",
-        "107041145": "Corrimal - Tarrawanna - Bellambi",
-        "107041146": "Figtree - Keiraville",
-        "107041147": "Helensburgh",
-        "107041148": "Thirroul - Austinmer - Coalcliff",
-        "107041150": "Woonona - Bulli - Russell Vale",
-        "107041548": "Wollongong - East",
-        "107041549": "Wollongong - West",
-        "108011151": "Bulahdelah - Stroud",
-        "108011152": "Forster",
-        "108011153": "Forster-Tuncurry Surrounds",
-        "108011154": "Tuncurry",
-        "108021155": "Kempsey",
-        "108021156": "Kempsey Surrounds",
-        "108021157": "Macksville - Scotts Head",
-        "108021158": "Nambucca Heads",
-        "108021159": "Nambucca Heads Surrounds",
-        "108021160": "South West Rocks",
-        "108031161": "Lord Howe Island",
-        "108041162": "Laurieton - Bonny Hills",
-        "108041619": "Port Macquarie - East",
-        "108041620": "Port Macquarie - South",
-        "108041164": "Port Macquarie - West",
-        "108041165": "Port Macquarie Surrounds",
-        "108041166": "Wauchope",
-        "108051167": "Gloucester",
-        "108051168": "Old Bar - Manning Point - Red Head",
-        "108051169": "Taree",
-        "108051170": "Taree Surrounds",
-        "108051171": "Wingham",
-        "109011172": "Albury - East",
-        "109011173": "Albury - North",
-        "109011174": "Albury - South",
-        "109011175": "Albury Surrounds",
-        "109011176": "Lavington",
-        "109021177": "Hay",
-        "109021178": "Wentworth - Buronga",
-        "109021179": "Wentworth-Balranald Region",
-        "109031180": "Corowa",
-        "109031181": "Corowa Surrounds",
-        "109031182": "Deniliquin",
-        "109031183": "Deniliquin Surrounds",
-        "109031184": "Moama",
-        "109031185": "Tocumwal - Finley - Jerilderie",
-        "110011186": "Armidale",
-        "110011187": "Armidale Surrounds - North",
-        "110011188": "Armidale Surrounds - South",
-        "110011189": "Walcha",
-        "110021190": "Glen Innes",
-        "110021191": "Inverell",
-        "110021192": "Inverell Surrounds - East",
-        "110021193": "Inverell Surrounds - West",
-        "110021194": "Tenterfield",
-        "110031195": "Moree",
-        "110031196": "Moree Surrounds",
-        "110031197": "Narrabri",
-        "110031198": "Narrabri Surrounds",
-        "110041199": "Gunnedah",
-        "110041200": "Gunnedah Surrounds",
-        "110041201": "Quirindi",
-        "110041202": "Tamworth - East",
-        "110041203": "Tamworth - North",
-        "110041204": "Tamworth - West",
-        "110041205": "Tamworth Surrounds",
-        "111011206": "Belmont - Bennetts Green",
-        "111011207": "Belmont South - Blacksmiths",
-        "111011208": "Charlestown - Dudley",
-        "111011209": "Glendale - Cardiff - Hillsborough",
-        "111011210": "Mount Hutton - Windale",
-        "111011211": "Redhead",
-        "111011212": "Swansea - Caves Beach",
-        "111011213": "Valentine - Eleebana",
-        "111011214": "Warners Bay - Boolaroo",
-        "111021215": "Bolton Point - Teralba",
-        "111021216": "Bonnells Bay - Silverwater",
-        "111021217": "Edgeworth - Cameron Park",
-        "111021218": "Morisset - Cooranbong",
-        "111021219": "Toronto - Awaba",
-        "111021220": "Wangi Wangi - Rathmines",
-        "111021221": "West Wallsend - Barnsley - Killingworth",
-        "111031222": "Adamstown - Kotara",
-        "111031223": "Beresfield - Hexham",
-        "111031224": "Hamilton - Broadmeadow",
-        "111031225": "Lambton - New Lambton",
-        "111031226": "Maryland - Fletcher - Minmi",
-        "111031227": "Mayfield - Warabrook",
-        "111031228": "Merewether - The Junction",
-        "111031229": "Newcastle - Cooks Hill",
-        "111031230": "Newcastle Port - Kooragang",
-        "111031231": "Shortland - Jesmond",
-        "111031232": "Stockton - Fullerton Cove",
-        "111031233": "Wallsend - Elermore Vale",
-        "111031234": "Waratah - North Lambton",
-        "111031235": "Wickham - Carrington - Tighes Hill",
-        "112011236": "Ballina",
-        "112011237": "Ballina Surrounds",
-        "112011238": "Bangalow",
-        "112011239": "Brunswick Heads - Ocean Shores",
-        "112011240": "Byron Bay",
-        "112011241": "Evans Head",
-        "112011242": "Lennox Head - Skennars Head",
-        "112011243": "Mullumbimby",
-        "112021244": "Casino",
-        "112021245": "Casino Surrounds",
-        "112021246": "Goonellabah",
-        "112021247": "Kyogle",
-        "112021248": "Lismore",
-        "112021249": "Lismore Surrounds",
-        "112031250": "Kingscliff - Fingal Head",
-        "112031251": "Murwillumbah",
-        "112031252": "Murwillumbah Surrounds",
-        "112031253": "Pottsville",
-        "112031254": "Tweed Heads",
-        "112031550": "Banora Point",
-        "112031551": "Terranora - North Tumbulgum",
-        "112031552": "Tweed Heads South",
-        "113011256": "Griffith (NSW)",
-        "113011257": "Griffith Surrounds",
-        "113011258": "Leeton",
-        "113011259": "Narrandera",
-        "113021260": "Tumbarumba",
-        "113021261": "Tumut",
-        "113021262": "Tumut Surrounds",
-        "113031263": "Cootamundra",
-        "113031264": "Gundagai",
-        "113031265": "Junee",
-        "113031266": "Temora",
-        "113031267": "Wagga Wagga - East",
-        "113031268": "Wagga Wagga - North",
-        "113031269": "Wagga Wagga - South",
-        "113031270": "Wagga Wagga - West",
-        "113031271": "Wagga Wagga Surrounds",
-        "114011272": "Berry - Kangaroo Valley",
-        "114011273": "Callala Bay - Currarong",
-        "114011274": "Culburra Beach",
-        "114011275": "Ettrema - Sassafras - Budawang",
-        "114011276": "Huskisson - Vincentia",
-        "114011277": "North Nowra - Bomaderry",
-        "114011278": "Nowra",
-        "114011279": "St Georges Basin - Erowal Bay",
-        "114011280": "Sussex Inlet - Berrara",
-        "114011281": "Tomerong - Wandandian - Woollamia",
-        "114011282": "Ulladulla",
-        "114011283": "Ulladulla Surrounds",
-        "114021284": "Bowral",
-        "114021285": "Hill Top - Colo Vale",
-        "114021286": "Mittagong",
-        "114021287": "Moss Vale - Berrima",
-        "114021288": "Robertson - Fitzroy Falls",
-        "114021289": "Southern Highlands",
-        "115011290": "Baulkham Hills - East",
-        "115011291": "Baulkham Hills (West) - Bella Vista",
-        "115011622": "Kellyville - West",
-        "115011294": "Glenhaven",
-        "115011296": "West Pennant Hills",
-        "115011553": "Castle Hill - Central",
-        "115011554": "Castle Hill - East",
-        "115011555": "Castle Hill - North",
-        "115011556": "Castle Hill - South",
-        "115011557": "Castle Hill - West",
-        "115011558": "Cherrybrook",
-        "115011621": "Kellyville - East",
-        "115021297": "Dural - Kenthurst - Wisemans Ferry",
-        "115021298": "Galston - Laughtondale",
-        "115031299": "Bilpin - Colo - St Albans",
-        "115031300": "Kurrajong Heights - Ebenezer",
-        "115041301": "Pitt Town - McGraths Hill",
-        "115041623": "Box Hill - Nelson",
-        "115041624": "North Kellyville",
-        "115041625": "Rouse Hill - Beaumont Hills",
-        "116011303": "Blacktown (East) - Kings Park",
-        "116011304": "Blacktown (North) - Marayong",
-        "116011306": "Doonside - Woodcroft",
-        "116011307": "Lalor Park - Kings Langley",
-        "116011626": "Seven Hills - Prospect",
-        "116011627": "Toongabbie - West",
-        "125031715": "Pemulwuy - Greystanes (North)",
-        "116011560": "Blacktown - South",
-        "116011561": "Blacktown - West",
-        "116021309": "Glenwood",
-        "116021628": "Kellyville Ridge - The Ponds",
-        "116021633": "Stanhope Gardens - Parklea",
-        "116021629": "Marsden Park - Shanes Park",
-        "116021630": "Riverstone",
-        "116021631": "Schofields (West) - Colebee",
-        "116021632": "Schofields - East",
-        "116021562": "Acacia Gardens",
-        "116021563": "Quakers Hill",
-        "116031313": "Bidwill - Hebersham - Emerton",
-        "116031314": "Glendenning - Dean Park",
-        "116031315": "Hassall Grove - Plumpton",
-        "116031316": "Lethbridge Park - Tregear",
-        "116031317": "Mount Druitt - Whalan",
-        "116031318": "Prospect Reservoir",
-        "116031319": "Rooty Hill - Minchinbury",
-        "117011320": "Banksmeadow",
-        "117011321": "Botany",
-        "117011634": "Eastlakes",
-        "117011635": "Mascot",
-        "117011323": "Pagewood - Hillsdale - Daceyville",
-        "117011324": "Port Botany Industrial",
-        "117011325": "Sydney Airport",
-        "117021636": "Marrickville - North",
-        "117021637": "Marrickville - South",
-        "117021327": "Petersham - Stanmore",
-        "117021328": "Sydenham - Tempe - St Peters",
-        "117031329": "Darlinghurst",
-        "117031330": "Erskineville - Alexandria",
-        "117031331": "Glebe - Forest Lodge",
-        "117031638": "Camperdown - Darlington",
-        "117031640": "Newtown (NSW)",
-        "117031333": "Potts Point - Woolloomooloo",
-        "117031641": "Pyrmont",
-        "117031646": "Ultimo",
-        "117031639": "Chippendale",
-        "117031642": "Redfern",
-        "117031336": "Surry Hills",
-        "117031644": "Sydney (North) - Millers Point",
-        "117031645": "Sydney (South) - Haymarket",
-        "117031643": "Rosebery - Beaconsfield",
-        "117031647": "Waterloo",
-        "117031648": "Zetland",
-        "118011339": "Bondi - Tamarama - Bronte",
-        "118011340": "Bondi Beach - North Bondi",
-        "118011341": "Bondi Junction - Waverly",
-        "118011342": "Centennial Park",
-        "118011649": "Bellevue Hill",
-        "118011650": "Double Bay - Darling Point",
-        "118011344": "Dover Heights",
-        "118011345": "Paddington - Moore Park",
-        "118011346": "Rose Bay - Vaucluse - Watsons Bay",
-        "118011347": "Woollahra",
-        "118021651": "Coogee - Clovelly",
-        "118021654": "South Coogee",
-        "118021652": "Malabar - La Perouse",
-        "118021653": "Matraville - Chifley",
-        "118021564": "Kensington (NSW)",
-        "118021565": "Kingsford",
-        "118021566": "Maroubra - North",
-        "118021567": "Maroubra - South",
-        "118021568": "Maroubra - West",
-        "118021569": "Randwick - North",
-        "118021570": "Randwick - South",
-        "119011354": "Bass Hill - Georges Hall",
-        "119011355": "Chullora",
-        "119011356": "Condell Park",
-        "119011655": "Greenacre - North",
-        "119011656": "Greenacre - South",
-        "119011358": "Padstow",
-        "119011657": "Panania (North) - Milperra",
-        "119011658": "Panania (South) - Picnic Point",
-        "119011360": "Revesby",
-        "119011361": "Yagoona - Birrong",
-        "119011571": "Bankstown - North",
-        "119011572": "Bankstown - South",
-        "119021362": "Belmore - Belfield",
-        "119021659": "Campsie - North",
-        "119021660": "Campsie - South",
-        "119021661": "Canterbury - South",
-        "119021662": "Earlwood",
-        "119021663": "Kingsgrove - North",
-        "119021366": "Punchbowl",
-        "119021367": "Roselands",
-        "119021573": "Lakemba",
-        "119021574": "Wiley Park",
-        "119031664": "Hurstville - Central",
-        "119031665": "Hurstville - North",
-        "119031666": "Mortdale - Oatley",
-        "119031667": "Penshurst",
-        "119031370": "Narwee - Beverly Hills",
-        "119031371": "Oatley - Hurstville Grove",
-        "119031372": "Peakhurst - Lugarno",
-        "119031373": "Riverwood",
-        "119031374": "South Hurstville - Blakehurst",
-        "119041668": "Arncliffe - Bardwell Valley",
-        "119041671": "Wolli Creek",
-        "119041669": "Bexley - North",
-        "119041670": "Bexley - South",
-        "119041377": "Kingsgrove (South) - Bardwell Park",
-        "119041378": "Kogarah",
-        "119041379": "Kogarah Bay - Carlton - Allawah",
-        "119041380": "Monterey - Brighton-le-Sands - Kyeemagh",
-        "119041381": "Rockdale - Banksia",
-        "119041382": "Sans Souci - Ramsgate",
-        "120011383": "Concord - Mortlake - Cabarita",
-        "120011672": "Concord West - North Strathfield",
-        "120011673": "Rhodes",
-        "120011385": "Drummoyne - Rodd Point",
-        "120011386": "Five Dock - Abbotsford",
-        "120021387": "Balmain",
-        "120021674": "Annandale (NSW)",
-        "120021675": "Leichhardt",
-        "120021389": "Lilyfield - Rozelle",
-        "120031676": "Ashfield - North",
-        "120031677": "Ashfield - South",
-        "120031678": "Burwood (NSW)",
-        "120031679": "Croydon",
-        "120031392": "Canterbury (North) - Ashbury",
-        "120031393": "Croydon Park - Enfield",
-        "120031394": "Dulwich Hill - Lewisham",
-        "120031395": "Haberfield - Summer Hill",
-        "120031396": "Homebush",
-        "120031680": "Strathfield - East",
-        "120031681": "Strathfield - West",
-        "120031576": "Strathfield South",
-        "121011682": "Artarmon",
-        "121011684": "Chatswood - East",
-        "121011399": "Chatswood (West) - Lane Cove North",
-        "121011685": "Greenwich - Riverview",
-        "121011686": "Lane Cove",
-        "121011401": "St Leonards - Naremburn",
-        "121011683": "Castle Cove - Northbridge",
-        "121011687": "Willoughby",
-        "121021403": "Asquith - Mount Colah",
-        "121021404": "Berowra - Brooklyn - Cowan",
-        "121021406": "Normanhurst - Thornleigh - Westleigh",
-        "121021577": "Hornsby - East",
-        "121021578": "Hornsby - West",
-        "121021579": "Wahroonga (West) - Waitara",
-        "121031407": "Gordon - Killara",
-        "121031408": "Lindfield - Roseville",
-        "121031409": "Pymble",
-        "121031410": "St Ives",
-        "121031411": "Turramurra",
-        "121031412": "Wahroonga (East) - Warrawee",
-        "121041413": "Cremorne - Cammeray",
-        "121041416": "Neutral Bay - Kirribilli",
-        "121041414": "Crows Nest - Waverton",
-        "121041688": "Mosman - North",
-        "121041689": "Mosman - South",
-        "121041417": "North Sydney - Lavender Bay",
-        "122011418": "Balgowlah - Clontarf - Seaforth",
-        "122011419": "Manly - Fairlight",
-        "122021420": "Avalon - Palm Beach",
-        "122021421": "Bayview - Elanora Heights",
-        "122021422": "Newport - Bilgola",
-        "122021690": "Mona Vale - Warriewood (North)",
-        "122021691": "North Narrabeen - Warriewood (South)",
-        "122031424": "Beacon Hill - Narraweena",
-        "122031425": "Cromer",
-        "122031694": "Dee Why (South) - North Curl Curl",
-        "122031695": "Dee Why - North",
-        "122031427": "Forestville - Killarney Heights",
-        "122031692": "Belrose",
-        "122031696": "Frenchs Forest - Oxford Falls",
-        "122031429": "Freshwater - Brookvale",
-        "122031430": "Manly Vale - Allambie Heights",
-        "122031693": "Collaroy - Collaroy Plateau",
-        "122031697": "Narrabeen - Wheeler Heights",
-        "122031432": "Terrey Hills - Duffys Forest",
-        "123011433": "Camden - Ellis Lane",
-        "123011699": "Elderslie - Narellan",
-        "123011700": "Harrington Park",
-        "123011698": "Currans Hill",
-        "123011701": "Mount Annan",
-        "123011702": "Spring Farm",
-        "123021436": "Bradbury - Wedderburn",
-        "123021437": "Campbelltown - Woodbine",
-        "123021438": "Claymore - Eagle Vale - Raby",
-        "123021439": "Holsworthy Military Area",
-        "123021703": "Denham Court - Bardia",
-        "123021705": "Ingleburn",
-        "127011728": "Leppington - Catherine Field",
-        "123021441": "Leumeah - Minto Heights",
-        "123021704": "Glenfield",
-        "123021706": "Macquarie Fields",
-        "123021443": "Minto - St Andrews",
-        "123021444": "Rosemeadow - Glen Alpine",
-        "123031445": "Bargo",
-        "123031446": "Douglas Park - Appin",
-        "123031447": "Picton - Tahmoor - Buxton",
-        "123031448": "The Oaks - Oakdale",
-        "124011449": "Blackheath - Megalong Valley",
-        "124011450": "Blaxland - Warrimoo - Lapstone",
-        "124011451": "Blue Mountains - North",
-        "124011452": "Katoomba - Leura",
-        "124011453": "Lawson - Hazelbrook - Linden",
-        "124011454": "Springwood - Winmalee",
-        "124011455": "Wentworth Falls",
-        "124021456": "Blue Mountains - South",
-        "124031457": "Cambridge Park",
-        "124031707": "Cranebrook - Castlereagh",
-        "124031708": "Jordan Springs - Llandilo",
-        "124031459": "Emu Plains - Leonay",
-        "124031460": "Glenmore Park - Regentville",
-        "124031461": "Jamisontown - South Penrith",
-        "124031462": "Kingswood - Werrington",
-        "124031463": "Mulgoa - Luddenham - Orchard Hills",
-        "124031464": "Penrith",
-        "124031465": "Warragamba - Silverdale",
-        "124041466": "Richmond - Clarendon",
-        "124041467": "Windsor - Bligh Park",
-        "124041468": "Yarramundi - Londonderry",
-        "124051469": "Erskine Park",
-        "124051470": "St Clair",
-        "124051580": "Colyton - Oxley Park",
-        "124051581": "St Marys - North St Marys",
-        "125011709": "Silverwater - Newington",
-        "125011710": "Wentworth Point - Sydney Olympic Park",
-        "125011475": "Rookwood Cemetery",
-        "125011582": "Auburn - Central",
-        "125011583": "Auburn - North",
-        "125011584": "Auburn - South",
-        "125011585": "Berala",
-        "125011586": "Lidcombe",
-        "125011587": "Regents Park",
-        "125021711": "Carlingford - East",
-        "125021712": "Carlingford - West",
-        "125021477": "Ermington - Rydalmere",
-        "125021478": "Oatlands - Dundas Valley",
-        "125031479": "Chester Hill - Sefton",
-        "125031480": "Fairfield - East",
-        "125031481": "Granville - Clyde",
-        "125031713": "Greystanes - South",
-        "125031483": "Guildford - South Granville",
-        "125031484": "Guildford West - Merrylands West",
-        "125031714": "Merrylands - Holroyd",
-        "125031716": "South Wentworthville",
-        "125031486": "Smithfield Industrial",
-        "125031487": "Yennora Industrial",
-        "125041489": "North Parramatta",
-        "125041490": "North Rocks",
-        "125041491": "Northmead",
-        "125041717": "Parramatta - North",
-        "125041718": "Parramatta - South",
-        "125041719": "Rosehill - Harris Park",
-        "125041493": "Toongabbie - Constitution Hill",
-        "125041494": "Winston Hills",
-        "125041588": "Pendle Hill - Girraween",
-        "125041589": "Wentworthville - Westmead",
-        "126011720": "Epping (East) - North Epping",
-        "126011721": "Epping (NSW) - West",
-        "126011496": "Pennant Hills - Cheltenham",
-        "126021722": "Denistone",
-        "126021723": "Eastwood",
-        "126021498": "Gladesville - Huntleys Point",
-        "126021499": "Hunters Hill - Woolwich",
-        "126021500": "Macquarie Park - Marsfield",
-        "126021501": "North Ryde - East Ryde",
-        "126021503": "West Ryde - Meadowbank",
-        "126021590": "Putney",
-        "126021724": "Ryde - North",
-        "126021725": "Ryde - South",
-        "127011504": "Ashcroft - Busby - Miller",
-        "127011505": "Austral - Greendale",
-        "127011726": "Cobbitty - Bringelly",
-        "127011727": "Gledswood Hills - Gregory Hills",
-        "127011729": "Oran Park",
-        "127011592": "Badgerys Creek",
-        "127011593": "Cecil Hills",
-        "127011594": "Green Valley",
-        "127011595": "Hinchinbrook",
-        "127011596": "Hoxton Park - Carnes Hill - Horningsea Park",
-        "127011597": "West Hoxton - Middleton Grange",
-        "127021509": "Bonnyrigg Heights - Bonnyrigg",
-        "127021510": "Bossley Park - Abbotsbury",
-        "127021511": "Cabramatta - Lansvale",
-        "127021512": "Cabramatta West - Mount Pritchard",
-        "127021513": "Canley Vale - Canley Heights",
-        "127021514": "Edensor Park",
-        "127021515": "Fairfield",
-        "127021516": "Fairfield - West",
-        "127021517": "Greenfield Park - Prairiewood",
-        "127021518": "Horsley Park - Kemps Creek",
-        "127021519": "Smithfield - Wetherill Park",
-        "127021520": "St Johns Park - Wakeley",
-        "127021521": "Wetherill Park Industrial",
-        "127031522": "Casula",
-        "127031523": "Chipping Norton - Moorebank",
-        "127031524": "Holsworthy - Wattle Grove",
-        "127031731": "Liverpool - East",
-        "127031732": "Liverpool - West",
-        "127031599": "Lurnea - Cartwright",
-        "127031730": "Edmondson Park",
-        "127031733": "Prestons",
-        "127031601": "Warwick Farm",
-        "128011529": "Gymea - Grays Point",
-        "128011530": "Miranda - Yowie Bay",
-        "128011531": "Sylvania - Taren Point",
-        "128011602": "Caringbah",
-        "128011603": "Caringbah South",
-        "128011604": "Cronulla - Kurnell - Bundeena",
-        "128011605": "Lilli Pilli - Port Hacking - Dolans Bay",
-        "128011606": "Woolooware - Burraneer",
-        "128021533": "Heathcote - Waterfall",
-        "128021534": "Illawong - Alfords Point",
-        "128021535": "Menai - Lucas Heights - Woronora",
-        "128021536": "Oyster Bay - Como - Jannali",
-        "128021537": "Royal National Park",
-        "128021538": "Sutherland - Kirrawee",
-        "128021607": "Engadine",
-        "128021608": "Loftus - Yarrawarrah",
-        "128021609": "Woronora Heights",
-        "197979799": "Migratory - Offshore - Shipping (NSW)",
-        "199999499": "No usual address (NSW)",
-        "201011001": "Alfredton",
-        "201011002": "Ballarat",
-        "201011481": "Ballarat East - Warrenheip",
-        "201011482": "Ballarat North - Invermay",
-        "201011483": "Canadian - Mount Clear",
-        "201011484": "Sebastopol - Redan",
-        "201011005": "Buninyong",
-        "201011006": "Delacombe",
-        "201011007": "Smythes Creek",
-        "201011008": "Wendouree - Miners Rest",
-        "201021009": "Bacchus Marsh Surrounds",
-        "201021010": "Creswick - Clunes",
-        "201021011": "Daylesford",
-        "201021012": "Gordon (Vic.)",
-        "201031013": "Avoca",
-        "201031014": "Beaufort",
-        "201031015": "Golden Plains - North",
-        "201031016": "Maryborough (Vic.)",
-        "201031017": "Maryborough Surrounds",
-        "202011018": "Bendigo",
-        "202011019": "California Gully - Eaglehawk",
-        "202011020": "East Bendigo - Kennington",
-        "202011021": "Flora Hill - Spring Gully",
-        "202011022": "Kangaroo Flat - Golden Square",
-        "202011023": "Maiden Gully",
-        "202011024": "Strathfieldsaye",
-        "202011025": "White Hills - Ascot",
-        "202021026": "Bendigo Surrounds - South",
-        "202021027": "Castlemaine",
-        "202021028": "Castlemaine Surrounds",
-        "202021029": "Heathcote",
-        "202021030": "Kyneton",
-        "202021031": "Woodend",
-        "202031032": "Bendigo Surrounds - North",
-        "202031033": "Loddon",
-        "203011034": "Bannockburn",
-        "203011035": "Golden Plains - South",
-        "203011036": "Winchelsea",
-        "203021037": "Belmont",
-        "203021486": "Corio - Lovely Banks",
-        "203021488": "Norlane",
-        "203021039": "Geelong",
-        "203021040": "Geelong West - Hamlyn Heights",
-        "203021485": "Charlemont",
-        "203021487": "Grovedale - Mount Duneed",
-        "203021042": "Highton",
-        "203021043": "Lara",
-        "203021044": "Leopold",
-        "203021045": "Newcomb - Moolap",
-        "203021046": "Newtown (Vic.)",
-        "203021047": "North Geelong - Bell Park",
-        "203031048": "Clifton Springs",
-        "203031049": "Lorne - Anglesea",
-        "203031489": "Barwon Heads - Armstrong Creek",
-        "203031490": "Ocean Grove",
-        "203031051": "Portarlington",
-        "203031052": "Point Lonsdale - Queenscliff",
-        "203031053": "Torquay",
-        "204011054": "Alexandra",
-        "204011055": "Euroa",
-        "204011056": "Kilmore - Broadford",
-        "204011057": "Mansfield (Vic.)",
-        "204011058": "Nagambie",
-        "204011059": "Seymour",
-        "204011060": "Seymour Surrounds",
-        "204011061": "Upper Yarra Valley",
-        "204011062": "Yea",
-        "204021063": "Benalla",
-        "204021064": "Benalla Surrounds",
-        "204021065": "Rutherglen",
-        "204021066": "Wangaratta",
-        "204021067": "Wangaratta Surrounds",
-        "204031068": "Beechworth",
-        "204031069": "Bright - Mount Beauty",
-        "204031070": "Chiltern - Indigo Valley",
-        "204031071": "Myrtleford",
-        "204031072": "Towong",
-        "204031073": "West Wodonga",
-        "204031491": "Baranduda - Leneva",
-        "204031492": "Wodonga",
-        "204031075": "Yackandandah",
-        "205011076": "Drouin",
-        "205011077": "Mount Baw Baw Region",
-        "205011078": "Trafalgar (Vic.)",
-        "205011079": "Warragul",
-        "205021080": "Alps - East",
-        "205021081": "Bairnsdale",
-        "205021082": "Bruthen - Omeo",
-        "205021083": "Lake King",
-        "205021084": "Lakes Entrance",
-        "205021085": "Orbost",
-        "205021086": "Paynesville",
-        "205031087": "Foster",
-        "205031088": "French Island",
-        "205031089": "Korumburra",
-        "205031090": "Leongatha",
-        "205031091": "Phillip Island",
-        "205031092": "Wilsons Promontory",
-        "205031093": "Wonthaggi - Inverloch",
-        "205041094": "Churchill",
-        "205041095": "Moe - Newborough",
-        "205041096": "Morwell",
-        "205041493": "Traralgon - East",
-        "205041494": "Traralgon - West",
-        "205041098": "Yallourn North - Glengarry",
-        "205051099": "Alps - West",
-        "205051100": "Longford - Loch Sport",
-        "205051101": "Maffra",
-        "205051102": "Rosedale",
-        "205051103": "Sale",
-        "205051104": "Yarram",
-        "206011495": "Brunswick - North",
-        "206011496": "Brunswick - South",
-        "206011106": "Brunswick East",
-        "206011107": "Brunswick West",
-        "206011497": "Coburg - East",
-        "206011498": "Coburg - West",
-        "206011109": "Pascoe Vale South",
-        "206021110": "Alphington - Fairfield",
-        "206021499": "Northcote - East",
-        "206021500": "Northcote - West",
-        "206021112": "Thornbury",
-        "206031113": "Ascot Vale",
-        "206031501": "Essendon (West) - Aberfeldie",
-        "206031502": "Essendon - East",
-        "206031115": "Flemington",
-        "206031116": "Moonee Ponds",
-        "206041117": "Carlton",
-        "206041118": "Docklands",
-        "206041119": "East Melbourne",
-        "206041120": "Flemington Racecourse",
-        "206041121": "Kensington (Vic.)",
-        "206041503": "Melbourne CBD - East",
-        "206041504": "Melbourne CBD - North",
-        "206041505": "Melbourne CBD - West",
-        "206041506": "North Melbourne",
-        "206041510": "West Melbourne - Residential",
-        "206041124": "Parkville",
-        "206041125": "South Yarra - West",
-        "206041507": "Royal Botanic Gardens Victoria",
-        "206041508": "Southbank (West) - South Wharf",
-        "206041509": "Southbank - East",
-        "206051511": "Port Melbourne Industrial",
-        "206041127": "West Melbourne - Industrial",
-        "206051128": "Albert Park",
-        "206051129": "Elwood",
-        "206051130": "Port Melbourne",
-        "206051512": "South Melbourne",
-        "206051513": "St Kilda - Central",
-        "206051514": "St Kilda - West",
-        "206051134": "St Kilda East",
-        "206061135": "Armadale",
-        "206061136": "Prahran - Windsor",
-        "206061515": "South Yarra - North",
-        "206061516": "South Yarra - South",
-        "206061138": "Toorak",
-        "206071139": "Abbotsford",
-        "206071140": "Carlton North - Princes Hill",
-        "206071141": "Collingwood",
-        "206071142": "Fitzroy",
-        "206071143": "Fitzroy North",
-        "206071517": "Richmond (South) - Cremorne",
-        "206071518": "Richmond - North",
-        "206071145": "Clifton Hill - Alphington",
-        "207011146": "Ashburton (Vic.)",
-        "207011147": "Balwyn",
-        "207011148": "Balwyn North",
-        "207011149": "Camberwell",
-        "207011150": "Glen Iris - East",
-        "207011519": "Hawthorn - North",
-        "207011520": "Hawthorn - South",
-        "207011152": "Hawthorn East",
-        "207011521": "Kew - South",
-        "207011522": "Kew - West",
-        "207011154": "Kew East",
-        "207011155": "Surrey Hills (West) - Canterbury",
-        "207021156": "Bulleen",
-        "207021157": "Doncaster",
-        "207021159": "Templestowe",
-        "207021160": "Templestowe Lower",
-        "207021424": "Doncaster East - North",
-        "207021425": "Doncaster East - South",
-        "207031161": "Blackburn",
-        "207031162": "Blackburn South",
-        "207031163": "Box Hill",
-        "207031164": "Box Hill North",
-        "207031165": "Burwood (Vic.)",
-        "207031166": "Burwood East",
-        "207031167": "Surrey Hills (East) - Mont Albert",
-        "208011168": "Beaumaris",
-        "208011169": "Brighton (Vic.)",
-        "208011170": "Brighton East",
-        "208011171": "Highett (West) - Cheltenham",
-        "208011172": "Hampton",
-        "208011173": "Sandringham - Black Rock",
-        "208021174": "Bentleigh - McKinnon",
-        "208021176": "Carnegie",
-        "208021177": "Caulfield - North",
-        "208021178": "Caulfield - South",
-        "208021179": "Elsternwick",
-        "208021180": "Hughesdale",
-        "208021181": "Murrumbeena",
-        "208021182": "Ormond - Glen Huntly",
-        "208021426": "Bentleigh East - North",
-        "208021427": "Bentleigh East - South",
-        "208031183": "Aspendale Gardens - Waterways",
-        "208031184": "Braeside",
-        "208031185": "Carrum - Patterson Lakes",
-        "208031186": "Chelsea - Bonbeach",
-        "208031187": "Chelsea Heights",
-        "208031188": "Highett (East) - Cheltenham",
-        "208031189": "Edithvale - Aspendale",
-        "208031190": "Mentone",
-        "208031191": "Moorabbin - Heatherton",
-        "208031192": "Moorabbin Airport",
-        "208031193": "Mordialloc - Parkdale",
-        "208041194": "Malvern - Glen Iris",
-        "208041195": "Malvern East",
-        "209011196": "Bundoora - East",
-        "209011197": "Greensborough",
-        "209011198": "Heidelberg - Rosanna",
-        "209011199": "Heidelberg West",
-        "209011200": "Ivanhoe",
-        "209011201": "Ivanhoe East - Eaglemont",
-        "209011202": "Montmorency - Briar Hill",
-        "209011203": "Viewbank - Yallambie",
-        "209011204": "Watsonia",
-        "209021205": "Kingsbury",
-        "209021523": "Reservoir - North East",
-        "209021525": "Reservoir - South East",
-        "209021524": "Reservoir - North West",
-        "209021526": "Reservoir - South West",
-        "209021428": "Preston - East",
-        "209021429": "Preston - West",
-        "209031209": "Eltham",
-        "209031210": "Hurstbridge",
-        "209031211": "Kinglake",
-        "209031212": "Panton Hill - St Andrews",
-        "209031213": "Plenty - Yarrambat",
-        "209031214": "Research - North Warrandyte",
-        "209031215": "Wattle Glen - Diamond Creek",
-        "209041216": "Bundoora - North",
-        "209041217": "Bundoora - West",
-        "209041529": "Lalor - East",
-        "209041530": "Lalor - West",
-        "209041220": "Mill Park - North",
-        "209041221": "Mill Park - South",
-        "209041223": "Thomastown",
-        "209041224": "Wallan",
-        "209041225": "Whittlesea",
-        "209041527": "Doreen - North",
-        "209041528": "Doreen - South",
-        "209041431": "Epping - East",
-        "209041432": "Epping - South",
-        "209041433": "Epping (Vic.) - West",
-        "209041531": "Mernda - North",
-        "209041532": "Mernda - South",
-        "209041435": "South Morang - North",
-        "209041436": "South Morang - South",
-        "209041437": "Wollert",
-        "210011226": "Airport West",
-        "210011227": "Essendon Airport",
-        "210011228": "Keilor",
-        "210011533": "Avondale Heights",
-        "210011534": "Keilor East",
-        "210011230": "Niddrie - Essendon West",
-        "210011231": "Strathmore",
-        "210021232": "Gisborne",
-        "210021233": "Macedon",
-        "210021234": "Riddells Creek",
-        "210021235": "Romsey",
-        "210031236": "Coburg North",
-        "210031237": "Fawkner",
-        "210031537": "Oak Park",
-        "210031538": "Pascoe Vale",
-        "210031535": "Glenroy - East",
-        "210031536": "Glenroy - West",
-        "210031439": "Gowanbrae",
-        "210031440": "Hadfield",
-        "210041240": "Sunbury",
-        "210041539": "Diggers Rest",
-        "210041540": "Sunbury - South",
-        "210041541": "Sunbury - West",
-        "210051242": "Broadmeadows",
-        "210051243": "Campbellfield - Coolaroo",
-        "210051245": "Gladstone Park - Westmeadows",
-        "210051246": "Greenvale - Bulla",
-        "210051247": "Meadow Heights",
-        "210051248": "Melbourne Airport",
-        "210051544": "Roxburgh Park (South) - Somerton",
-        "210051545": "Roxburgh Park - North",
-        "210051250": "Tullamarine",
-        "210051441": "Craigieburn - Central",
-        "210051442": "Craigieburn - North",
-        "210051443": "Craigieburn - South",
-        "210051445": "Mickleham - Yuroke",
-        "210051542": "Craigieburn - North West",
-        "210051543": "Craigieburn - West",
-        "211011251": "Bayswater",
-        "211011254": "Knoxfield - Scoresby",
-        "211011255": "Lysterfield",
-        "211011256": "Rowville - Central",
-        "211011257": "Rowville - North",
-        "211011258": "Rowville - South",
-        "211011259": "Wantirna",
-        "211011260": "Wantirna South",
-        "211011446": "Boronia",
-        "211011447": "Ferntree Gully - North",
-        "211011448": "Ferntree Gully (South) - Upper Ferntree Gully",
-        "211011449": "The Basin",
-        "211021261": "Donvale - Park Orchards",
-        "211021262": "Warrandyte - Wonga Park",
-        "211031263": "Bayswater North",
-        "211031265": "Croydon Hills - Warranwood",
-        "211031266": "Ringwood",
-        "211031267": "Ringwood East",
-        "211031268": "Ringwood North",
-        "211031450": "Croydon - East",
-        "211031451": "Croydon - West",
-        "211031452": "Croydon South",
-        "211041269": "Forest Hill",
-        "211041270": "Mitcham (Vic.)",
-        "211041271": "Nunawading",
-        "211041272": "Vermont",
-        "211041273": "Vermont South",
-        "211051274": "Belgrave - Selby",
-        "211051275": "Chirnside Park",
-        "211051276": "Healesville - Yarra Glen",
-        "211051277": "Kilsyth",
-        "211051278": "Lilydale - Coldstream",
-        "211051279": "Monbulk - Silvan",
-        "211051280": "Montrose",
-        "211051281": "Mooroolbark",
-        "211051282": "Mount Dandenong - Olinda",
-        "211051283": "Mount Evelyn",
-        "211051284": "Upwey - Tecoma",
-        "211051285": "Wandin - Seville",
-        "211051286": "Yarra Valley",
-        "212011546": "Beaconsfield - Officer",
-        "212011548": "Koo Wee Rup",
-        "212011550": "Pakenham - North West",
-        "212011547": "Bunyip - Garfield",
-        "212011549": "Pakenham - North East",
-        "212011551": "Pakenham - South East",
-        "212011289": "Emerald - Cockatoo",
-        "212011552": "Pakenham - South West",
-        "212021293": "Berwick - North",
-        "212021553": "Berwick - South East",
-        "212021554": "Berwick - South West",
-        "212021295": "Doveton",
-        "212021297": "Hallam",
-        "212021299": "Narre Warren North",
-        "212021453": "Endeavour Hills - North",
-        "212021454": "Endeavour Hills - South",
-        "212021455": "Narre Warren - North East",
-        "212021456": "Narre Warren - South West",
-        "212031300": "Cranbourne",
-        "212031555": "Clyde North - North",
-        "212031556": "Clyde North - South",
-        "212031557": "Cranbourne East - North",
-        "212031558": "Cranbourne East - South",
-        "212031559": "Cranbourne North - East",
-        "212031560": "Cranbourne North - West",
-        "212031303": "Cranbourne South",
-        "212031304": "Cranbourne West",
-        "212031561": "Hampton Park - East",
-        "212031562": "Hampton Park - West",
-        "212031306": "Lynbrook - Lyndhurst",
-        "212031308": "Pearcedale - Tooradin",
-        "212031457": "Narre Warren South - East",
-        "212031458": "Narre Warren South - West",
-        "212041309": "Clarinda - Oakleigh South",
-        "212041310": "Clayton South",
-        "212041563": "Dandenong - North",
-        "212041564": "Dandenong - South",
-        "212041312": "Dandenong North",
-        "212041313": "Dingley Village",
-        "212041565": "Keysborough - North",
-        "212041566": "Keysborough - South",
-        "212041316": "Noble Park North",
-        "212041317": "Springvale",
-        "212041318": "Springvale South",
-        "212041459": "Noble Park - East",
-        "212041460": "Noble Park - West",
-        "212051319": "Ashwood - Chadstone",
-        "212051567": "Clayton (North) - Notting Hill",
-        "212051568": "Clayton - Central",
-        "212051321": "Glen Waverley - East",
-        "212051322": "Glen Waverley - West",
-        "212051323": "Mount Waverley - North",
-        "212051324": "Mount Waverley - South",
-        "212051325": "Mulgrave",
-        "212051326": "Oakleigh - Huntingdale",
-        "212051327": "Wheelers Hill",
-        "213011328": "Ardeer - Albion",
-        "213011329": "Cairnlea",
-        "213011569": "Deer Park",
-        "213011570": "Derrimut",
-        "213011331": "Delahey",
-        "213011332": "Keilor Downs",
-        "213011333": "Kings Park (Vic.)",
-        "213011334": "St Albans - North",
-        "213011335": "St Albans - South",
-        "213011336": "Sunshine",
-        "213011337": "Sunshine North",
-        "213011338": "Sunshine West",
-        "213011339": "Sydenham",
-        "213011340": "Taylors Lakes",
-        "213021341": "Altona",
-        "213021342": "Altona Meadows",
-        "213021343": "Altona North",
-        "213021344": "Newport",
-        "213021345": "Seabrook",
-        "213021346": "Williamstown",
-        "213031347": "Braybrook",
-        "213031348": "Footscray",
-        "213031349": "Maribyrnong",
-        "213031350": "Seddon - Kingsville",
-        "213031351": "West Footscray - Tottenham",
-        "213031352": "Yarraville",
-        "213041353": "Bacchus Marsh",
-        "213041574": "Fraser Rise - Plumpton",
-        "213041575": "Hillside",
-        "213041576": "Kurunjang - Toolern Vale",
-        "213041577": "Melton",
-        "213041571": "Brookfield",
-        "213041572": "Cobblebank - Strathtulloh",
-        "213041573": "Eynesbury - Exford",
-        "213041578": "Melton South - Weir Views",
-        "213041358": "Melton West",
-        "213041359": "Rockbank - Mount Cottrell",
-        "213041360": "Taylors Hill",
-        "213041461": "Burnside",
-        "213041462": "Burnside Heights",
-        "213041463": "Caroline Springs",
-        "213051361": "Hoppers Crossing - North",
-        "213051362": "Hoppers Crossing - South",
-        "213051363": "Laverton",
-        "213051582": "Tarneit (West) - Mount Cottrell",
-        "213051583": "Tarneit - Central",
-        "213051584": "Tarneit - North",
-        "213051585": "Tarneit - South",
-        "213051586": "Truganina - North",
-        "213051587": "Truganina - South East",
-        "213051588": "Truganina - South West",
-        "213051368": "Werribee - South",
-        "213051579": "Manor Lakes - Quandong",
-        "213051589": "Wyndham Vale - North",
-        "213051590": "Wyndham Vale - South",
-        "213051464": "Point Cook - East",
-        "213051580": "Point Cook - North East",
-        "213051581": "Point Cook - North West",
-        "213051466": "Point Cook - South",
-        "213051467": "Werribee - East",
-        "213051468": "Werribee - West",
-        "214011370": "Carrum Downs",
-        "214011371": "Frankston",
-        "214011372": "Frankston North",
-        "214011373": "Frankston South",
-        "214011374": "Langwarrin",
-        "214011375": "Seaford (Vic.)",
-        "214011376": "Skye - Sandhurst",
-        "214021377": "Dromana",
-        "214021378": "Flinders",
-        "214021379": "Hastings - Somers",
-        "214021591": "Mornington - East",
-        "214021592": "Mornington - West",
-        "214021381": "Mount Eliza",
-        "214021382": "Mount Martha",
-        "214021383": "Point Nepean",
-        "214021384": "Rosebud - McCrae",
-        "214021385": "Somerville",
-        "215011386": "Ararat",
-        "215011387": "Ararat Surrounds",
-        "215011388": "Horsham",
-        "215011389": "Horsham Surrounds",
-        "215011390": "Nhill Region",
-        "215011391": "St Arnaud",
-        "215011392": "Stawell",
-        "215011393": "West Wimmera",
-        "215011394": "Yarriambiack",
-        "215021395": "Irymple",
-        "215021396": "Merbein",
-        "215021398": "Mildura Surrounds",
-        "215021399": "Red Cliffs",
-        "215021469": "Mildura - North",
-        "215021470": "Mildura - South",
-        "215031400": "Buloke",
-        "215031401": "Gannawarra",
-        "215031402": "Kerang",
-        "215031403": "Robinvale",
-        "215031404": "Swan Hill",
-        "215031405": "Swan Hill Surrounds",
-        "216011406": "Echuca",
-        "216011407": "Kyabram",
-        "216011408": "Lockington - Gunbower",
-        "216011409": "Rochester",
-        "216011410": "Rushworth",
-        "216021411": "Cobram",
-        "216021412": "Moira",
-        "216021413": "Numurkah",
-        "216021414": "Yarrawonga",
-        "216031415": "Mooroopna",
-        "216031416": "Shepparton - North",
-        "216031593": "Kialla",
-        "216031594": "Shepparton - South East",
-        "216031418": "Shepparton Surrounds - East",
-        "216031419": "Shepparton Surrounds - West",
-        "217011420": "Glenelg (Vic.)",
-        "217011421": "Hamilton (Vic.)",
-        "217011422": "Portland",
-        "217011423": "Southern Grampians",
-        "217031471": "Camperdown",
-        "217031472": "Colac",
-        "217031473": "Colac Surrounds",
-        "217031474": "Corangamite - North",
-        "217031475": "Corangamite - South",
-        "217031476": "Otway",
-        "217041477": "Moyne - East",
-        "217041478": "Moyne - West",
-        "217041479": "Warrnambool - North",
-        "217041480": "Warrnambool - South",
-        "297979799": "Migratory - Offshore - Shipping (Vic.)",
-        "299999499": "No usual address (Vic.)",
-        "301011001": "Alexandra Hills",
-        "301011002": "Belmont - Gumdale",
-        "301011003": "Birkdale",
-        "301011004": "Capalaba",
-        "301011005": "Thorneside",
-        "301011006": "Wellington Point",
-        "301021007": "Cleveland",
-        "301021008": "Ormiston",
-        "301021009": "Redland Bay",
-        "301021011": "Sheldon - Mount Cotton",
-        "301021012": "Thornlands",
-        "301021013": "Victoria Point",
-        "301021550": "North Stradbroke Island",
-        "301021551": "Southern Moreton Bay Islands",
-        "301031014": "Brisbane Port - Lytton",
-        "301031015": "Manly - Lota",
-        "301031016": "Manly West",
-        "301031017": "Murarrie",
-        "301031018": "Tingalpa",
-        "301031019": "Wakerley",
-        "301031020": "Wynnum",
-        "301031021": "Wynnum West - Hemmant",
-        "302011022": "Bald Hills",
-        "302011023": "Bridgeman Downs",
-        "302011024": "Carseldine",
-        "302011025": "Everton Park",
-        "302011026": "McDowall",
-        "302021027": "Aspley",
-        "302021028": "Chermside",
-        "302021029": "Chermside West",
-        "302021030": "Geebung",
-        "302021031": "Kedron - Gordon Park",
-        "302021032": "Stafford",
-        "302021033": "Stafford Heights",
-        "302021034": "Wavell Heights",
-        "302031035": "Boondall",
-        "302031036": "Brisbane Airport",
-        "302031039": "Nudgee - Banyo",
-        "302031037": "Eagle Farm - Pinkenba",
-        "302031038": "Northgate - Virginia",
-        "302031040": "Nundah",
-        "302041041": "Bracken Ridge",
-        "302041042": "Brighton (Qld)",
-        "302041043": "Deagon",
-        "302041044": "Sandgate - Shorncliffe",
-        "302041045": "Taigum - Fitzgibbon",
-        "302041046": "Zillmere",
-        "303011047": "Camp Hill",
-        "303011048": "Cannon Hill",
-        "303011049": "Carina",
-        "303011050": "Carina Heights",
-        "303011051": "Carindale",
-        "303021052": "Annerley",
-        "303021053": "Coorparoo",
-        "303021054": "Fairfield - Dutton Park",
-        "303021055": "Greenslopes",
-        "303021056": "Holland Park",
-        "303021057": "Holland Park West",
-        "303021058": "Woolloongabba",
-        "303021059": "Yeronga",
-        "303031060": "Eight Mile Plains",
-        "303031061": "Macgregor (Qld)",
-        "303031062": "Mansfield (Qld)",
-        "303031063": "Mount Gravatt",
-        "303031064": "Rochedale - Burbank",
-        "303031065": "Upper Mount Gravatt",
-        "303031066": "Wishart",
-        "303041067": "Coopers Plains",
-        "303041068": "Moorooka",
-        "303041069": "Robertson",
-        "303041070": "Salisbury - Nathan",
-        "303041071": "Tarragindi",
-        "303051072": "Algester",
-        "303051073": "Calamvale - Stretton",
-        "303051074": "Pallara - Willawong",
-        "303051075": "Parkinson - Drewvale",
-        "303051076": "Rocklea - Acacia Ridge",
-        "303061077": "Kuraby",
-        "303061078": "Runcorn",
-        "303061079": "Sunnybank",
-        "303061080": "Sunnybank Hills",
-        "304011081": "Jindalee - Mount Ommaney",
-        "304011082": "Middle Park - Jamboree Heights",
-        "304011083": "Riverhills",
-        "304011084": "Seventeen Mile Rocks - Sinnamon Park",
-        "304011085": "Westlake",
-        "304021086": "Bellbowrie - Moggill",
-        "304021087": "Brookfield - Kenmore Hills",
-        "304021088": "Chapel Hill",
-        "304021089": "Fig Tree Pocket",
-        "304021090": "Kenmore",
-        "304021091": "Pinjarra Hills - Pullenvale",
-        "304031092": "Chelmer - Graceville",
-        "304031093": "Corinda",
-        "304031094": "Indooroopilly",
-        "304031095": "Sherwood",
-        "304031096": "St Lucia",
-        "304031097": "Taringa",
-        "304041098": "Enoggera",
-        "304041099": "Enoggera Reservoir",
-        "304041100": "Keperra",
-        "304041101": "Mitchelton",
-        "304041102": "Mount Coot-tha",
-        "304041103": "The Gap",
-        "304041104": "Upper Kedron - Ferny Grove",
-        "305011105": "Brisbane City",
-        "305011106": "Fortitude Valley",
-        "305011107": "Highgate Hill",
-        "305011108": "Kangaroo Point",
-        "305011109": "New Farm",
-        "305011110": "South Brisbane",
-        "305011111": "Spring Hill",
-        "305011112": "West End",
-        "305021113": "Balmoral",
-        "305021114": "Bulimba",
-        "305021115": "East Brisbane",
-        "305021116": "Hawthorne",
-        "305021117": "Morningside - Seven Hills",
-        "305021118": "Norman Park",
-        "305031119": "Albion",
-        "305031120": "Alderley",
-        "305031121": "Ascot",
-        "305031122": "Clayfield",
-        "305031123": "Grange",
-        "305031124": "Hamilton (Qld)",
-        "305031125": "Hendra",
-        "305031126": "Kelvin Grove - Herston",
-        "305031127": "Newmarket",
-        "305031128": "Newstead - Bowen Hills",
-        "305031129": "Wilston",
-        "305031130": "Windsor",
-        "305031131": "Wooloowin - Lutwyche",
-        "305041132": "Ashgrove",
-        "305041133": "Auchenflower",
-        "305041134": "Bardon",
-        "305041135": "Paddington - Milton",
-        "305041136": "Red Hill (Qld)",
-        "305041137": "Toowong",
-        "306011138": "Brinsmead",
-        "306011139": "Clifton Beach - Kewarra Beach",
-        "306011140": "Freshwater - Stratford",
-        "306011141": "Redlynch",
-        "306011142": "Trinity Beach - Smithfield",
-        "306011143": "Yorkeys Knob - Machans Beach",
-        "306021144": "Bentley Park",
-        "306021145": "Cairns City",
-        "306021146": "Earlville - Bayview Heights",
-        "306021147": "Edmonton",
-        "306021148": "Gordonvale - Trinity",
-        "306021149": "Kanimbla - Mooroobool",
-        "306021150": "Lamb Range",
-        "306021151": "Manoora",
-        "306021152": "Manunda",
-        "306021153": "Mount Sheridan",
-        "306021154": "Westcourt - Bungalow",
-        "306021155": "White Rock",
-        "306021156": "Whitfield - Edge Hill",
-        "306021157": "Woree",
-        "306031158": "Babinda",
-        "306031159": "Innisfail",
-        "306031160": "Johnstone",
-        "306031161": "Tully",
-        "306031162": "Wooroonooran",
-        "306031163": "Yarrabah",
-        "306041164": "Daintree",
-        "306041165": "Port Douglas",
-        "306051166": "Atherton",
-        "306051167": "Herberton",
-        "306051168": "Kuranda",
-        "306051169": "Malanda - Yungaburra",
-        "306051170": "Mareeba",
-        "307011171": "Balonne",
-        "307011172": "Chinchilla",
-        "307011173": "Goondiwindi",
-        "307011174": "Inglewood - Waggamba",
-        "307011175": "Miles - Wandoan",
-        "307011176": "Roma",
-        "307011177": "Roma Surrounds",
-        "307011178": "Tara",
-        "307021179": "Crows Nest - Rosalie",
-        "307021180": "Jondaryan",
-        "307021181": "Millmerran",
-        "307021182": "Pittsworth",
-        "307021183": "Wambo",
-        "307031184": "Clifton - Greenmount",
-        "307031185": "Southern Downs - East",
-        "307031186": "Southern Downs - West",
-        "307031187": "Stanthorpe",
-        "307031188": "Stanthorpe Surrounds",
-        "307031189": "Warwick",
-        "308011190": "Central Highlands - East",
-        "308011191": "Central Highlands - West",
-        "308011192": "Emerald",
-        "308031205": "Berserker",
-        "308031206": "Bouldercombe",
-        "308031207": "Emu Park",
-        "308031208": "Frenchville - Mount Archer",
-        "308031209": "Glenlee - Rockyview",
-        "308031210": "Gracemere",
-        "308031211": "Lakes Creek",
-        "308031212": "Mount Morgan",
-        "308031213": "Norman Gardens",
-        "308031214": "Park Avenue",
-        "308031215": "Parkhurst - Kawana",
-        "308031216": "Rockhampton - West",
-        "308031217": "Rockhampton City",
-        "308031218": "Rockhampton Surrounds - East",
-        "308031219": "Rockhampton Surrounds - North",
-        "308031220": "Rockhampton Surrounds - West",
-        "308031221": "Shoalwater Bay",
-        "308031222": "The Range - Allenstown",
-        "308031223": "Yeppoon",
-        "308041528": "Banana",
-        "308041529": "Biloela",
-        "308051530": "Agnes Water - Miriam Vale",
-        "308051531": "Boyne Island - Tannum Sands",
-        "308051532": "Callemondah",
-        "308051533": "Clinton - New Auckland",
-        "308051534": "Gladstone",
-        "308051535": "Gladstone Hinterland",
-        "308051536": "Kin Kora - Sun Valley",
-        "308051537": "South Trees",
-        "308051538": "Telina - Toolooa",
-        "308051539": "West Gladstone",
-        "309011224": "Broadbeach Waters",
-        "309011225": "Burleigh Heads",
-        "309011226": "Burleigh Waters",
-        "309011227": "Mermaid Beach - Broadbeach",
-        "309011228": "Mermaid Waters",
-        "309011229": "Miami",
-        "309021230": "Coolangatta",
-        "309021231": "Currumbin - Tugun",
-        "309021232": "Currumbin Waters",
-        "309021233": "Elanora",
-        "309021234": "Palm Beach",
-        "309031235": "Arundel",
-        "309031236": "Biggera Waters",
-        "309031237": "Coombabah",
-        "309031238": "Labrador",
-        "309031239": "Paradise Point - Hollywell",
-        "309031240": "Runaway Bay",
-        "309041241": "Guanaba - Springbrook",
-        "309041242": "Tamborine - Canungra",
-        "309051243": "Currumbin Valley - Tallebudgera",
-        "309051244": "Mudgeeraba - Bonogin",
-        "309051245": "Reedy Creek - Andrews",
-        "309061246": "Carrara",
-        "309061247": "Highland Park",
-        "309061248": "Nerang - Mount Nathan",
-        "309061249": "Pacific Pines - Gaven",
-        "309061250": "Worongary - Tallai",
-        "309071251": "Coomera",
-        "309071252": "Helensvale",
-        "309071253": "Hope Island",
-        "309071254": "Jacobs Well - Alberton",
-        "309071552": "Ormeau (East) - Stapylton",
-        "309071553": "Ormeau (West) - Yatala",
-        "309071256": "Oxenford - Maudsland",
-        "309071554": "Pimpama - North",
-        "309071555": "Pimpama - South",
-        "309071558": "Willow Vale - Pimpama (West)",
-        "309071556": "Upper Coomera (South) - Wongawallan",
-        "309071557": "Upper Coomera - North",
-        "309081259": "Clear Island Waters",
-        "309081260": "Merrimac",
-        "309081559": "Robina - East",
-        "309081560": "Robina - West",
-        "309081262": "Varsity Lakes",
-        "309091263": "Ashmore",
-        "309091264": "Molendinar",
-        "309091265": "Parkwood",
-        "309091540": "Southport - North",
-        "309091541": "Southport - South",
-        "309101267": "Benowa",
-        "309101268": "Bundall",
-        "309101269": "Main Beach",
-        "309101561": "Surfers Paradise - North",
-        "309101562": "Surfers Paradise - South",
-        "310011271": "Darra - Sumner",
-        "310011272": "Durack",
-        "310011563": "Doolandella",
-        "310011564": "Forest Lake - Ellen Grove",
-        "310011274": "Inala - Richlands",
-        "310011275": "Oxley (Qld)",
-        "310011276": "Wacol",
-        "310021277": "Boonah",
-        "310021278": "Esk",
-        "310021279": "Lake Manchester - England Creek",
-        "310021280": "Lockyer Valley - East",
-        "310021281": "Lowood",
-        "310021282": "Rosewood",
-        "310031283": "Brassall",
-        "310031284": "Bundamba",
-        "310031285": "Churchill - Yamanto",
-        "310031286": "Ipswich - Central",
-        "310031287": "Ipswich - East",
-        "310031288": "Ipswich - North",
-        "310031289": "Karalee - Barellan Point",
-        "310031290": "Karana Downs",
-        "310031291": "Leichhardt - One Mile",
-        "310031292": "North Ipswich - Tivoli",
-        "310031293": "Raceview",
-        "310031294": "Ripley",
-        "310031295": "Riverview",
-        "310041565": "Augustine Heights - Brookwater",
-        "310041566": "Bellbird Park",
-        "310041297": "Camira - Gailes",
-        "310041298": "Carole Park",
-        "310041299": "Collingwood Park - Redbank",
-        "310041300": "Goodna",
-        "310041301": "New Chum",
-        "310041302": "Redbank Plains",
-        "310041303": "Springfield",
-        "310041304": "Springfield Lakes",
-        "311011305": "Beaudesert",
-        "311021306": "Beenleigh",
-        "311021307": "Eagleby",
-        "311021308": "Edens Landing - Holmview",
-        "311021309": "Mount Warren Park",
-        "311021310": "Wolffdene - Bahrs Scrub",
-        "311031311": "Boronia Heights - Park Ridge",
-        "311031312": "Browns Plains",
-        "311031313": "Chambers Flat - Logan Reserve",
-        "311031314": "Crestmead",
-        "311031315": "Greenbank Military Camp",
-        "311031316": "Hillcrest",
-        "311031317": "Marsden",
-        "311031318": "Munruben - Park Ridge South",
-        "311031319": "Regents Park - Heritage Park",
-        "311041568": "Flagstone (West) - New Beith",
-        "311041569": "Greenbank - North Maclean",
-        "311041567": "Flagstone (East) - Riverbend",
-        "311041570": "Jimboomba - Glenlogan",
-        "311041571": "Yarrabilba",
-        "311041322": "Logan Village",
-        "311051323": "Bethania - Waterford",
-        "311051324": "Cornubia - Carbrook",
-        "311051325": "Loganholme - Tanah Merah",
-        "311051326": "Loganlea",
-        "311051327": "Shailer Park",
-        "311051328": "Waterford West",
-        "311061329": "Daisy Hill",
-        "311061330": "Kingston (Qld)",
-        "311061331": "Logan Central",
-        "311061332": "Rochedale South - Priestdale",
-        "311061333": "Slacks Creek",
-        "311061334": "Springwood",
-        "311061335": "Underwood",
-        "311061336": "Woodridge",
-        "312011337": "Bowen",
-        "312011338": "Broadsound - Nebo",
-        "312011339": "Clermont",
-        "312011340": "Collinsville",
-        "312011341": "Moranbah",
-        "312021342": "Andergrove - Beaconsfield",
-        "312021343": "East Mackay",
-        "312021344": "Eimeo - Rural View",
-        "312021345": "Eungella Hinterland",
-        "312021346": "Mackay",
-        "312021347": "Mackay Harbour",
-        "312021348": "Mount Pleasant - Glenella",
-        "312021349": "North Mackay",
-        "312021350": "Ooralea - Bakers Creek",
-        "312021351": "Pioneer Valley",
-        "312021352": "Sarina",
-        "312021353": "Seaforth - Calen",
-        "312021354": "Shoal Point - Bucasia",
-        "312021355": "Slade Point",
-        "312021356": "South Mackay",
-        "312021357": "Walkerston - Eton",
-        "312021358": "West Mackay",
-        "312031359": "Airlie - Whitsundays",
-        "312031360": "Cape Conway",
-        "312031361": "Proserpine",
-        "313011362": "Beachmere - Sandstone Point",
-        "313011363": "Bribie Island",
-        "313021364": "Burpengary - East",
-        "313021572": "Caboolture - East",
-        "313021573": "Caboolture - West",
-        "313021366": "Caboolture - South",
-        "313021367": "Elimbah",
-        "313021368": "Morayfield - East",
-        "313021369": "Wamuran",
-        "313031370": "Kilcoy",
-        "313031371": "Woodford - D'Aguilar",
-        "313041372": "Burpengary",
-        "313041373": "Deception Bay",
-        "313041374": "Morayfield",
-        "313041375": "Narangba",
-        "313041376": "Upper Caboolture",
-        "313051377": "Clontarf",
-        "313051378": "Margate - Woody Point",
-        "313051379": "Redcliffe",
-        "313051380": "Rothwell - Kippa-Ring",
-        "313051574": "Moreton Island",
-        "313051575": "Scarborough - Newport",
-        "314011382": "Albany Creek",
-        "314011383": "Cashmere",
-        "314011384": "Dayboro",
-        "314011385": "Eatons Hill",
-        "314011386": "The Hills District",
-        "314011387": "Samford Valley",
-        "314021576": "Dakabin",
-        "314021577": "Kallangur",
-        "314021389": "Murrumba Downs - Griffin",
-        "314021578": "Mango Hill",
-        "314021579": "North Lakes",
-        "314031391": "Bray Park",
-        "314031392": "Lawnton",
-        "314031393": "Petrie",
-        "314031394": "Strathpine - Brendale",
-        "315011395": "Aurukun",
-        "315011396": "Cape York",
-        "315021404": "Carpentaria",
-        "315011397": "Croydon - Etheridge",
-        "315011398": "Kowanyama - Pormpuraaw",
-        "315011399": "Northern Peninsula",
-        "315011400": "Tablelands",
-        "315011401": "Torres",
-        "315011402": "Torres Strait Islands",
-        "315011403": "Weipa",
-        "315021405": "Mount Isa",
-        "315021406": "Mount Isa Surrounds",
-        "315021407": "Northern Highlands",
-        "315031408": "Barcaldine - Blackall",
-        "315031409": "Charleville",
-        "315031410": "Far Central West",
-        "315031411": "Far South West",
-        "315031412": "Longreach",
-        "316011413": "Buderim - North",
-        "316011414": "Buderim - South",
-        "316011415": "Mountain Creek",
-        "316011416": "Sippy Downs",
-        "316021417": "Aroona - Currimundi",
-        "316021418": "Buddina - Minyama",
-        "316021419": "Caloundra - Kings Beach",
-        "316021424": "Wurtulla - Birtinya",
-        "316021580": "Caloundra West - Baringa",
-        "316021581": "Meridan Plains - Little Mountain (North)",
-        "316021421": "Golden Beach - Pelican Waters",
-        "316021422": "Moffat Beach - Battery Hill",
-        "316021423": "Parrearra - Warana",
-        "316031425": "Coolum Beach",
-        "316031426": "Marcoola - Mudjimba",
-        "316031427": "Maroochydore - Kuluin",
-        "316031428": "Mooloolaba - Alexandra Headland",
-        "316051434": "Noosa Heads",
-        "316051435": "Noosaville",
-        "316051437": "Sunshine Beach",
-        "316051438": "Tewantin",
-        "316051543": "Peregian Beach - Marcus Beach",
-        "316051544": "Peregian Springs",
-        "316061439": "Beerwah",
-        "316061440": "Caloundra Hinterland",
-        "316061441": "Glass House Mountains",
-        "316061442": "Landsborough",
-        "316061443": "Maroochy Hinterland",
-        "316061444": "Palmwoods",
-        "316071545": "Bli Bli",
-        "316071546": "Diddillibah - Rosemount",
-        "316071547": "Eumundi - Yandina",
-        "316071548": "Nambour",
-        "316081549": "Noosa Hinterland",
-        "317011445": "Cambooya - Wyreema",
-        "317011446": "Darling Heights",
-        "317011447": "Drayton - Harristown",
-        "317011448": "Gatton",
-        "317011449": "Gowrie (Qld)",
-        "317011450": "Highfields",
-        "317011451": "Lockyer Valley - West",
-        "317011452": "Middle Ridge",
-        "317011453": "Newtown (Qld)",
-        "317011454": "North Toowoomba - Harlaxton",
-        "317011455": "Rangeville",
-        "317011456": "Toowoomba - Central",
-        "317011457": "Toowoomba - East",
-        "317011458": "Toowoomba - West",
-        "317011459": "Wilsonton",
-        "318011460": "Ayr",
-        "318011461": "Burdekin",
-        "318011462": "Charters Towers",
-        "318011463": "Dalrymple",
-        "318011464": "Ingham",
-        "318011465": "Ingham Surrounds",
-        "318011466": "Palm Island",
-        "318021467": "Aitkenvale",
-        "318021468": "Annandale (Qld)",
-        "318021469": "Belgian Gardens - Pallarenda",
-        "318021470": "Bohle Plains",
-        "318021471": "Condon - Rasmussen",
-        "318021472": "Cranbrook",
-        "318021582": "Burdell - Mount Low",
-        "318021583": "Deeragun - Jensen",
-        "318021474": "Douglas",
-        "318021475": "Garbutt - West End",
-        "318021476": "Gulliver - Currajong - Vincent",
-        "318021477": "Heatley",
-        "318021478": "Hermit Park - Rosslea",
-        "318021479": "Hyde Park - Pimlico",
-        "318021480": "Kelso",
-        "318021481": "Kirwan - East",
-        "318021482": "Kirwan - West",
-        "318021483": "Magnetic Island",
-        "318021484": "Mount Louisa",
-        "318021485": "Mundingburra",
-        "318021486": "Northern Beaches",
-        "318021487": "Oonoonba",
-        "318021488": "South Townsville - Railway Estate",
-        "318021489": "Townsville - South",
-        "318021490": "Townsville City - North Ward",
-        "318021491": "Wulguru - Roseneath",
-        "319011492": "Ashfield - Kepnock",
-        "319011493": "Bargara - Burnett Heads",
-        "319011494": "Branyan - Kensington",
-        "319011495": "Bundaberg",
-        "319011496": "Bundaberg East - Kalkie",
-        "319011497": "Bundaberg North - Gooburrum",
-        "319011498": "Bundaberg Surrounds - North",
-        "319011499": "Bundaberg Surrounds - South",
-        "319011500": "Millbank - Avoca",
-        "319011501": "Svensson Heights - Norville",
-        "319011502": "Walkervale - Avenell Heights",
-        "319021503": "Gayndah - Mundubbera",
-        "319021504": "Gin Gin",
-        "319021505": "Kingaroy",
-        "319021506": "Kingaroy Surrounds - North",
-        "319021507": "Kingaroy Surrounds - South",
-        "319021508": "Monto - Eidsvold",
-        "319021509": "Nanango",
-        "319021510": "North Burnett",
-        "319031511": "Cooloola",
-        "319031512": "Gympie - North",
-        "319031513": "Gympie - South",
-        "319031514": "Gympie Surrounds",
-        "319031515": "Kilkivan",
-        "319041516": "Booral - River Heads",
-        "319041517": "Craignish - Dundowran Beach",
-        "319041518": "Pialba - Eli Waters",
-        "319041519": "Point Vernon",
-        "319041520": "Torquay - Scarness - Kawungan",
-        "319041521": "Urangan - Wondunna",
-        "319051522": "Burrum - Fraser",
-        "319051523": "Granville",
-        "319051524": "Maryborough (Qld)",
-        "319051525": "Maryborough Surrounds - South",
-        "319051526": "Tinana",
-        "397979799": "Migratory - Offshore - Shipping (Qld)",
-        "399999499": "No usual address (Qld)",
-        "401011001": "Adelaide",
-        "401011002": "North Adelaide",
-        "401021003": "Adelaide Hills",
-        "401021004": "Aldgate - Stirling",
-        "401021005": "Hahndorf - Echunga",
-        "401021006": "Lobethal - Woodside",
-        "401021007": "Mount Barker",
-        "401021008": "Mount Barker Surrounds",
-        "401021009": "Nairne",
-        "401021010": "Uraidla - Summertown",
-        "401031011": "Burnside - Wattle Park",
-        "401031012": "Beaumont - Glen Osmond",
-        "401031013": "Toorak Gardens",
-        "401041014": "Athelstone",
-        "401041015": "Paradise - Newton",
-        "401041016": "Rostrevor - Magill",
-        "401051017": "Norwood (SA)",
-        "401051018": "Payneham - Felixstow",
-        "401051019": "St Peters - Marden",
-        "401061020": "Nailsworth - Broadview",
-        "401061021": "Prospect",
-        "401061022": "Walkerville",
-        "401071023": "Goodwood - Millswood",
-        "401071024": "Unley - Parkside",
-        "402011025": "Gawler - North",
-        "402011026": "Gawler - South",
-        "402011027": "Lewiston - Two Wells",
-        "402021028": "Craigmore - Blakeview",
-        "402021029": "Davoren Park",
-        "402021030": "Elizabeth",
-        "402021031": "Elizabeth East",
-        "402021032": "Munno Para West - Angle Vale",
-        "402021033": "One Tree Hill",
-        "402021034": "Smithfield - Elizabeth North",
-        "402021035": "Virginia - Waterloo Corner",
-        "402031036": "Enfield - Blair Athol",
-        "402031175": "Northgate - Northfield",
-        "402031176": "Valley View - Gilles Plains",
-        "402031038": "Windsor Gardens",
-        "402041039": "Dry Creek - North",
-        "402041040": "Ingle Farm",
-        "402041041": "Para Hills",
-        "402041042": "Parafield",
-        "402041043": "Parafield Gardens",
-        "402041044": "Paralowie",
-        "402041046": "Salisbury",
-        "402041047": "Salisbury East",
-        "402041048": "Salisbury North",
-        "402041171": "Mawson Lakes - Globe Derby Park",
-        "402041172": "Pooraka - Cavan",
-        "402051049": "Golden Grove",
-        "402051050": "Greenwith",
-        "402051051": "Highbury - Dernancourt",
-        "402051052": "Hope Valley - Modbury",
-        "402051053": "Modbury Heights",
-        "402051054": "Redwood Park",
-        "402051055": "St Agnes - Ridgehaven",
-        "403011056": "Brighton (SA)",
-        "403011057": "Glenelg (SA)",
-        "403021058": "Edwardstown",
-        "403021059": "Hallett Cove",
-        "403021060": "Marino - Seaview Downs",
-        "403021061": "Mitchell Park",
-        "403021062": "Morphettville",
-        "403021063": "Sheidow Park - Trott Park",
-        "403021064": "Warradale",
-        "403031065": "Belair",
-        "403031066": "Bellevue Heights",
-        "403031067": "Blackwood",
-        "403031068": "Colonel Light Gardens",
-        "403031069": "Mitcham (SA)",
-        "403031070": "Panorama",
-        "403041071": "Aberfoyle Park",
-        "403041072": "Aldinga",
-        "403041073": "Christie Downs",
-        "403041074": "Christies Beach",
-        "403041075": "Clarendon",
-        "403041076": "Coromandel Valley",
-        "403041077": "Flagstaff Hill",
-        "403041078": "Hackham - Onkaparinga Hills",
-        "403041079": "Hackham West - Huntfield Heights",
-        "403041080": "Happy Valley",
-        "403041081": "Happy Valley Reservoir",
-        "403041082": "Lonsdale",
-        "403041083": "McLaren Vale",
-        "403041084": "Morphett Vale - East",
-        "403041085": "Morphett Vale - West",
-        "403041086": "Reynella",
-        "403041177": "Seaford - Seaford Meadows",
-        "403041178": "Seaford Rise - Moana",
-        "403041088": "Willunga",
-        "403041089": "Woodcroft",
-        "404011090": "Beverley",
-        "404011091": "Flinders Park",
-        "404011092": "Henley Beach",
-        "404011093": "Hindmarsh - Brompton",
-        "404011094": "Royal Park - Hendon - Albert Park",
-        "404011095": "Seaton - Grange",
-        "404011096": "West Lakes",
-        "404011097": "Woodville - Cheltenham",
-        "404021098": "Dry Creek - South",
-        "404021099": "Largs Bay - Semaphore",
-        "404021100": "North Haven",
-        "404021101": "Port Adelaide",
-        "404021102": "The Parks",
-        "404021103": "Torrens Island",
-        "404031104": "Adelaide Airport",
-        "404031105": "Fulham",
-        "404031106": "Lockleys",
-        "404031107": "Plympton",
-        "404031108": "Richmond (SA)",
-        "404031109": "West Beach",
-        "405011110": "Barossa - Angaston",
-        "405011111": "Light",
-        "405011112": "Lyndoch",
-        "405011113": "Mallala",
-        "405011114": "Nuriootpa",
-        "405011115": "Tanunda",
-        "405021116": "Clare",
-        "405021117": "Gilbert Valley",
-        "405021118": "Goyder",
-        "405021119": "Wakefield - Barunga West",
-        "405031120": "Jamestown",
-        "405031121": "Peterborough - Mount Remarkable",
-        "405031122": "Port Pirie",
-        "405031123": "Port Pirie Surrounds",
-        "405041124": "Kadina",
-        "405041125": "Moonta",
-        "405041126": "Wallaroo",
-        "405041127": "Yorke Peninsula - North",
-        "405041128": "Yorke Peninsula - South",
-        "406011129": "Ceduna",
-        "406011130": "Eyre Peninsula",
-        "406011131": "Kimba - Cleve - Franklin Harbour",
-        "406011132": "Le Hunte - Elliston",
-        "406011133": "Port Lincoln",
-        "406011134": "West Coast (SA)",
-        "406011135": "Western",
-        "406011136": "Whyalla",
-        "406011137": "Whyalla - North",
-        "406021138": "APY Lands",
-        "406021139": "Coober Pedy",
-        "406021140": "Quorn - Lake Gilles",
-        "406021141": "Outback",
-        "406021142": "Port Augusta",
-        "406021143": "Roxby Downs",
-        "407011144": "Goolwa - Port Elliot",
-        "407011145": "Kangaroo Island",
-        "407011146": "Strathalbyn",
-        "407011147": "Strathalbyn Surrounds",
-        "407011148": "Victor Harbor",
-        "407011149": "Yankalilla",
-        "407021150": "Grant",
-        "407021151": "Kingston - Robe",
-        "407021152": "Millicent",
-        "407021154": "Naracoorte",
-        "407021155": "Naracoorte Surrounds",
-        "407021156": "Penola",
-        "407021157": "Tatiara",
-        "407021158": "Wattle Range",
-        "407021173": "Mount Gambier - East",
-        "407021174": "Mount Gambier - West",
-        "407031159": "Barmera",
-        "407031160": "Berri",
-        "407031161": "Karoonda - Lameroo",
-        "407031162": "Loxton",
-        "407031163": "Loxton Surrounds",
-        "407031164": "Mannum",
-        "407031165": "Murray Bridge",
-        "407031166": "Murray Bridge Surrounds",
-        "407031167": "Renmark",
-        "407031168": "Renmark Surrounds",
-        "407031169": "The Coorong",
-        "407031170": "Waikerie",
-        "497979799": "Migratory - Offshore - Shipping (SA)",
-        "499999499": "No usual address (SA)",
-        "501011001": "Augusta",
-        "501011293": "Busselton - East",
-        "501011294": "Busselton - West",
-        "501011003": "Busselton Surrounds",
-        "501011004": "Margaret River",
-        "501021005": "Australind - Leschenault",
-        "501021007": "Capel",
-        "501021008": "College Grove - Carey Park",
-        "501021009": "Collie",
-        "501021010": "Dardanup",
-        "501021011": "Davenport",
-        "501021012": "Eaton - Pelican Point",
-        "501021014": "Harvey",
-        "501021015": "East Bunbury - Glen Iris",
-        "501021016": "Waroona",
-        "501021251": "Dalyellup",
-        "501021252": "Gelorup - Stratham",
-        "501021253": "South Bunbury - Bunbury",
-        "501021254": "Withers - Usher",
-        "501031017": "Bridgetown - Boyup Brook",
-        "501031018": "Donnybrook - Balingup",
-        "501031019": "Manjimup",
-        "501031020": "Pemberton",
-        "502011021": "Dawesville - Bouvard",
-        "502011022": "Falcon - Wannanup",
-        "502011023": "Greenfields",
-        "502011024": "Halls Head - Erskine",
-        "502011025": "Mandurah",
-        "502011026": "Mandurah - East",
-        "502011027": "Mandurah - North",
-        "502011028": "Mandurah - South",
-        "502011029": "Pinjarra",
-        "503011030": "City Beach",
-        "503011031": "Claremont (WA)",
-        "503011032": "Cottesloe",
-        "503011033": "Floreat",
-        "503011034": "Mosman Park - Peppermint Grove",
-        "503011035": "Nedlands - Dalkeith - Crawley",
-        "503011036": "Swanbourne - Mount Claremont",
-        "503021037": "Kings Park (WA)",
-        "503021038": "Mount Hawthorn - Leederville",
-        "503021039": "Mount Lawley - Inglewood",
-        "503021040": "North Perth",
-        "503021295": "East Perth",
-        "503021296": "Perth (North) - Highgate",
-        "503021297": "Perth (West) - Northbridge",
-        "503021042": "Subiaco - Shenton Park",
-        "503021043": "Wembley - West Leederville - Glendalough",
-        "504011044": "Bassendean - Eden Hill - Ashfield",
-        "504011045": "Bayswater - Embleton - Bedford",
-        "504011046": "Maylands",
-        "504011047": "Morley",
-        "504011048": "Noranda",
-        "504021049": "Chidlow",
-        "504021050": "Glen Forrest - Darlington",
-        "504021051": "Helena Valley - Koongamia",
-        "504021052": "Malmalling - Reservoir",
-        "504021053": "Mundaring",
-        "504021054": "Swan View - Greenmount - Midvale",
-        "504031055": "Avon Valley National Park",
-        "504031056": "Ballajura",
-        "504031057": "Beechboro",
-        "504031058": "Bullsbrook",
-        "504031298": "Aveley",
-        "504031299": "Brabham - Henley Brook",
-        "504031300": "Ellenbrook",
-        "504031060": "Gidgegannup",
-        "504031061": "Hazelmere - Guildford",
-        "504031062": "Lockridge - Kiara",
-        "504031063": "Malaga",
-        "504031064": "Melaleuca - Lexia",
-        "504031065": "Middle Swan - Herne Hill",
-        "504031066": "Midland - Guildford",
-        "504031067": "Stratton - Jane Brook",
-        "504031068": "The Vines",
-        "504031069": "Walyunga National Park",
-        "505011070": "Craigie - Beldon",
-        "505011071": "Currambine - Kinross",
-        "505011072": "Duncraig",
-        "505011073": "Greenwood - Warwick",
-        "505011074": "Heathridge - Connolly",
-        "505011075": "Hillarys",
-        "505011076": "Iluka - Burns Beach",
-        "505011077": "Joondalup - Edgewater",
-        "505011078": "Kingsley",
-        "505011079": "Mullaloo - Kallaroo",
-        "505011080": "Ocean Reef",
-        "505011081": "Padbury",
-        "505011082": "Sorrento - Marmion",
-        "505011083": "Woodvale",
-        "505021084": "Balcatta - Hamersley",
-        "505021085": "Balga - Mirrabooka",
-        "505021301": "Dianella - North",
-        "505021302": "Dianella - South",
-        "505021087": "Herdsman",
-        "505021088": "Innaloo - Doubleview",
-        "505021089": "Karrinyup - Gwelup - Carine",
-        "505021090": "Nollamara - Westminster",
-        "505021091": "Osborne Park Industrial",
-        "505021092": "Scarborough",
-        "505021093": "Stirling - Osborne Park",
-        "505021094": "Trigg - North Beach - Watermans Bay",
-        "505021095": "Tuart Hill - Joondanna",
-        "505021096": "Wembley Downs - Churchlands - Woodlands",
-        "505021097": "Yokine - Coolbinia - Menora",
-        "505031098": "Alexander Heights - Koondoola",
-        "505031099": "Butler - Merriwa - Ridgewood",
-        "505031100": "Carramar",
-        "505031101": "Clarkson",
-        "505031102": "Girrawheen",
-        "505031304": "Landsdale",
-        "505031305": "Madeley - Darch",
-        "505031104": "Marangaroo",
-        "505031105": "Mindarie - Quinns Rocks - Jindalee",
-        "505031106": "Neerabup National Park",
-        "505031107": "Tapping - Ashby - Sinagra",
-        "505031303": "Hocking - Pearsall",
-        "505031306": "Wanneroo - Sinagra",
-        "505031255": "Alkimos - Eglinton",
-        "505031256": "Carabooda - Pinjar",
-        "505031257": "Two Rocks",
-        "505031258": "Yanchep",
-        "506011110": "Armadale - Wungong - Brookdale",
-        "506011111": "Ashendon - Lesley",
-        "506011112": "Camillo - Champion Lakes",
-        "506011307": "Harrisdale",
-        "506011308": "Piara Waters - Forrestdale",
-        "506011114": "Kelmscott",
-        "506011115": "Mount Nasura - Mount Richon - Bedfordale",
-        "506011116": "Roleystone",
-        "506011117": "Seville Grove",
-        "506021118": "Belmont - Ascot - Redcliffe",
-        "506021119": "East Victoria Park - Carlisle",
-        "506021120": "Kewdale Commercial",
-        "506021121": "Perth Airport",
-        "506021309": "Cloverdale",
-        "506021310": "Kewdale",
-        "506021311": "Rivervale",
-        "506021123": "Victoria Park - Lathlain - Burswood",
-        "506031124": "Bentley - Wilson - St James",
-        "506031125": "Canning Vale - West",
-        "506031126": "Canning Vale Commercial",
-        "506031127": "Cannington - Queens Park",
-        "506031128": "Parkwood - Ferndale - Lynwood",
-        "506031129": "Riverton - Shelley - Rossmoyne",
-        "506031130": "Welshpool",
-        "506031131": "Willetton",
-        "506041132": "Beckenham - Kenwick - Langford",
-        "506041133": "Canning Vale - East",
-        "506041134": "Gosnells",
-        "506041135": "Huntingdale - Southern River",
-        "506041136": "Maddington - Orange Grove - Martin",
-        "506041137": "Thornlie",
-        "506051138": "Forrestfield - Wattle Grove",
-        "506051139": "High Wycombe",
-        "506051140": "Kalamunda - Maida Vale - Gooseberry Hill",
-        "506051141": "Lesmurdie - Bickley - Carmel",
-        "506061142": "Byford",
-        "506061143": "Mundijong",
-        "506061144": "Serpentine - Jarrahdale",
-        "506071145": "Como",
-        "506071146": "Manning - Waterford",
-        "506071147": "South Perth - Kensington",
-        "507011148": "Banjup",
-        "507011150": "Bibra Industrial",
-        "507011151": "Bibra Lake",
-        "507011152": "Coogee",
-        "507011153": "Coolbellup",
-        "507011154": "Hamilton Hill",
-        "507011155": "Henderson",
-        "507011158": "North Coogee",
-        "507011159": "South Lake - Cockburn Central",
-        "507011160": "Spearwood",
-        "507011161": "Success - Hammond Park",
-        "507011163": "Yangebup",
-        "507011259": "Beeliar - Wattleup",
-        "507011260": "Jandakot",
-        "507021164": "East Fremantle",
-        "507021165": "Fremantle",
-        "507021166": "Fremantle - South",
-        "507021167": "O'Connor (WA)",
-        "507031169": "Wellard (West) - Bertram",
-        "507031170": "Calista",
-        "507031172": "Hope Valley - Postans",
-        "507031173": "Kwinana Industrial",
-        "507031174": "Parmelia - Orelia",
-        "507031261": "Casuarina - Wandi",
-        "507041175": "Applecross - Ardross",
-        "507041176": "Bateman",
-        "507041177": "Bicton - Palmyra",
-        "507041178": "Booragoon",
-        "507041179": "Bull Creek",
-        "507041180": "Leeming",
-        "507041181": "Melville",
-        "507041182": "Murdoch - Kardinya",
-        "507041183": "Willagee",
-        "507041184": "Winthrop",
-        "507051312": "Baldivis - North",
-        "507051313": "Baldivis - South",
-        "507051314": "Karnup",
-        "507051186": "Cooloongup",
-        "507051187": "Port Kennedy",
-        "507051188": "Rockingham",
-        "507051189": "Rockingham Lakes",
-        "507051190": "Safety Bay - Shoalwater",
-        "507051191": "Singleton - Golden Bay - Secret Harbour",
-        "507051192": "Waikiki",
-        "507051193": "Warnbro",
-        "509011225": "Albany",
-        "509011226": "Albany Surrounds",
-        "509011227": "Bayonet Head - Lower King",
-        "509011228": "Denmark",
-        "509011229": "Gnowangerup",
-        "509011230": "Katanning",
-        "509011231": "Kojonup",
-        "509011232": "Little Grove - Elleker",
-        "509011233": "McKail - Willyung",
-        "509011234": "Plantagenet",
-        "509011235": "Stirling Range National Park",
-        "509021236": "Chittering",
-        "509021237": "Cunderdin",
-        "509021238": "Dowerin",
-        "509021239": "Gingin - Dandaragan",
-        "509021240": "Merredin",
-        "509021241": "Moora",
-        "509021242": "Mukinbudin",
-        "509021243": "Northam",
-        "509021244": "Toodyay",
-        "509021245": "York - Beverley",
-        "509031246": "Brookton",
-        "509031247": "Kulin",
-        "509031248": "Murray",
-        "509031249": "Narrogin",
-        "509031250": "Wagin",
-        "510011262": "Broome",
-        "510011263": "Derby - West Kimberley",
-        "510011264": "Halls Creek",
-        "510011265": "Kununurra",
-        "510011266": "Roebuck",
-        "510021267": "East Pilbara",
-        "510021268": "Newman",
-        "510021269": "Port Hedland",
-        "510021270": "South Hedland",
-        "510031271": "Ashburton (WA)",
-        "510031272": "Karratha",
-        "510031273": "Roebourne",
-        "511011274": "Esperance",
-        "511011275": "Esperance Surrounds",
-        "511021276": "Carnarvon",
-        "511021277": "Exmouth",
-        "511031278": "Boulder",
-        "511031279": "Kalgoorlie",
-        "511031280": "Kalgoorlie - North",
-        "511031281": "Kalgoorlie Airport",
-        "511031282": "Kambalda - Coolgardie - Norseman",
-        "511031283": "Leinster - Leonora",
-        "511031284": "Trafalgar (WA)",
-        "511041285": "Geraldton",
-        "511041286": "Geraldton - East",
-        "511041287": "Geraldton - North",
-        "511041288": "Geraldton - South",
-        "511041289": "Irwin",
-        "511041290": "Meekatharra",
-        "511041291": "Morawa",
-        "511041292": "Northampton - Mullewa - Greenough",
-        "597979799": "Migratory - Offshore - Shipping (WA)",
-        "599999499": "No usual address (WA)",
-        "601011001": "Bridgewater - Gagebrook",
-        "601011002": "Brighton - Pontville",
-        "601011003": "Old Beach - Otago",
-        "601021004": "Bellerive - Rosny",
-        "601021005": "Cambridge",
-        "601021006": "Geilston Bay - Risdon",
-        "601021007": "Howrah - Tranmere",
-        "601021008": "Lindisfarne - Rose Bay",
-        "601021009": "Mornington - Warrane",
-        "601021010": "Risdon Vale",
-        "601021011": "Rokeby",
-        "601021012": "South Arm",
-        "601031013": "Austins Ferry - Granton",
-        "601031014": "Berriedale - Chigwell",
-        "601031015": "Claremont (Tas.)",
-        "601031016": "Derwent Park - Lutana",
-        "601031017": "Glenorchy",
-        "601031018": "Montrose - Rosetta",
-        "601031019": "Moonah",
-        "601031020": "New Norfolk",
-        "601031021": "West Moonah",
-        "601041022": "Kingston - Huntingfield",
-        "601041023": "Kingston Beach - Blackmans Bay",
-        "601041024": "Margate - Snug",
-        "601041025": "Mount Wellington",
-        "601041026": "Taroona - Bonnet Hill",
-        "601051027": "Hobart",
-        "601051028": "Lenah Valley - Mount Stuart",
-        "601051029": "Mount Nelson - Dynnyrne",
-        "601051030": "New Town",
-        "601051031": "Sandy Bay",
-        "601051032": "South Hobart - Fern Tree",
-        "601051033": "West Hobart",
-        "601061034": "Dodges Ferry - Lewisham",
-        "601061035": "Sorell - Richmond",
-        "602011036": "Invermay",
-        "602011037": "Kings Meadows - Punchbowl",
-        "602011038": "Launceston",
-        "602011039": "Legana",
-        "602011040": "Mowbray",
-        "602011041": "Newnham - Mayfield",
-        "602011042": "Newstead",
-        "602011043": "Norwood (Tas.)",
-        "602011044": "Prospect Vale - Blackstone",
-        "602011045": "Ravenswood",
-        "602011046": "Riverside",
-        "602011047": "South Launceston",
-        "602011048": "Summerhill - Prospect",
-        "602011049": "Trevallyn",
-        "602011050": "Waverley - St Leonards",
-        "602011051": "West Launceston",
-        "602011052": "Youngtown - Relbia",
-        "602021053": "Beauty Point - Beaconsfield",
-        "602021054": "Deloraine",
-        "602021055": "Grindelwald - Lanena",
-        "602021056": "Hadspen - Carrick",
-        "602021057": "Westbury",
-        "602031058": "Dilston - Lilydale",
-        "602031059": "George Town",
-        "602031060": "Longford",
-        "602031061": "Northern Midlands",
-        "602031062": "Perth - Evandale",
-        "602031064": "St Helens - Scamander",
-        "602031099": "Flinders and Cape Barren Islands",
-        "602031100": "Scottsdale - Bridport",
-        "603011065": "Central Highlands",
-        "603011066": "Derwent Valley",
-        "603011067": "Southern Midlands",
-        "603011068": "Wilderness - East",
-        "603021069": "Bruny Island - Kettering",
-        "603021070": "Cygnet",
-        "603021071": "Geeveston - Dover",
-        "603021072": "Huonville - Franklin",
-        "603031073": "Forestier - Tasman",
-        "603031074": "Triabunna - Bicheno",
-        "604011075": "Acton - Upper Burnie",
-        "604011076": "Burnie - Ulverstone Surrounds",
-        "604011077": "Burnie - Wivenhoe",
-        "604011078": "Parklands - Camdale",
-        "604011079": "Penguin - Sulphur Creek",
-        "604011080": "Romaine - Havenview",
-        "604011081": "Somerset",
-        "604011082": "Ulverstone",
-        "604011083": "West Ulverstone",
-        "604011084": "Wynyard",
-        "604021085": "Devonport",
-        "604021086": "East Devonport",
-        "604021087": "Latrobe",
-        "604021088": "Miandetta - Don",
-        "604021089": "Port Sorell",
-        "604021090": "Quoiba - Spreyton",
-        "604021091": "Sheffield - Railton",
-        "604021092": "Turners Beach - Forth",
-        "604031093": "King Island",
-        "604031094": "North West",
-        "604031095": "Smithton",
-        "604031096": "Waratah",
-        "604031097": "West Coast (Tas.)",
-        "604031098": "Wilderness - West",
-        "697979799": "Migratory - Offshore - Shipping (Tas.)",
-        "699999499": "No usual address (Tas.)",
-        "701011001": "Darwin Airport",
-        "701011002": "Darwin City",
-        "701011003": "East Point",
-        "701011004": "Fannie Bay - The Gardens",
-        "701011005": "Larrakeyah",
-        "701011006": "Ludmilla - The Narrows",
-        "701011007": "Parap",
-        "701011008": "Stuart Park",
-        "701011009": "Woolner - Bayview - Winnellie",
-        "701021010": "Alawa",
-        "701021011": "Anula",
-        "701021012": "Berrimah",
-        "701021013": "Brinkin - Nakara",
-        "701021014": "Buffalo Creek",
-        "701021015": "Charles Darwin",
-        "701021016": "Coconut Grove",
-        "701021017": "East Arm",
-        "701021018": "Jingili",
-        "701021019": "Karama",
-        "701021020": "Leanyer",
-        "701021021": "Lyons (NT)",
-        "701021022": "Malak - Marrara",
-        "701021023": "Millner",
-        "701021024": "Moil",
-        "701021025": "Nightcliff",
-        "701021026": "Rapid Creek",
-        "701021027": "Tiwi",
-        "701021028": "Wagaman",
-        "701021029": "Wanguri",
-        "701021030": "Wulagi",
-        "701031031": "Howard Springs",
-        "701031032": "Humpty Doo",
-        "701031033": "Koolpinyah",
-        "701031034": "Virginia",
-        "701031035": "Weddell",
-        "701041036": "Bakewell",
-        "701041037": "Driver",
-        "701041038": "Durack - Marlow Lagoon",
-        "701041039": "Gray",
-        "701041040": "Moulden",
-        "701041041": "Palmerston - North",
-        "701041042": "Palmerston - South",
-        "701041043": "Rosebery - Bellamack",
-        "701041044": "Woodroffe",
-        "702011045": "Charles",
-        "702011046": "East Side",
-        "702011047": "Flynn (NT)",
-        "702011048": "Larapinta",
-        "702011049": "Mount Johns",
-        "702011050": "Petermann - Simpson",
-        "702011051": "Ross",
-        "702011052": "Sandover - Plenty",
-        "702011053": "Tanami",
-        "702011054": "Yuendumu - Anmatjere",
-        "702021055": "Barkly",
-        "702021056": "Tennant Creek",
-        "702031057": "Alligator",
-        "702031058": "Daly",
-        "702031059": "Thamarrurr",
-        "702031060": "Tiwi Islands",
-        "702031061": "West Arnhem",
-        "702041062": "Anindilyakwa",
-        "702041063": "East Arnhem",
-        "702041064": "Nhulunbuy",
-        "702051065": "Elsey",
-        "702051066": "Gulf",
-        "702051067": "Katherine",
-        "702051068": "Victoria River",
-        "797979799": "Migratory - Offshore - Shipping (NT)",
-        "799999499": "No usual address (NT)",
-        "801011001": "Aranda",
-        "801011002": "Belconnen",
-        "801011003": "Bruce",
-        "801011004": "Charnwood",
-        "801011005": "Cook",
-        "801011006": "Dunlop",
-        "801011007": "Evatt",
-        "801011008": "Florey",
-        "801011009": "Flynn (ACT)",
-        "801011010": "Fraser",
-        "801011011": "Giralang",
-        "801011012": "Gooromon",
-        "801011013": "Hawker",
-        "801011014": "Higgins",
-        "801011015": "Holt",
-        "801011016": "Kaleen",
-        "801011017": "Latham",
-        "801011018": "Lawson",
-        "801011019": "Macgregor (ACT)",
-        "801011020": "Macquarie",
-        "801011021": "McKellar",
-        "801011022": "Melba",
-        "801011023": "Page",
-        "801011024": "Scullin",
-        "801011025": "Spence",
-        "801011026": "Weetangera",
-        "801011111": "Molonglo Corridor",
-        "801011142": "Macnamara",
-        "801011143": "Strathnairn",
-        "801011144": "West Belconnen",
-        "801031031": "Hume",
-        "801031032": "Kowen",
-        "801031113": "Canberra East",
-        "801031114": "Canberra Airport",
-        "801031115": "Majura",
-        "801041034": "Amaroo",
-        "801041035": "Bonner",
-        "801041036": "Casey",
-        "801041037": "Crace",
-        "801041038": "Forde",
-        "801041039": "Franklin",
-        "801041040": "Gungahlin",
-        "801041043": "Hall",
-        "801041044": "Harrison",
-        "801041045": "Mitchell",
-        "801041046": "Ngunnawal",
-        "801041047": "Nicholls",
-        "801041048": "Palmerston",
-        "801041116": "Gungahlin - East",
-        "801041117": "Gungahlin - West",
-        "801041121": "Taylor",
-        "801041118": "Jacka",
-        "801041119": "Kenny",
-        "801041120": "Moncrieff",
-        "801041122": "Throsby",
-        "801051049": "Acton",
-        "801051050": "Ainslie",
-        "801051051": "Braddon",
-        "801051053": "Civic",
-        "801051054": "Dickson",
-        "801051055": "Downer",
-        "801051056": "Hackett",
-        "801051057": "Lyneham",
-        "801051058": "O'Connor (ACT)",
-        "801051060": "Turner",
-        "801051061": "Watson",
-        "801051123": "Black Mountain",
-        "801051124": "Campbell",
-        "801051125": "Duntroon",
-        "801051126": "Parkes (ACT) - North",
-        "801051127": "Reid",
-        "801051128": "Russell",
-        "801061062": "Deakin",
-        "801061063": "Forrest",
-        "801061064": "Griffith (ACT)",
-        "801061066": "Lake Burley Griffin",
-        "801061067": "Narrabundah",
-        "801061068": "Parkes (ACT) - South",
-        "801061069": "Red Hill (ACT)",
-        "801061070": "Yarralumla",
-        "801061129": "Barton",
-        "801061130": "Fyshwick",
-        "801061131": "Kingston (ACT)",
-        "801071071": "Banks",
-        "801071072": "Bonython",
-        "801071073": "Calwell",
-        "801071074": "Chisholm",
-        "801071075": "Conder",
-        "801071076": "Fadden",
-        "801071077": "Gilmore",
-        "801071078": "Gordon (ACT)",
-        "801071079": "Gowrie (ACT)",
-        "801071080": "Greenway",
-        "801071081": "Isabella Plains",
-        "801071082": "Kambah",
-        "801071083": "Macarthur",
-        "801071084": "Monash",
-        "801071085": "Mount Taylor",
-        "801071086": "Oxley (ACT)",
-        "801071087": "Richardson",
-        "801071088": "Theodore",
-        "801071089": "Tuggeranong",
-        "801071090": "Wanniassa",
-        "801071132": "Tuggeranong - West",
-        "801081091": "Chapman",
-        "801081092": "Duffy",
-        "801081093": "Fisher",
-        "801081094": "Holder",
-        "801081095": "Rivett",
-        "801081096": "Stirling",
-        "801081097": "Waramanga",
-        "801081098": "Weston",
-        "801081133": "Scrivener",
-        "801091099": "Chifley",
-        "801091100": "Curtin",
-        "801091101": "Farrer",
-        "801091102": "Garran",
-        "801091103": "Hughes",
-        "801091104": "Isaacs",
-        "801091105": "Lyons (ACT)",
-        "801091106": "Mawson",
-        "801091107": "O'Malley",
-        "801091108": "Pearce",
-        "801091109": "Phillip",
-        "801091110": "Torrens",
-        "801101134": "Arboretum",
-        "801101135": "Coombs",
-        "801101136": "Denman Prospect",
-        "801101137": "Molonglo",
-        "801101145": "Molonglo - East",
-        "801101146": "Whitlam",
-        "801101139": "Wright",
-        "801111140": "ACT - South West",
-        "801111141": "Namadgi",
-        "897979799": "Migratory - Offshore - Shipping (ACT)",
-        "899999499": "No usual address (ACT)",
-        "901011001": "Christmas Island",
-        "901021002": "Cocos (Keeling) Islands",
-        "901031003": "Jervis Bay",
-        "901041004": "Norfolk Island",
-        "997979799": "Migratory - Offshore - Shipping (OT)",
-        "999999499": "No usual address (OT)",
-        "ZZZZZZZZZ": "Outside Australia",
-        "101021011": "Queanbeyan Region",
-        "101031015": "Cooma Region",
-        "101051540": "Goulburn Region",
-        "101061542": "Yass Region",
-        "101061544": "Young Region",
-        "103011058": "Bathurst",
-        "103011060": "Bathurst Region",
-        "103021064": "Cowra Region",
-        "103021068": "Parkes Region",
-        "103031071": "Lithgow Region",
-        "103031073": "Mudgee Region - East",
-        "103031074": "Mudgee Region - West",
-        "103041079": "Orange Region",
-        "104011081": "Grafton Region",
-        "105031103": "Dubbo Region",
-        "106011109": "Cessnock Region",
-        "106011113": "Singleton Region",
-        "106021115": "Maitland - East",
-        "106021117": "Maitland - West",
-        "106021118": "Thornton - Millers Forest",
-        "106041127": "Muswellbrook Region",
-        "106041129": "Scone Region",
-        "108011153": "Forster-Tuncurry Region",
-        "108021156": "Kempsey Region",
-        "108021159": "Nambucca Heads Region",
-        "108041163": "Port Macquarie - East",
-        "108041165": "Port Macquarie Region",
-        "108051170": "Taree Region",
-        "109011175": "Albury Region",
-        "109031181": "Corowa Region",
-        "109031183": "Deniliquin Region",
-        "110011187": "Armidale Region - North",
-        "110011188": "Armidale Region - South",
-        "110021192": "Inverell Region - East",
-        "110021193": "Inverell Region - West",
-        "110031196": "Moree Region",
-        "110031198": "Narrabri Region",
-        "110041200": "Gunnedah Region",
-        "110041205": "Tamworth Region",
-        "112011237": "Ballina Region",
-        "112021245": "Casino Region",
-        "112021249": "Lismore Region",
-        "112031252": "Murwillumbah Region",
-        "112031551": "Terranora - North Tumblegum",
-        "113011257": "Griffith Region",
-        "113021262": "Tumut Region",
-        "113031271": "Wagga Wagga Region",
-        "114011283": "Ulladulla Region",
-        "115011290": "Baulkham Hills (East)",
-        "115011559": "Kellyville",
-        "115041302": "Rouse Hill - Beaumont Hills",
-        "116011308": "Seven Hills - Toongabbie",
-        "116011560": "Blacktown (South)",
-        "116011561": "Blacktown (West)",
-        "116021310": "Parklea - Kellyville Ridge",
-        "116021312": "Riverstone - Marsden Park",
-        "117011322": "Mascot - Eastlakes",
-        "117021326": "Marrickville",
-        "117031332": "Newtown - Camperdown - Darlington",
-        "117031334": "Pyrmont - Ultimo",
-        "117031335": "Redfern - Chippendale",
-        "117031337": "Sydney - Haymarket - The Rocks",
-        "117031338": "Waterloo - Beaconsfield",
-        "118011343": "Double Bay - Bellevue Hill",
-        "118021348": "Coogee - Clovelly",
-        "118021350": "Malabar - La Perouse - Chifley",
-        "119011357": "Greenacre - Mount Lewis",
-        "119011359": "Panania - Milperra - Picnic Point",
-        "119021363": "Canterbury (South) - Campsie",
-        "119021364": "Kingsgrove (North) - Earlwood",
-        "119031368": "Hurstville",
-        "119031369": "Mortdale - Penshurst",
-        "119041375": "Arncliffe - Bardwell Valley",
-        "119041376": "Bexley",
-        "120011384": "Concord West - North Strathfield",
-        "120021388": "Leichhardt - Annandale",
-        "120031390": "Ashfield",
-        "120031391": "Burwood - Croydon",
-        "120031575": "Strathfield",
-        "121011398": "Chatswood (East) - Artarmon",
-        "121011400": "Lane Cove - Greenwich",
-        "121011402": "Willoughby - Castle Cove - Northbridge",
-        "121021579": "Waitara - Wahroonga (West)",
-        "121041415": "Mosman",
-        "122021423": "Warriewood - Mona Vale",
-        "122031426": "Dee Why - North Curl Curl",
-        "122031428": "Frenchs Forest - Belrose",
-        "122031431": "Narrabeen - Collaroy",
-        "123011434": "Elderslie - Harrington Park",
-        "123011435": "Mount Annan - Currans Hill",
-        "123021440": "Ingleburn - Denham Court",
-        "123021442": "Macquarie Fields - Glenfield",
-        "124031458": "Castlereagh - Cranebrook",
-        "125011473": "Homebush Bay - Silverwater",
-        "125021476": "Carlingford",
-        "125031482": "Greystanes - Pemulwuy",
-        "125031485": "Merrylands - Holroyd",
-        "125041492": "Parramatta - Rosehill",
-        "126011495": "Epping - North Epping",
-        "126021497": "Eastwood - Denistone",
-        "126021591": "Ryde",
-        "127011506": "Cobbitty - Leppington",
-        "127031598": "Liverpool",
-        "127031600": "Prestons - Edmondson Park",
-        "128011606": "Woolaware - Burraneer",
-        "201011003": "Ballarat - North",
-        "201011004": "Ballarat - South",
-        "201021009": "Bacchus Marsh Region",
-        "201031017": "Maryborough Region",
-        "202021026": "Bendigo Region - South",
-        "202021028": "Castlemaine Region",
-        "202031032": "Bendigo Region - North",
-        "203021038": "Corio - Norlane",
-        "203021041": "Grovedale",
-        "203031050": "Ocean Grove - Barwon Heads",
-        "204011060": "Seymour Region",
-        "204021064": "Benalla Region",
-        "204021067": "Wangaratta Region",
-        "204031074": "Wodonga",
-        "205041097": "Traralgon",
-        "206011105": "Brunswick",
-        "206011108": "Coburg",
-        "206021111": "Northcote",
-        "206031114": "Essendon - Aberfeldie",
-        "206041122": "Melbourne",
-        "206041123": "North Melbourne",
-        "206041126": "Southbank",
-        "206041127": "West Melbourne",
-        "206051131": "Port Melbourne Industrial",
-        "206051132": "South Melbourne",
-        "206051133": "St Kilda",
-        "206061137": "South Yarra - East",
-        "206071144": "Richmond (Vic.)",
-        "206071145": "Yarra - North",
-        "207011151": "Hawthorn",
-        "207011153": "Kew",
-        "207021424": "Doncaster East (North)",
-        "207021425": "Doncaster East (South)",
-        "207031165": "Burwood",
-        "208011171": "Cheltenham - Highett (West)",
-        "208021426": "Bentleigh East (North)",
-        "208021427": "Bentleigh East (South)",
-        "208031188": "Cheltenham - Highett (East)",
-        "209021207": "Reservoir - East",
-        "209021208": "Reservoir - West",
-        "209041219": "Lalor",
-        "209041430": "Doreen",
-        "209041433": "Epping - West",
-        "209041434": "Mernda",
-        "209041435": "South Morang (North)",
-        "209041436": "South Morang (South)",
-        "210011229": "Keilor East",
-        "210031239": "Pascoe Vale",
-        "210031438": "Glenroy",
-        "210041241": "Sunbury - South",
-        "210051249": "Roxburgh Park - Somerton",
-        "210051444": "Craigieburn - West",
-        "211011447": "Ferntree Gully (North)",
-        "212011287": "Beaconsfield - Officer",
-        "212011288": "Bunyip - Garfield",
-        "212011290": "Koo Wee Rup",
-        "212011291": "Pakenham - North",
-        "212011292": "Pakenham - South",
-        "212021294": "Berwick - South",
-        "212031301": "Cranbourne East",
-        "212031302": "Cranbourne North",
-        "212031305": "Hampton Park - Lynbrook",
-        "212031457": "Narre Warren South (East)",
-        "212031458": "Narre Warren South (West)",
-        "212041311": "Dandenong",
-        "212041314": "Keysborough",
-        "212051320": "Clayton",
-        "213011330": "Deer Park - Derrimut",
-        "213041355": "Hillside",
-        "213041356": "Melton",
-        "213041357": "Melton South",
-        "213051365": "Tarneit",
-        "213051366": "Truganina",
-        "213051369": "Wyndham Vale",
-        "213051465": "Point Cook - North",
-        "214021380": "Mornington",
-        "215011387": "Ararat Region",
-        "215011389": "Horsham Region",
-        "215021398": "Mildura Region",
-        "215031405": "Swan Hill Region",
-        "216031417": "Shepparton - South",
-        "216031418": "Shepparton Region - East",
-        "216031419": "Shepparton Region - West",
-        "217031473": "Colac Region",
-        "301021527": "Redland Islands",
-        "307011177": "Roma Region",
-        "307031188": "Stanthorpe Region",
-        "308031218": "Rockhampton Region - East",
-        "308031219": "Rockhampton Region - North",
-        "308031220": "Rockhampton Region - West",
-        "309071255": "Ormeau - Yatala",
-        "309071257": "Pimpama",
-        "309071258": "Upper Coomera - Willow Vale",
-        "309081261": "Robina",
-        "309101270": "Surfers Paradise",
-        "310011273": "Forest Lake - Doolandella",
-        "310041296": "Bellbird Park - Brookwater",
-        "311041320": "Greenbank",
-        "311041321": "Jimboomba",
-        "311061330": "Kingston (Qld.)",
-        "313021365": "Caboolture",
-        "313051542": "Scarborough - Newport - Moreton Island",
-        "314021388": "Dakabin - Kallangur",
-        "314021390": "North Lakes - Mango Hill",
-        "315021406": "Mount Isa Region",
-        "316021420": "Caloundra - West",
-        "318011465": "Ingham Region",
-        "318021468": "Annandale",
-        "318021473": "Deeragun",
-        "319011498": "Bundaberg Region - North",
-        "319011499": "Bundaberg Region - South",
-        "319021506": "Kingaroy Region - North",
-        "319021507": "Kingaroy Region - South",
-        "319031514": "Gympie Region",
-        "319051525": "Maryborough Region - South",
-        "401021008": "Mount Barker Region",
-        "401031012": "Glenside - Beaumont",
-        "402031037": "Northgate - Oakden - Gilles Plains",
-        "403041087": "Seaford (SA)",
-        "405031123": "Port Pirie Region",
-        "407011147": "Strathalbyn Region",
-        "407021155": "Naracoorte Region",
-        "407031163": "Loxton Region",
-        "407031166": "Murray Bridge Region",
-        "407031168": "Renmark Region",
-        "501011002": "Busselton",
-        "501011003": "Busselton Region",
-        "503021041": "Perth City",
-        "504031059": "Ellenbrook",
-        "505021086": "Dianella",
-        "505031103": "Madeley - Darch - Landsdale",
-        "505031108": "Wanneroo",
-        "506011113": "Forrestdale - Harrisdale - Piara Waters",
-        "506021122": "Rivervale - Kewdale - Cloverdale",
-        "507031169": "Bertram - Wellard (West)",
-        "507051185": "Baldivis",
-        "509011226": "Albany Region",
-        "511011275": "Esperance Region",
-        "604011076": "Burnie - Ulverstone Region",
-        "801011112": "West Belconnen",
-        "801101138": "Molonglo - North",
-    },
-    "FREQ": {"M": "Monthly"},
-    "PRICE_ADJ": {"CVM": "Chain Volume Measure", "CUR": "Current Prices"},
-    "TSEST": {"10": "Original", "20": "Seasonally Adjusted", "30": "Trend"},
-}
+field_index = FieldIndex()
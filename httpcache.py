@@ -0,0 +1,173 @@
+# Persistent on-disk cache for ABS downloads (SDMX data messages and the 87xx xlsx workbooks).
+# Each response body is stored next to a small JSON record holding its ETag/Last-Modified, so a
+# rerun revalidates with a conditional GET and an unchanged release costs one 304 round trip
+# instead of the full download. Entries younger than CACHE_TTL are served without any request,
+# and the least recently used entries are evicted once the cache grows past CACHE_MAX_BYTES.
+import hashlib
+import json
+import os
+import threading
+import time
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+
+CACHE_DIR = os.environ.get("ABS_CACHE_DIR", ".abs_cache")
+CACHE_TTL = float(os.environ.get("ABS_CACHE_TTL", 3600))  # seconds before an entry is revalidated
+CACHE_MAX_BYTES = int(os.environ.get("ABS_CACHE_MAX_BYTES", 2 * 1024 ** 3))
+CHUNK_SIZE = 1024 * 1024
+
+# Request headers that change the representation ABS sends back, so they are part of the key
+_VARY_HEADERS = ("accept",)
+
+_locks = {}
+_locks_guard = threading.Lock()
+_evict_lock = threading.Lock()
+
+def configure_cache(cache_dir=None, ttl=None, max_bytes=None):
+    global CACHE_DIR, CACHE_TTL, CACHE_MAX_BYTES
+    if cache_dir is not None:
+        CACHE_DIR = cache_dir
+    if ttl is not None:
+        CACHE_TTL = ttl
+    if max_bytes is not None:
+        CACHE_MAX_BYTES = max_bytes
+
+# Normalise the URL so equivalent requests share an entry: lower-case scheme and host, no
+# fragment, and the query string (merged with params) sorted by name
+def normalize_url(url, params=None):
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    if params:
+        query += [(k, str(v)) for k, v in params.items()]
+    query = sorted(dict(query).items())
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, urlencode(query, safe=",+:"), ""))
+
+def cache_key(url, params=None, headers=None):
+    normalized = normalize_url(url, params)
+    vary = sorted((k.lower(), v) for k, v in (headers or {}).items() if k.lower() in _VARY_HEADERS)
+    return hashlib.sha256(json.dumps([normalized, vary]).encode()).hexdigest()
+
+def _paths(key):
+    return os.path.join(CACHE_DIR, key + ".body"), os.path.join(CACHE_DIR, key + ".json")
+
+def _key_lock(key):
+    with _locks_guard:
+        return _locks.setdefault(key, threading.Lock())
+
+def _read_meta(meta_path):
+    try:
+        with open(meta_path) as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+def _write_meta(meta_path, meta):
+    tmp_path = f"{meta_path}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w") as file:
+        json.dump(meta, file)
+    os.replace(tmp_path, meta_path)
+
+# Return the path of a local file holding the response body for url (plus params), downloading
+# or revalidating it as needed. HTTP errors are raised as requests.HTTPError, like raise_for_status
+def fetch(url, params=None, headers=None, session=None, timeout=None, ttl=None):
+    if ttl is None:
+        ttl = CACHE_TTL
+    session = session or requests
+    headers = dict(headers or {})
+    key = cache_key(url, params, headers)
+    body_path, meta_path = _paths(key)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+
+    with _key_lock(key):
+        meta = _read_meta(meta_path)
+        if meta is not None and not os.path.exists(body_path):
+            meta = None
+        now = time.time()
+
+        if meta is not None and now - meta["validated"] < ttl:
+            meta["accessed"] = now
+            _write_meta(meta_path, meta)
+            return body_path
+
+        # Revalidate a stale entry with a conditional GET
+        if meta is not None:
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        response = session.get(url, params=params, headers=headers, timeout=timeout, stream=True)
+        try:
+            if response.status_code == 304 and meta is not None:
+                meta["validated"] = meta["accessed"] = now
+                _write_meta(meta_path, meta)
+                return body_path
+
+            response.raise_for_status()
+
+            # Stream the body to disk so large payloads never sit in memory whole
+            tmp_path = f"{body_path}.{threading.get_ident()}.tmp"
+            size = 0
+            try:
+                with open(tmp_path, "wb") as file:
+                    for chunk in response.iter_content(CHUNK_SIZE):
+                        file.write(chunk)
+                        size += len(chunk)
+                os.replace(tmp_path, body_path)
+            except BaseException:
+                # A stream cut off part way (read timeout, connection reset) leaves no partial file
+                try:
+                    os.remove(tmp_path)
+                except FileNotFoundError:
+                    pass
+                raise
+        finally:
+            response.close()
+
+        _write_meta(meta_path, {
+            "url": normalize_url(url, params),
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "content_type": response.headers.get("Content-Type"),
+            "size": size,
+            "validated": now,
+            "accessed": now,
+        })
+
+    evict()
+    return body_path
+
+# Drop an entry, e.g. when a cached body turns out not to be parseable
+def invalidate(url, params=None, headers=None):
+    key = cache_key(url, params, headers)
+    with _key_lock(key):
+        for path in _paths(key):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+# Size-based LRU eviction: remove the least recently accessed entries until the cache fits
+def evict(max_bytes=None):
+    if max_bytes is None:
+        max_bytes = CACHE_MAX_BYTES
+    with _evict_lock:
+        entries = []
+        for name in os.listdir(CACHE_DIR):
+            if name.endswith(".json"):
+                meta = _read_meta(os.path.join(CACHE_DIR, name))
+                # Skip JSON that is not a cache record (e.g. left there by an older version)
+                if isinstance(meta, dict) and "accessed" in meta and "size" in meta:
+                    entries.append((meta["accessed"], meta["size"], name[:-5]))
+        total = sum(size for _, size, _ in entries)
+        for _, size, key in sorted(entries):
+            if total <= max_bytes:
+                break
+            with _key_lock(key):
+                for path in _paths(key):
+                    try:
+                        os.remove(path)
+                    except FileNotFoundError:
+                        pass
+            total -= size
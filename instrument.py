@@ -0,0 +1,180 @@
+# Per-stage instrumentation for the builders. stage(name) is a context manager and decorator that
+# records, for every pass through a stage (fetch, decode, map, reshape, rolling, write, ...), its
+# wall time, CPU time, the process' peak RSS, the peak traced Python memory when tracemalloc is on
+# (BUILD_TRACEMALLOC=1, it slows the run down), and the rows/bytes handled. write_report dumps the
+# records of a run, plus a per-stage summary, as JSON under BUILD_REPORT_DIR so runs of different
+# releases can be compared.
+#
+#   with stage("fetch") as record:
+#       path = httpcache.fetch(url)
+#       record.bytes = os.path.getsize(path)
+#
+#   @stage("reshape")
+#   def to_measure_columns(...): ...   # rows/bytes are taken from the returned frame
+import json
+import os
+import platform
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import pandas as pd
+
+import httpcache
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+# Reports go to BUILD_REPORT_DIR, else reports/ in the cache directory
+REPORT_DIR = os.environ.get("BUILD_REPORT_DIR")
+
+if os.environ.get("BUILD_TRACEMALLOC") == "1" and not tracemalloc.is_tracing():
+    tracemalloc.start()
+
+_records = []
+_lock = threading.Lock()
+_local = threading.local()
+_started_at = datetime.now(timezone.utc)
+
+def _stack():
+    if not hasattr(_local, "stack"):
+        _local.stack = []
+    return _local.stack
+
+# High-water mark of the process' resident set size in bytes (ru_maxrss is KiB on Linux, bytes on macOS)
+def peak_rss():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+def _size(result):
+    if isinstance(result, pd.DataFrame):
+        return len(result), int(result.memory_usage(index=True).sum())
+    if isinstance(result, pd.Series):
+        return len(result), int(result.memory_usage(index=True))
+    return None, None
+
+class stage:
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        stack = _stack()
+        self.path = "/".join([frame.name for frame in stack] + [self.name])
+        self.rows = None
+        self.bytes = None
+        # Nested stages reset the traced peak; hand what the outer stage reached so far up first
+        self._child_peak = 0
+        if tracemalloc.is_tracing():
+            if stack:
+                stack[-1]._child_peak = max(stack[-1]._child_peak, tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+        stack.append(self)
+        self._wall = time.perf_counter()
+        self._cpu = time.thread_time()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        wall = time.perf_counter() - self._wall
+        cpu = time.thread_time() - self._cpu
+        stack = _stack()
+        stack.pop()
+        traced_peak = None
+        if tracemalloc.is_tracing():
+            traced_peak = max(tracemalloc.get_traced_memory()[1], self._child_peak)
+            if stack:
+                stack[-1]._child_peak = max(stack[-1]._child_peak, traced_peak)
+        record = {
+            "stage": self.path,
+            "wall_s": round(wall, 6),
+            "cpu_s": round(cpu, 6),
+            "peak_rss_bytes": peak_rss(),
+            "traced_peak_bytes": traced_peak,
+            "rows": self.rows,
+            "bytes": self.bytes,
+            "thread": threading.current_thread().name,
+            "ok": exc_type is None,
+        }
+        with _lock:
+            _records.append(record)
+        return False
+
+    # As a decorator, rows and bytes come from the returned frame
+    def __call__(self, func):
+        name = self.name
+
+        def wrapper(*args, **kwargs):
+            with stage(name) as record:
+                result = func(*args, **kwargs)
+                record.rows, record.bytes = _size(result)
+                return result
+
+        wrapper.__name__ = func.__name__
+        wrapper.__doc__ = func.__doc__
+        wrapper.__wrapped__ = func
+        return wrapper
+
+def records():
+    with _lock:
+        return list(_records)
+
+def reset():
+    global _started_at
+    with _lock:
+        _records.clear()
+    _started_at = datetime.now(timezone.utc)
+
+# Totals per stage path: passes, wall/CPU time, largest peaks, rows and bytes handled
+def summary(run_records=None):
+    totals = {}
+    for record in run_records if run_records is not None else records():
+        total = totals.setdefault(record["stage"], {"count": 0, "wall_s": 0.0, "cpu_s": 0.0, "peak_rss_bytes": None, "traced_peak_bytes": None, "rows": 0, "bytes": 0})
+        total["count"] += 1
+        total["wall_s"] = round(total["wall_s"] + record["wall_s"], 6)
+        total["cpu_s"] = round(total["cpu_s"] + record["cpu_s"], 6)
+        for key in ("peak_rss_bytes", "traced_peak_bytes"):
+            if record[key] is not None:
+                total[key] = max(total[key] or 0, record[key])
+        total["rows"] += record["rows"] or 0
+        total["bytes"] += record["bytes"] or 0
+    return totals
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True, text=True, timeout=10,
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+# Write the run's records to <REPORT_DIR>/<name>_<UTC timestamp>.json and start a new run.
+# Returns the report path
+def write_report(name, report_dir=None):
+    report_dir = report_dir or REPORT_DIR or os.path.join(httpcache.CACHE_DIR, "reports")
+    os.makedirs(report_dir, exist_ok=True)
+    run_records = records()
+    finished_at = datetime.now(timezone.utc)
+    report = {
+        "name": name,
+        "started_at": _started_at.isoformat(timespec="seconds"),
+        "finished_at": finished_at.isoformat(timespec="seconds"),
+        "git_commit": git_commit(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "tracemalloc": tracemalloc.is_tracing(),
+        "summary": summary(run_records),
+        "stages": run_records,
+    }
+    path = os.path.join(report_dir, f"{name}_{finished_at:%Y%m%dT%H%M%S}_{os.getpid()}.json")
+    with open(path, "w") as file:
+        json.dump(report, file, indent=2)
+    reset()
+    return path
@@ -0,0 +1,288 @@
+# Local stand-in for the ABS endpoints, for testing and benchmarking the fetch path offline.
+#
+#   python mockabs.py [--port 8765] [--fixtures DIR] [--record] [--latency S] [--jitter S]
+#                     [--bandwidth BYTES_PER_S] [--error-rate P] [--reset-rate P] [--seed N]
+#
+# The SDMX API is served under /api and the www.abs.gov.au release files (the 87310087,
+# 87520079 and 87520080 workbooks) under /web; point the builders at it with
+#
+#   ABS_API_BASE=http://127.0.0.1:8765/api ABS_WEB_BASE=http://127.0.0.1:8765/web
+#
+# (see dhandler.route). Responses are replayed from fixtures recorded under --fixtures: one
+# <key>.body plus a <key>.json record per request path, query and Accept header. With --record,
+# requests without a fixture are forwarded to ABS once and the response is kept (5xx responses
+# are passed through but not kept). A workbook whose release folder has no fixture is served from
+# the latest recording of the same file name, so a recording keeps working as releases move on.
+#
+# Faults are injected per response: a latency (plus uniform jitter) before the headers, a cap on
+# the bytes per second of every body, 504 Gateway Timeouts (which extract_data takes as a query
+# too large and splits) and connection resets half way through the body. Whether the n-th request
+# for a given URL is delayed, fails or is reset depends only on --seed, the URL and n, never on
+# how concurrent requests interleave, so runs are repeatable. GET /_stats returns the counters.
+import argparse
+import hashlib
+import json
+import os
+import random
+import socket
+import struct
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+import httpcache
+
+FIXTURE_DIR = os.environ.get("ABS_MOCK_FIXTURES", "mock_fixtures")
+
+# Path prefix -> where --record fetches it from; dhandler.API_ORIGIN is the SDMX API the sdmx
+# client addresses, and the structure queries of codelist_sync.py are answered there too
+UPSTREAMS = {
+    "/api": "https://api.data.abs.gov.au",
+    "/web": "https://www.abs.gov.au",
+}
+WEB_PREFIX = "/web"
+
+CHUNK_SIZE = 16 * 1024
+RECORD_TIMEOUT = (10, 300)
+
+# Latency, bandwidth cap and fault rates, decided per request from (seed, url, attempt)
+class Faults:
+    def __init__(self, latency=0.0, jitter=0.0, bandwidth=None, error_rate=0.0, reset_rate=0.0, seed=0):
+        self.latency = latency
+        self.jitter = jitter
+        self.bandwidth = bandwidth
+        self.error_rate = error_rate
+        self.reset_rate = reset_rate
+        self.seed = seed
+
+    def plan(self, key, attempt):
+        rng = random.Random(f"{self.seed}:{key}:{attempt}")
+        delay = self.latency + (rng.uniform(0, self.jitter) if self.jitter else 0.0)
+        draw = rng.random()
+        if draw < self.error_rate:
+            fault = "504"
+        elif draw < self.error_rate + self.reset_rate:
+            fault = "reset"
+        else:
+            fault = None
+        return delay, fault
+
+# Recorded responses, keyed like httpcache: the normalised path and query plus the Accept header
+class FixtureStore:
+    def __init__(self, directory=FIXTURE_DIR):
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._records = {}
+        os.makedirs(directory, exist_ok=True)
+        for name in os.listdir(directory):
+            if name.endswith(".json"):
+                with open(os.path.join(directory, name)) as file:
+                    self._records[name[:-5]] = json.load(file)
+
+    @staticmethod
+    def key(target, accept):
+        return hashlib.sha256(json.dumps([httpcache.normalize_url(target), accept or ""]).encode()).hexdigest()[:32]
+
+    def body_path(self, key):
+        return os.path.join(self.directory, key + ".body")
+
+    def get(self, target, accept):
+        key = self.key(target, accept)
+        with self._lock:
+            record = self._records.get(key)
+            if record is None and target.startswith(WEB_PREFIX + "/"):
+                record = self._latest_named(target.split("?")[0].rsplit("/", 1)[-1])
+        return record
+
+    def _latest_named(self, filename):
+        matches = [
+            record for record in self._records.values()
+            if record["target"].startswith(WEB_PREFIX + "/") and record["target"].split("?")[0].endswith("/" + filename)
+        ]
+        return max(matches, key=lambda record: record["recorded_at"], default=None)
+
+    def save(self, target, accept, status, content_type, body):
+        key = self.key(target, accept)
+        record = {
+            "key": key,
+            "target": target,
+            "accept": accept,
+            "status": status,
+            "content_type": content_type,
+            "etag": '"' + hashlib.sha256(body).hexdigest()[:32] + '"',
+            "size": len(body),
+            "recorded_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        }
+        body_path = self.body_path(key)
+        with open(f"{body_path}.tmp", "wb") as file:
+            file.write(body)
+        os.replace(f"{body_path}.tmp", body_path)
+        with open(os.path.join(self.directory, key + ".json"), "w") as file:
+            json.dump(record, file, indent=2)
+        with self._lock:
+            self._records[key] = record
+        return record
+
+class MockServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, store, faults=None, record=False, upstreams=UPSTREAMS):
+        super().__init__(address, MockHandler)
+        self.store = store
+        self.faults = faults or Faults()
+        self.record = record
+        self.upstreams = upstreams
+        self.stats = Counter()
+        self._attempts = Counter()
+        self._lock = threading.Lock()
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def attempt(self, key):
+        with self._lock:
+            self._attempts[key] += 1
+            return self._attempts[key]
+
+    def count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+
+    # A client giving up half way through a response (e.g. on its read timeout) is not a server error
+    def handle_error(self, request, client_address):
+        if isinstance(sys.exc_info()[1], ConnectionError):
+            self.count("client_disconnect")
+        else:
+            super().handle_error(request, client_address)
+
+class MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        if self.path == "/_stats":
+            return self._send(200, "application/json", json.dumps(dict(server.stats)).encode())
+
+        accept = self.headers.get("Accept")
+        key = server.store.key(self.path, accept)
+        delay, fault = server.faults.plan(key, server.attempt(key))
+        if delay:
+            time.sleep(delay)
+        if fault == "504":
+            server.count("gateway_timeout")
+            return self._send(504, "text/plain", b"Gateway Timeout (injected)")
+
+        record = server.store.get(self.path, accept)
+        if record is None and server.record:
+            record = self._record(accept)
+            if record is None:
+                return
+        if record is None:
+            server.count("missing")
+            return self._send(404, "text/plain", f"No fixture for {self.path}, record it with --record".encode())
+
+        if record["status"] == 200 and self.headers.get("If-None-Match") == record["etag"]:
+            server.count("not_modified")
+            return self._send(304, None, b"", etag=record["etag"])
+
+        server.count("served")
+        with open(server.store.body_path(record["key"]), "rb") as file:
+            body = file.read()
+        self._send(record["status"], record["content_type"], body, etag=record["etag"], reset=fault == "reset")
+
+    # Fetch the request from ABS, keep it as a fixture unless it is a server error, and return it
+    def _record(self, accept):
+        server = self.server
+        prefix = next((prefix for prefix in server.upstreams if self.path.startswith(prefix + "/")), None)
+        if prefix is None:
+            server.count("missing")
+            self._send(404, "text/plain", f"No upstream for {self.path}".encode())
+            return None
+        url = server.upstreams[prefix] + self.path[len(prefix):]
+        headers = {"Accept": accept} if accept else {}
+        try:
+            response = requests.get(url, headers=headers, timeout=RECORD_TIMEOUT)
+        except requests.RequestException as error:
+            server.count("upstream_error")
+            self._send(502, "text/plain", f"Recording {url} failed: {error}".encode())
+            return None
+        content_type = response.headers.get("Content-Type", "application/octet-stream")
+        if response.status_code >= 500:
+            server.count("upstream_error")
+            self._send(response.status_code, content_type, response.content)
+            return None
+        server.count("recorded")
+        print(f"Recorded {url} ({response.status_code}, {len(response.content):,} bytes)")
+        return server.store.save(self.path, accept, response.status_code, content_type, response.content)
+
+    def _send(self, status, content_type, body, etag=None, reset=False):
+        self.send_response(status)
+        if content_type:
+            self.send_header("Content-Type", content_type)
+        if etag:
+            self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+
+        # Abort with a TCP reset half way through the body
+        if reset:
+            self.server.count("reset")
+            self.wfile.write(body[:len(body) // 2])
+            self.connection.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+            self.connection.close()
+            self.close_connection = True
+            return
+
+        bandwidth = self.server.faults.bandwidth
+        started = time.monotonic()
+        sent = 0
+        for start in range(0, len(body), CHUNK_SIZE):
+            chunk = body[start:start + CHUNK_SIZE]
+            self.wfile.write(chunk)
+            sent += len(chunk)
+            if bandwidth:
+                ahead = sent / bandwidth - (time.monotonic() - started)
+                if ahead > 0:
+                    time.sleep(ahead)
+
+    def log_message(self, format, *args):
+        pass
+
+# Serve on a background thread (e.g. inside a benchmark); call server.shutdown() when done
+def start(fixtures=FIXTURE_DIR, host="127.0.0.1", port=0, faults=None, record=False):
+    server = MockServer((host, port), FixtureStore(fixtures), faults, record)
+    threading.Thread(target=server.serve_forever, name="mockabs", daemon=True).start()
+    return server
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve recorded ABS responses locally, with injected latency and faults")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--fixtures", default=FIXTURE_DIR, help="fixture directory (default: %(default)s)")
+    parser.add_argument("--record", action="store_true", help="fetch and keep responses that have no fixture yet")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds before every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="up to this many extra seconds, uniformly")
+    parser.add_argument("--bandwidth", type=float, default=None, help="cap on every body, in bytes per second")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests answered with a 504")
+    parser.add_argument("--reset-rate", type=float, default=0.0, help="share of responses cut off by a connection reset")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the injected faults")
+    args = parser.parse_args()
+
+    faults = Faults(args.latency, args.jitter, args.bandwidth, args.error_rate, args.reset_rate, args.seed)
+    server = MockServer((args.host, args.port), FixtureStore(args.fixtures), faults, args.record)
+    print(f"Serving {args.fixtures} on {server.base_url}{' (recording)' if args.record else ''}")
+    print(f"  ABS_API_BASE={server.base_url}/api ABS_WEB_BASE={server.base_url}/web")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(dict(server.stats))
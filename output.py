@@ -0,0 +1,129 @@
+# Output layer shared by the builders. Each builder hands its final frame to write_output, which
+# writes it in every configured format: the CSV files the builders have always produced, and/or
+# typed, zstd-compressed Parquet with dictionary-encoded dimension columns and row-group
+# statistics, optionally partitioned (e.g. by State and year) so a dashboard can push its filters
+# down and read only the slice it needs, and/or upserts into the SQLite fact store (factstore.py),
+# and/or a star-schema export with surrogate keys (starschema.py), and/or a delta of the rows
+# changed since the last publication (delta.py). Formats come from BUILD_OUTPUT_FORMATS
+# (default "csv,delta"), e.g. "csv,parquet,factstore,star,delta".
+import os
+import shutil
+
+import pandas as pd
+
+import delta
+import factstore
+from instrument import stage
+import schema
+import starschema
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet output is optional
+    pa = pq = None
+
+OUTPUT_FORMATS = [fmt.strip() for fmt in os.environ.get("BUILD_OUTPUT_FORMATS", "csv,delta").split(",") if fmt.strip()]
+PARQUET_COMPRESSION = os.environ.get("BUILD_PARQUET_COMPRESSION", "zstd")
+ROW_GROUP_SIZE = 128 * 1024
+
+# Partition column derived from the period column when asked for and not already in the data
+YEAR = "Year"
+
+def write_csv(data, name, index=False, **_):
+    path = f"{name}.csv"
+    data.to_csv(path, index=index)
+    return path
+
+# Text dimension columns become categoricals, stored as Parquet dictionaries and read back as such
+def _to_table(data):
+    data = data.copy()
+    for col in data.columns:
+        if pd.api.types.is_string_dtype(data[col]) or pd.api.types.is_object_dtype(data[col]):
+            data[col] = data[col].astype("category")
+    return pa.Table.from_pandas(data, preserve_index=False)
+
+# Year of '2021-07'/'2021Q3' period labels
+def _with_year(data, period):
+    return data.assign(**{YEAR: data[period].astype(str).str[:4].astype("int16")})
+
+def _remove(path):
+    if os.path.isdir(path):
+        shutil.rmtree(path)
+    elif os.path.exists(path):
+        os.remove(path)
+
+# Write <name>.parquet, a single file or, with partition_cols, a hive-partitioned directory
+# (<name>.parquet/State=Victoria/Year=2021/...). The new output is written next to the old one
+# and swapped in, so a reader never sees a half-written dataset or stale partitions
+def write_parquet(data, name, partition_cols=None, period=None, **_):
+    if pq is None:
+        raise ImportError("Parquet output needs pyarrow (pip install pyarrow)")
+    partition_cols = list(partition_cols or [])
+    if YEAR in partition_cols and YEAR not in data.columns:
+        if period is None:
+            raise ValueError(f"Partitioning by {YEAR} needs the period column")
+        data = _with_year(data, period)
+
+    path = f"{name}.parquet"
+    tmp_path = f"{path}.tmp"
+    options = dict(compression=PARQUET_COMPRESSION, use_dictionary=True, write_statistics=True)
+    _remove(tmp_path)
+    if partition_cols:
+        pq.write_to_dataset(
+            _to_table(data),
+            tmp_path,
+            partition_cols=partition_cols,
+            existing_data_behavior="delete_matching",
+            max_rows_per_group=ROW_GROUP_SIZE,
+            **options,
+        )
+    else:
+        pq.write_table(_to_table(data), tmp_path, row_group_size=ROW_GROUP_SIZE, **options)
+
+    if os.path.isdir(path) or os.path.isdir(tmp_path):
+        _remove(path)
+    os.replace(tmp_path, path)
+    return path
+
+# Upsert into the local fact store (factstore.FACTSTORE_DB), keyed by the dataset name
+def write_factstore(data, name, period=None, **_):
+    if period is None:
+        raise ValueError("The fact store output needs the period column")
+    changed = factstore.write_facts(data, name, period)
+    print(f"{name}: {changed} fact rows written to {factstore.FACTSTORE_DB}")
+    return factstore.FACTSTORE_DB
+
+# Fact file with surrogate keys plus the conformed dimension tables (starschema.STAR_DIR)
+def write_star(data, name, period=None, **_):
+    if period is None:
+        raise ValueError("The star-schema output needs the period column")
+    return starschema.export_star(data, name, period)
+
+# <name>_delta.csv of the rows changed since the previous publication (delta.py)
+def write_delta(data, name, **_):
+    return delta.publish_delta(data, name)
+
+WRITERS = {
+    "csv": write_csv,
+    "parquet": write_parquet,
+    "factstore": write_factstore,
+    "star": write_star,
+    "delta": write_delta,
+}
+
+# Write data as <name>.<format> in every configured format and return the paths written.
+# index applies to CSV only; partition_cols (which may include 'Year', derived from period)
+# to Parquet only. Period ordinals are written as their labels (schema.render)
+def write_output(data, name, formats=None, index=False, partition_cols=None, period=None):
+    data = schema.render(data, name)
+    paths = []
+    for fmt in formats or OUTPUT_FORMATS:
+        if fmt not in WRITERS:
+            raise ValueError(f"Unknown output format {fmt!r}, expected one of {', '.join(WRITERS)}")
+        with stage(f"write.{fmt}") as record:
+            path = WRITERS[fmt](data, name, index=index, partition_cols=partition_cols, period=period)
+            record.rows = len(data)
+            record.bytes = os.path.getsize(path) if os.path.isfile(path) else None
+        paths.append(path)
+    return paths
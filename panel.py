@@ -0,0 +1,125 @@
+# Dense panel representation of a building dataset: the observations held as one float64 NumPy
+# array indexed [series, period, measure], plus a compact index describing each series by its
+# dimensions (REGION, WORK_TYPE, SECTOR, BUILDING_TYPE, ...). Rolling sums, growth rates and
+# aggregation become array operations along an axis instead of sorts and groupbys over long
+# frames, and a series is found in O(1) from its dimension values. build_app and build_act reshape
+# their observations into a panel and take their year-end sums along its period axis; vintages
+# are stitched beforehand, on the long frames (transform.stitch_vintages).
+import numpy as np
+import pandas as pd
+
+from instrument import stage
+
+class Panel:
+    def __init__(self, values, series, periods, measures):
+        self.values = values  # float64 [series, period, measure], NaN where there is no observation
+        self.series = series.reset_index(drop=True)  # one row of dimension values per series
+        self.periods = pd.Index(periods)
+        self.measures = pd.Index(measures)
+        self._positions = None
+
+    @property
+    def dims(self):
+        return list(self.series.columns)
+
+    def __len__(self):
+        return len(self.series)
+
+    def __repr__(self):
+        return f"Panel({len(self.series)} series x {len(self.periods)} periods x {len(self.measures)} measures)"
+
+    # Build from long observations, e.g. extract_data(..., layout='long'). Series are sorted by
+    # their dimension values and periods in time order; a repeated observation keeps the last value
+    @classmethod
+    @stage("reshape")
+    def from_long(cls, data, dims, period="TIME_PERIOD", measure="MEASURE", value="OBS_VALUE"):
+        series_codes = data.groupby(dims, sort=True, observed=True, dropna=False).ngroup().to_numpy()
+        _, first = np.unique(series_codes, return_index=True)
+        series = data[dims].iloc[first]
+        period_codes, periods = pd.factorize(data[period], sort=True)
+        measure_codes, measures = pd.factorize(data[measure], sort=True)
+
+        values = np.full((len(series), len(periods), len(measures)), np.nan)
+        values[series_codes, period_codes, measure_codes] = data[value].to_numpy(dtype="float64")
+        return cls(values, series, periods, measures)
+
+    # Back to long observations; missing observations are dropped unless dropna=False
+    def to_long(self, period="TIME_PERIOD", measure="MEASURE", value="OBS_VALUE", dropna=True):
+        n_series, n_periods, n_measures = self.values.shape
+        flat = self.values.reshape(-1)
+        keep = ~np.isnan(flat) if dropna else np.ones(len(flat), dtype=bool)
+        series_ids, period_ids, measure_ids = np.unravel_index(np.flatnonzero(keep), self.values.shape)
+        data = self.series.iloc[series_ids].reset_index(drop=True)
+        data[period] = self.periods[period_ids]
+        data[measure] = self.measures[measure_ids]
+        data[value] = flat[keep]
+        return data
+
+    # One row per series and period with a column per measure, sorted by series then period; the
+    # same layout as transform.to_measure_columns
+    def to_frame(self, period="TIME_PERIOD"):
+        n_series, n_periods, n_measures = self.values.shape
+        data = self.series.iloc[np.repeat(np.arange(n_series), n_periods)].reset_index(drop=True)
+        data[period] = np.tile(np.asarray(self.periods), n_series)
+        measures = pd.DataFrame(self.values.reshape(n_series * n_periods, n_measures), columns=self.measures.astype(str))
+        return pd.concat([data, measures], axis=1)
+
+    def _with_values(self, values, measures=None):
+        return Panel(values, self.series, self.periods, self.measures if measures is None else measures)
+
+    # Position of a series from its dimension values, in the order of self.dims
+    def locate(self, *key):
+        if self._positions is None:
+            self._positions = {tuple(row): i for i, row in enumerate(self.series.itertuples(index=False, name=None))}
+        return self._positions[tuple(key)]
+
+    # [period, measure] values of one series
+    def get(self, *key):
+        return pd.DataFrame(self.values[self.locate(*key)], index=self.periods, columns=self.measures)
+
+    # Rolling sum over the last `window` periods of every series and measure, NaN unless at least
+    # min_periods (default: window) of them are present, like rolling(window, min_periods).sum()
+    @stage("rolling")
+    def rolling_sum(self, window, min_periods=None):
+        if min_periods is None:
+            min_periods = window
+        present = ~np.isnan(self.values)
+        filled = np.where(present, self.values, 0.0)
+        sums = filled.copy()
+        counts = present.astype(np.int64)
+        for lag in range(1, window):
+            sums[:, lag:] += filled[:, :-lag]
+            counts[:, lag:] += present[:, :-lag]
+        return self._with_values(np.where(counts >= min_periods, sums, np.nan))
+
+    # Growth over `lag` periods (0.05 for 5%)
+    def growth(self, lag=1):
+        result = np.full_like(self.values, np.nan)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result[:, lag:] = self.values[:, lag:] / self.values[:, :-lag] - 1.0
+        result[~np.isfinite(result)] = np.nan
+        return self._with_values(result)
+
+    # Sum the series over every dimension not in `by`; a cell stays NaN only if no series had a value
+    def aggregate(self, by):
+        codes = self.series.groupby(by, sort=True, observed=True, dropna=False).ngroup().to_numpy()
+        _, first = np.unique(codes, return_index=True)
+        shape = (len(first),) + self.values.shape[1:]
+        sums = np.zeros(shape)
+        counts = np.zeros(shape, dtype=np.int64)
+        present = ~np.isnan(self.values)
+        np.add.at(sums, codes, np.where(present, self.values, 0.0))
+        np.add.at(counts, codes, present)
+        return Panel(np.where(counts > 0, sums, np.nan), self.series[by].iloc[first], self.periods, self.measures)
+
+    # Select measures (and rename them) as a new panel
+    def select(self, measures, names=None):
+        positions = self.measures.get_indexer(measures)
+        return self._with_values(self.values[:, :, positions], pd.Index(names or measures))
+
+    # Measures of another panel over the same series and periods (e.g. its rolling sums) added
+    # after this panel's
+    def join(self, other):
+        if other.values.shape[:2] != self.values.shape[:2]:
+            raise ValueError("Panels to join must have the same series and periods")
+        return self._with_values(np.concatenate([self.values, other.values], axis=2), self.measures.append(other.measures))
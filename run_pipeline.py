@@ -0,0 +1,226 @@
+# Run the builders as one pipeline.
+#
+#   python run_pipeline.py [--full-refresh] [--force] [--workers N] [BUILDER ...]
+#
+# Every builder is split into three stages, fetch -> transform -> write (see the fetch/transform/
+# write functions of each build_*.py), and the stages form an explicit DAG: a builder's transform
+# needs its fetch and its write needs its transform, while different builders are independent.
+# Ready stages run concurrently in a process pool, so a refresh takes about as long as the slowest
+# builder rather than the sum of all of them.
+#
+# A stage's inputs are fingerprinted: the hash of the payload it receives (the fetched frames or
+# downloaded workbook), the codelist version and the code version (the builder plus the shared
+# modules). A transform or write whose fingerprint matches its last successful run is skipped.
+# Fetches always run, because only fetching can tell whether ABS has published something new;
+# the HTTP cache and incremental requests keep an unchanged fetch cheap. --force reruns everything.
+import argparse
+import hashlib
+import importlib
+import inspect
+import json
+import os
+import pickle
+import time
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import datetime, timezone
+
+import pandas as pd
+
+import codelist
+import httpcache
+import instrument
+
+BUILDERS = [
+    "build_app",
+    "build_act",
+    "build_app_sa2",
+    "build_app_demolition",
+    "buid_act_value_of_work_not_yet_commenced",
+    "build_act_dwellings_not_yet_commenced",
+]
+
+# Modules every builder depends on; a change to any of them reruns every builder
+SHARED_MODULES = [
+    "codelist", "delta", "dhandler", "factstore", "httpcache", "instrument", "output", "panel",
+    "schema", "sdmxcsv", "starschema", "statestore", "transform", "workbook", "workqueue",
+]
+
+PIPELINE_DIR = "pipeline"
+STATE_FILE = "state.json"
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+Stage = namedtuple("Stage", "name builder func deps")
+
+# The DAG: fetch -> transform -> write for every builder
+def plan(builders=BUILDERS):
+    stages = []
+    for builder in builders:
+        stages += [
+            Stage(f"{builder}.fetch", builder, "fetch", ()),
+            Stage(f"{builder}.transform", builder, "transform", (f"{builder}.fetch",)),
+            Stage(f"{builder}.write", builder, "write", (f"{builder}.transform",)),
+        ]
+    return stages
+
+def _pipeline_dir():
+    path = os.path.join(httpcache.CACHE_DIR, PIPELINE_DIR)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+def _artifact_path(stage_name):
+    return os.path.join(_pipeline_dir(), f"{stage_name}.pkl")
+
+def load_state():
+    try:
+        with open(os.path.join(_pipeline_dir(), STATE_FILE)) as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+def save_state(state):
+    path = os.path.join(_pipeline_dir(), STATE_FILE)
+    with open(f"{path}.tmp", "w") as file:
+        json.dump(state, file, indent=2, sort_keys=True)
+    os.replace(f"{path}.tmp", path)
+
+# Hash of a stage payload: frames by content (pd.util.hash_pandas_object), file paths by the
+# file's bytes, containers element by element, anything else by its pickle
+def fingerprint(obj):
+    digest = hashlib.sha256()
+    if isinstance(obj, pd.DataFrame):
+        digest.update(repr((list(obj.columns), [str(dtype) for dtype in obj.dtypes])).encode())
+        digest.update(pd.util.hash_pandas_object(obj, index=True).to_numpy().tobytes())
+    elif isinstance(obj, str) and os.path.isfile(obj):
+        with open(obj, "rb") as file:
+            for block in iter(lambda: file.read(1 << 20), b""):
+                digest.update(block)
+    elif isinstance(obj, (list, tuple)):
+        for item in obj:
+            digest.update(fingerprint(item).encode())
+    else:
+        digest.update(pickle.dumps(obj))
+    return digest.hexdigest()
+
+def code_version(builder):
+    digest = hashlib.sha256()
+    for module in [builder] + SHARED_MODULES:
+        with open(os.path.join(HERE, f"{module}.py"), "rb") as file:
+            digest.update(file.read())
+    return digest.hexdigest()
+
+# Codelist version from the last sync, or a hash of the tables if they were never synced
+def codelist_version():
+    version = codelist.version()
+    if version is not None:
+        return version
+    digest = hashlib.sha256()
+    for name in sorted(os.listdir(codelist.CODELIST_DIR)):
+        with open(os.path.join(codelist.CODELIST_DIR, name), "rb") as file:
+            digest.update(file.read())
+    return digest.hexdigest()[:12]
+
+# Runs in a worker process: call builder.func on the dependencies' artifacts, keep the result as
+# this stage's artifact, write the stage's instrumentation report and return the fingerprint
+def run_stage(builder, func, input_paths, output_path, options):
+    instrument.reset()
+    module = importlib.import_module(builder)
+    function = getattr(module, func)
+    inputs = []
+    for path in input_paths:
+        with open(path, "rb") as file:
+            inputs.append(pickle.load(file))
+    accepted = inspect.signature(function).parameters
+    try:
+        result = function(*inputs, **{key: value for key, value in options.items() if key in accepted})
+    finally:
+        instrument.write_report(f"{builder}.{func}")
+
+    with open(f"{output_path}.tmp", "wb") as file:
+        pickle.dump(result, file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(f"{output_path}.tmp", output_path)
+    return fingerprint(result)
+
+def run(builders=BUILDERS, workers=None, force=False, **options):
+    stages = plan(builders)
+    state = load_state()
+    codelists = codelist_version()
+    code = {builder: code_version(builder) for builder in builders}
+
+    outputs, results = {}, {}
+    pending = list(stages)
+    running = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        while pending or running:
+            for stage in list(pending):
+                if any(dep not in outputs and dep not in results for dep in stage.deps):
+                    continue
+                pending.remove(stage)
+                if any(results.get(dep) == "failed" or results.get(dep) == "blocked" for dep in stage.deps):
+                    results[stage.name] = "blocked"
+                    continue
+                inputs = hashlib.sha256(
+                    json.dumps([code[stage.builder], codelists, [outputs[dep] for dep in stage.deps]]).encode()
+                ).hexdigest()
+                previous = state.get(stage.name, {})
+                if (
+                    not force
+                    and stage.deps
+                    and previous.get("inputs") == inputs
+                    and os.path.exists(_artifact_path(stage.name))
+                ):
+                    outputs[stage.name] = previous["output"]
+                    results[stage.name] = "skipped"
+                    print(f"{stage.name}: unchanged, skipped")
+                    continue
+                future = pool.submit(
+                    run_stage,
+                    stage.builder,
+                    stage.func,
+                    [_artifact_path(dep) for dep in stage.deps],
+                    _artifact_path(stage.name),
+                    options,
+                )
+                running[future] = (stage, inputs, time.monotonic())
+                print(f"{stage.name}: started")
+
+            if not running:
+                continue
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                stage, inputs, started = running.pop(future)
+                elapsed = time.monotonic() - started
+                try:
+                    outputs[stage.name] = future.result()
+                except Exception as error:
+                    results[stage.name] = "failed"
+                    print(f"{stage.name}: failed after {elapsed:.1f}s: {error!r}")
+                    continue
+                results[stage.name] = "done"
+                state[stage.name] = {
+                    "inputs": inputs,
+                    "output": outputs[stage.name],
+                    "finished_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                    "seconds": round(elapsed, 3),
+                }
+                save_state(state)
+                print(f"{stage.name}: done in {elapsed:.1f}s")
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the builders as a pipeline of fetch/transform/write stages")
+    parser.add_argument("builders", nargs="*", default=BUILDERS, help="builders to run (default: all)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument("--force", action="store_true", help="rerun stages even if their inputs are unchanged")
+    parser.add_argument("--full-refresh", action="store_true", help="refetch the full history instead of the latest periods")
+    parser.add_argument("--restart", action="store_true", help="restart the month's SA2 crawl from scratch")
+    args = parser.parse_args()
+
+    unknown = sorted(set(args.builders) - set(BUILDERS))
+    if unknown:
+        parser.error(f"unknown builders: {', '.join(unknown)}")
+    results = run(args.builders, args.workers, args.force, full_refresh=args.full_refresh, restart=args.restart)
+    failed = sorted(name for name, result in results.items() if result in ("failed", "blocked"))
+    if failed:
+        raise SystemExit(f"{len(failed)} stages failed or were blocked: {', '.join(failed)}")
@@ -0,0 +1,139 @@
+# Dtype policy of the frames the builders handle, declared once per dataset: the SDMX dataflows
+# as extract_data returns them (long layout) and every builder output, by output name.
+#
+#   dimensions  categorical (every text column not declared below)
+#   counts      Int32, nullable because ABS leaves cells blank (dwelling units, demolitions, ...)
+#   dollars     float64, the only float columns
+#   period      int32 period ordinal (months or quarters since 1970), the pandas Period ordinal
+#
+# enforce() applies a dataset's policy, from ingestion (dhandler) to the end of each builder's
+# transform. Periods stay ordinals all the way through, so sorting, stitching and windowing
+# compare 4-byte integers instead of strings and 'Month Time'/'Quarter Time' come from the ordinals
+# without reparsing labels; render() turns them back into '2021-07'/'2021Q3' labels at write time
+# (output.write_output), so the published files keep their labels.
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+COUNT = "Int32"
+DOLLARS = "float64"
+PERIOD = "int32"
+DIMENSION = "category"
+
+# Period labels as the builders publish them
+LABEL_FORMATS = {"M": "%Y-%m", "Q": "%YQ%q"}
+
+Schema = namedtuple("Schema", "freq period counts dollars")
+
+# OBS_VALUE of a long frame holds every measure, counts and dollars alike, so it stays float64
+_BA_SA2 = Schema("M", "TIME_PERIOD", (), ("OBS_VALUE",))
+
+SCHEMAS = {
+    # SDMX dataflows, by resource id
+    "BA_SA2": _BA_SA2,
+    "BA_SA2_2016-21": _BA_SA2,
+    "BUILDING_ACTIVITY": Schema("Q", "TIME_PERIOD", (), ("OBS_VALUE",)),
+    # Builder outputs, by output name
+    "build_app": Schema(
+        "M", "Month",
+        ("Dwelling Units", "Year-End Dwelling Units"),
+        ("Building Jobs Value", "Year-End Building Jobs Value"),
+    ),
+    "build_act": Schema(
+        "Q", "Quarter",
+        (
+            "Dwelling Units Commenced", "Dwelling Units Completed", "Dwelling Units Under Construction",
+            "Year-End Dwelling Units Commenced", "Year-End Dwelling Units Completed", "Year-End Dwelling Units Under Construction",
+        ),
+        (
+            "Work Done", "Work Yet to be Done", "Work Commenced", "Work Completed", "Work Under Construction",
+            "Year-End Work Done During Quarter", "Year-End Work Yet To Be Done", "Year-End Work Commenced",
+            "Year-End Work Completed", "Year-End Work Under Construction",
+        ),
+    ),
+    "build_app_sa2": _BA_SA2,
+    "building_approvals_demolition_1": Schema(
+        "Q", "Quarter",
+        ("Dwelling Units Approved for Demolition", "Year-End Dwelling Units Approved for Demolition"),
+        (),
+    ),
+    "building_activity_value_of_work_not_yet_commenced_1": Schema(
+        "Q", "Quarter",
+        (),
+        ("Value of work not yet commenced", "Year-End Value of Work Not Yet Commenced"),
+    ),
+    "building_activity_dwelling_units_not_yet_commenced_1": Schema(
+        "Q", "Quarter",
+        ("Dwelling Units Not Yet Commenced", "Year-End Dwelling Units Not Yet Commenced"),
+        (),
+    ),
+}
+
+def freq(name):
+    schema = SCHEMAS.get(name)
+    return schema.freq if schema is not None else None
+
+# int32 ordinals of period labels ('2021-07', '2021Q3' or SDMX's '2021-Q3'), parsing each distinct
+# label once. Ordinals pass through unchanged
+def period_ordinals(values, freq):
+    if pd.api.types.is_integer_dtype(values):
+        return np.asarray(values, dtype=np.int32)
+    labels = pd.Categorical(values)
+    if (labels.codes < 0).any():
+        raise ValueError("Periods cannot be missing")
+    categories = labels.categories.astype(str).str.replace("-Q", "Q", regex=False)
+    ordinals = pd.PeriodIndex(categories, freq=freq).asi8.astype(np.int32)
+    return ordinals[labels.codes]
+
+# Labels of period ordinals, formatted once per distinct period
+def period_labels(ordinals, freq):
+    codes, uniques = pd.factorize(np.asarray(ordinals))
+    labels = pd.PeriodIndex.from_ordinals(uniques, freq=freq).strftime(LABEL_FORMATS[freq])
+    return labels.to_numpy(dtype=object)[codes]
+
+# Last day of each period (ordinals or labels), as the builders' 'Month Time'/'Quarter Time'
+def period_end(values, freq):
+    uniques, inverse = np.unique(period_ordinals(values, freq), return_inverse=True)
+    ends = pd.PeriodIndex.from_ordinals(uniques, freq=freq).end_time.normalize()
+    return ends[inverse.reshape(-1)].to_numpy()
+
+# Counts become Int32 unless a column holds fractional or out-of-range values (e.g. a trend
+# series), which stays float64 rather than being truncated
+def _counts(column, name):
+    if isinstance(column.dtype, pd.Int32Dtype):
+        return column
+    values = column.to_numpy(dtype="float64", na_value=np.nan)
+    present = values[~np.isnan(values)]
+    if len(present) and ((present != np.round(present)).any() or np.abs(present).max() > np.iinfo(np.int32).max):
+        print(f"{name}: {column.name} is not a whole-number count, kept as float64")
+        return column.astype(DOLLARS)
+    return column.astype(COUNT)
+
+# Apply the dtype policy of dataset name to data. Returns a new frame (the input is left as it
+# was); a name without a schema is returned unchanged
+def enforce(data, name):
+    schema = SCHEMAS.get(name)
+    if schema is None or data is None:
+        return data
+    declared = {schema.period, *schema.counts, *schema.dollars}
+    columns = {}
+    if schema.period in data.columns:
+        columns[schema.period] = period_ordinals(data[schema.period], schema.freq)
+    for col in schema.counts:
+        if col in data.columns:
+            columns[col] = _counts(data[col], name)
+    for col in schema.dollars:
+        if col in data.columns:
+            columns[col] = data[col].astype(DOLLARS)
+    for col in data.columns:
+        if col not in declared and (pd.api.types.is_string_dtype(data[col]) or pd.api.types.is_object_dtype(data[col])) and not isinstance(data[col].dtype, pd.CategoricalDtype):
+            columns[col] = data[col].astype(DIMENSION)
+    return data.assign(**columns)
+
+# data with the period ordinals of dataset name turned back into labels, for writing
+def render(data, name):
+    schema = SCHEMAS.get(name)
+    if schema is None or schema.period not in data.columns or not pd.api.types.is_integer_dtype(data[schema.period]):
+        return data
+    return data.assign(**{schema.period: period_labels(data[schema.period], schema.freq)})
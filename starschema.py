@@ -0,0 +1,131 @@
+# Star-schema export of the builder outputs (the 'star' output format, see output.py). The fact
+# file keeps the measures plus integer surrogate keys for period, region, region type, work type,
+# sector and building type; the labels and the period dates live once in the dimension tables
+# next to it (star/dim_<dimension>.csv). The dimensions are conformed across builders: the date
+# dimension is seeded from date.csv (month-ends since 1955), building types from build_type.csv,
+# the others from the codelists, and they are kept between runs so a key never changes meaning.
+# Members not seen before (e.g. months after the end of date.csv) are appended with new keys.
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+import codelist
+from factstore import DIMENSION_COLUMNS
+
+STAR_DIR = os.environ.get("BUILD_STAR_DIR", "star")
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DATE_FILE = os.path.join(HERE, "date.csv")
+BUILD_TYPE_FILE = os.path.join(HERE, "build_type.csv")
+
+DATE = "date"
+
+# Codelist each label dimension is seeded from
+CODELISTS = {
+    "region": "REGION",
+    "region_type": "REGION_TYPE",
+    "work_type": "WORK_TYPE",
+    "sector": "SECTOR",
+    "building_type": "BUILDING_TYPE",
+}
+
+def _key(dim):
+    return f"{dim}_key"
+
+def _dim_path(dim, star_dir):
+    return os.path.join(star_dir, f"dim_{dim}.csv")
+
+# Month-end dates of '2021-07' (month) or '2021Q3' (quarter) period labels, worked out once per
+# distinct label
+def period_end(periods):
+    labels, inverse = np.unique(np.asarray(periods).astype(str), return_inverse=True)
+    ends = [pd.Period(label, freq="Q" if "Q" in label else "M").end_time.normalize() for label in labels]
+    return pd.DatetimeIndex(ends)[inverse.reshape(-1)]
+
+def _date_rows(dates, start_key):
+    dates = pd.DatetimeIndex(dates)
+    return pd.DataFrame({
+        _key(DATE): np.arange(start_key, start_key + len(dates), dtype=np.int32),
+        "Date": dates.strftime("%Y-%m-%d"),
+        "Month": dates.strftime("%Y-%m"),
+        "Quarter": dates.to_period("Q").astype(str),
+        "Year": dates.year.astype(np.int16),
+    })
+
+def _seed(dim):
+    if dim == DATE:
+        dates = pd.read_csv(DATE_FILE, encoding="utf-8-sig")["Date"]
+        return _date_rows(pd.to_datetime(dates, format="%d/%m/%Y"), 1)
+    labels = list(codelist.labels(CODELISTS[dim]).values())
+    if dim == "building_type":
+        labels = pd.read_csv(BUILD_TYPE_FILE, encoding="utf-8-sig")["Building Type"].tolist() + labels
+    labels = list(dict.fromkeys(labels))
+    return pd.DataFrame({_key(dim): np.arange(1, len(labels) + 1, dtype=np.int32), dim: labels})
+
+def load_dimension(dim, star_dir=STAR_DIR):
+    path = _dim_path(dim, star_dir)
+    if os.path.exists(path):
+        return pd.read_csv(path, dtype={_key(dim): np.int32}, keep_default_na=False)
+    return _seed(dim)
+
+# Append members not in the table yet; returns the table and whether it grew
+def _extend(table, dim, members):
+    known = table["Date"] if dim == DATE else table[dim]
+    new = pd.Index(members).unique().difference(pd.Index(known))
+    if not len(new):
+        return table, False
+    start = int(table[_key(dim)].max()) + 1 if len(table) else 1
+    if dim == DATE:
+        rows = _date_rows(pd.to_datetime(new.sort_values()), start)
+    else:
+        rows = pd.DataFrame({_key(dim): np.arange(start, start + len(new), dtype=np.int32), dim: list(new.sort_values())})
+    return pd.concat([table, rows], ignore_index=True), True
+
+# Builders may export concurrently; the dimension tables are updated under a lock file
+class _DimensionLock:
+    def __init__(self, star_dir, timeout=60):
+        self.path = os.path.join(star_dir, ".lock")
+        self.timeout = timeout
+
+    def __enter__(self):
+        expires = time.monotonic() + self.timeout
+        while True:
+            try:
+                os.close(os.open(self.path, os.O_CREAT | os.O_EXCL))
+                return self
+            except FileExistsError:
+                if time.monotonic() > expires:
+                    raise TimeoutError(f"{self.path} is still held; remove it if no export is running")
+                time.sleep(0.1)
+
+    def __exit__(self, *exc):
+        os.remove(self.path)
+
+# Write <star_dir>/<name>_fact.csv with surrogate keys in place of the dimension labels and the
+# period columns, updating the dimension tables with any new members. Returns the fact file path
+def export_star(data, name, period, star_dir=STAR_DIR):
+    os.makedirs(star_dir, exist_ok=True)
+    sources = {dim: next((col for col in cols if col in data.columns), None) for dim, cols in DIMENSION_COLUMNS.items()}
+    sources = {dim: col for dim, col in sources.items() if col is not None}
+    dates = period_end(data[period].to_numpy())
+
+    keys = {}
+    with _DimensionLock(star_dir):
+        for dim, col in [(DATE, None)] + list(sources.items()):
+            table = load_dimension(dim, star_dir)
+            values = pd.Index(dates.strftime("%Y-%m-%d")) if dim == DATE else pd.Index(data[col].astype(str))
+            table, grew = _extend(table, dim, values)
+            if grew or not os.path.exists(_dim_path(dim, star_dir)):
+                table.to_csv(_dim_path(dim, star_dir), index=False)
+            known = table["Date"] if dim == DATE else table[dim]
+            positions = pd.Index(known).get_indexer(values)
+            keys[_key(dim)] = table[_key(dim)].to_numpy()[positions]
+
+    # The period label and the derived datetime columns (Month Time, Quarter Time) are in dim_date
+    dropped = [period, *sources.values()] + [col for col in data.columns if pd.api.types.is_datetime64_any_dtype(data[col])]
+    fact = pd.concat([pd.DataFrame(keys), data.drop(columns=dropped).reset_index(drop=True)], axis=1)
+    path = os.path.join(star_dir, f"{name}_fact.csv")
+    fact.to_csv(path, index=False)
+    return path
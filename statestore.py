@@ -0,0 +1,83 @@
+# Local state kept between runs of the builders, next to the HTTP cache: a small SQLite database
+# of per dataflow/key period watermarks, plus the merged history frame for each key, so a
+# routine run only has to request the latest periods from ABS (see dhandler.extract_data)
+import hashlib
+import os
+import sqlite3
+import threading
+from datetime import datetime, timezone
+
+import pandas as pd
+
+import httpcache
+
+STATE_DB = "state.db"
+HISTORY_DIR = "history"
+
+_lock = threading.Lock()
+
+def connect():
+    os.makedirs(httpcache.CACHE_DIR, exist_ok=True)
+    connection = sqlite3.connect(os.path.join(httpcache.CACHE_DIR, STATE_DB), timeout=30)
+    connection.execute(
+        """CREATE TABLE IF NOT EXISTS watermarks (
+            dataflow TEXT NOT NULL,
+            key TEXT NOT NULL,
+            last_period TEXT NOT NULL,
+            updated_at TEXT NOT NULL,
+            PRIMARY KEY (dataflow, key)
+        )"""
+    )
+    return connection
+
+# Return (last_period, updated_at) for a dataflow and key, or None if it was never fetched
+def get_watermark(dataflow, key):
+    with _lock:
+        connection = connect()
+        try:
+            return connection.execute(
+                "SELECT last_period, updated_at FROM watermarks WHERE dataflow = ? AND key = ?",
+                (dataflow, key),
+            ).fetchone()
+        finally:
+            connection.close()
+
+def set_watermark(dataflow, key, last_period):
+    with _lock:
+        connection = connect()
+        try:
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO watermarks VALUES (?, ?, ?, ?)",
+                    (dataflow, key, last_period, datetime.now(timezone.utc).isoformat(timespec="seconds")),
+                )
+        finally:
+            connection.close()
+
+def clear_watermark(dataflow, key):
+    with _lock:
+        connection = connect()
+        try:
+            with connection:
+                connection.execute("DELETE FROM watermarks WHERE dataflow = ? AND key = ?", (dataflow, key))
+        finally:
+            connection.close()
+
+# The history of a key is kept separately for each layout extract_data can return
+def _history_path(dataflow, key, layout):
+    digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+    suffix = "" if layout == "wide" else f"_{layout}"
+    return os.path.join(httpcache.CACHE_DIR, HISTORY_DIR, f"{dataflow}_{digest}{suffix}.pkl")
+
+def load_history(dataflow, key, layout="wide"):
+    path = _history_path(dataflow, key, layout)
+    if not os.path.exists(path):
+        return None
+    return pd.read_pickle(path)
+
+def save_history(dataflow, key, data, layout="wide"):
+    path = _history_path(dataflow, key, layout)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    data.to_pickle(tmp_path)
+    os.replace(tmp_path, path)
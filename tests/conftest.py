@@ -0,0 +1,15 @@
+import os
+import sys
+
+import pytest
+
+# The modules sit at the top of the repository, as the builders import them
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpcache
+
+# Point the cache (and everything kept under it) at a fresh directory for each test
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(httpcache, "CACHE_DIR", str(tmp_path))
+    return tmp_path
@@ -0,0 +1,39 @@
+import pandas as pd
+import pytest
+
+import build_app_sa2
+import workqueue
+
+def test_completed_crawl_is_fetched_again(cache_dir, monkeypatch):
+    requested = []
+
+    def extract_data(url, **kwargs):
+        requested.append(url)
+        return pd.DataFrame({"REGION": ["101021007"], "TIME_PERIOD": [620], "OBS_VALUE": [1.0]})
+    monkeypatch.setattr(workqueue, "extract_data", extract_data)
+
+    first = build_app_sa2.fetch()
+    planned = len(build_app_sa2.base_urls) * len(build_app_sa2.region_types) * len(build_app_sa2.building_type)
+    assert len(requested) == planned
+
+    # A later run in the same month must go back to ABS rather than replay the checkpoints
+    second = build_app_sa2.fetch()
+    assert len(requested) == 2 * planned
+    assert [len(vintage) for vintage in second] == [len(vintage) for vintage in first]
+
+def test_interrupted_crawl_resumes(cache_dir, monkeypatch):
+    requested = []
+
+    # The first request for all buildings in the 2016-21 vintage fails
+    def extract_data(url, **kwargs):
+        requested.append(url)
+        if "BA_SA2_2016-21" in url and "...TOT." in url and requested.count(url) == 1:
+            return None
+        return pd.DataFrame({"REGION": ["101021007"], "TIME_PERIOD": [620], "OBS_VALUE": [1.0]})
+    monkeypatch.setattr(workqueue, "extract_data", extract_data)
+
+    with pytest.raises(RuntimeError, match="1 requests still outstanding"):
+        build_app_sa2.fetch()
+    planned = len(requested)
+    build_app_sa2.fetch()
+    assert len(requested) == planned + 1
@@ -0,0 +1,13 @@
+import codelist_sync
+import dhandler
+
+# Data and structure queries share ABS_API_BASE, so one stand-in serves both
+def test_structure_queries_follow_the_api_base(monkeypatch):
+    monkeypatch.setattr(dhandler, "API_BASE", "http://127.0.0.1:8765/api")
+    assert codelist_sync.structure_url("BA_SA2") == "http://127.0.0.1:8765/api/dataflow/ABS/BA_SA2/latest"
+    assert dhandler.route("https://api.data.abs.gov.au/data/BA_SA2/1.2") == "http://127.0.0.1:8765/api/data/BA_SA2/1.2"
+
+def test_base_url_overrides_the_origin(monkeypatch):
+    monkeypatch.setattr(dhandler, "API_BASE", None)
+    assert codelist_sync.structure_url("BA_SA2") == "https://api.data.abs.gov.au/dataflow/ABS/BA_SA2/latest"
+    assert codelist_sync.structure_url("BA_SA2", "http://localhost:9000/") == "http://localhost:9000/dataflow/ABS/BA_SA2/latest"
@@ -0,0 +1,37 @@
+import pandas as pd
+import pytest
+
+import delta
+
+def _output(rows):
+    return pd.DataFrame(rows, columns=["State", "Month", "Dwelling Units"])
+
+def test_diff_inserted_updated_deleted():
+    old = _output([("Victoria", "2021-07", 10.0), ("Victoria", "2021-08", 20.0), ("Queensland", "2021-07", 30.0)])
+    new = _output([("Victoria", "2021-07", 10.0), ("Victoria", "2021-08", 25.0), ("Victoria", "2021-09", 40.0)])
+    changes = delta.diff(old, new)
+
+    assert list(changes.columns) == ["change", "State", "Month", "Dwelling Units (old)", "Dwelling Units (new)"]
+    records = changes.astype(object).where(changes.notna(), None).values.tolist()
+    assert records == [
+        ["insert", "Victoria", "2021-09", None, 40.0],
+        ["update", "Victoria", "2021-08", 20.0, 25.0],
+        ["delete", "Queensland", "2021-07", 30.0, None],
+    ]
+
+def test_diff_ignores_a_dtype_change_of_unchanged_values():
+    old = _output([("Victoria", "2021-07", 10.0)])
+    new = old.astype({"Dwelling Units": "Int32"})
+    assert delta.diff(old, new).empty
+
+def test_diff_first_publication_is_all_inserts():
+    new = _output([("Victoria", "2021-07", 10.0), ("Victoria", "2021-08", 20.0)])
+    assert list(delta.diff(None, new)["change"]) == ["insert", "insert"]
+
+def test_diff_rejects_non_unique_keys():
+    old = _output([("Victoria", "2021-07", 10.0)])
+    new = _output([("Victoria", "2021-07", 10.0), ("Victoria", "2021-07", 11.0)])
+    with pytest.raises(ValueError, match="not unique"):
+        delta.diff(old, new)
+    with pytest.raises(ValueError, match="not unique"):
+        delta.diff(new, old)
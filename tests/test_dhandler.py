@@ -0,0 +1,148 @@
+import os
+
+import pandas as pd
+import pytest
+import requests
+from urllib3.exceptions import ReadTimeoutError
+
+import dhandler
+import httpcache
+import schema
+import statestore
+
+class _Response:
+    def __init__(self, status_code, body=b""):
+        self.status_code = status_code
+        self.headers = {"ETag": '"1"'}
+        self._body = body
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error", response=self)
+
+    def iter_content(self, chunk_size):
+        yield self._body
+
+    def close(self):
+        pass
+
+class _Session:
+    def get(self, url, params=None, headers=None, timeout=None, stream=False):
+        return _Response(200, b"<message/>")
+
+def _job():
+    return dhandler._Job("test", "BA_SA2", 1, 0, None, None, "sdmx", "long", {})
+
+# ABS rejects any query for more than two regions with a 504
+def _fetch_frame(job, key):
+    regions = key.split(".")[1].split("+")
+    if len(regions) > 2:
+        raise requests.HTTPError("504 Gateway Timeout", response=_Response(504))
+    return pd.DataFrame({"REGION": regions})
+
+def test_split_query_then_evict(cache_dir, monkeypatch):
+    monkeypatch.setattr(dhandler, "_fetch_frame", _fetch_frame)
+
+    data = dhandler._fetch_adaptive(_job(), "1.101+102+103+104+105.M")
+    assert list(data["REGION"]) == ["101", "102", "103", "104", "105"]
+    assert dhandler.get_chunk_size("BA_SA2") == 2
+    assert not [name for name in os.listdir(cache_dir) if name.endswith(".json")]
+
+    # Storing a response evicts, which must neither trip over the learned sizes nor drop them
+    path = httpcache.fetch("https://example.test/data", session=_Session())
+    assert open(path, "rb").read() == b"<message/>"
+    httpcache.evict(max_bytes=0)
+    assert not os.path.exists(path)
+    assert dhandler.get_chunk_size("BA_SA2") == 2
+
+def test_learned_chunk_size_grows_back(cache_dir, monkeypatch):
+    monkeypatch.setattr(dhandler, "CHUNK_GROW_AFTER", 2)
+    requested = []
+    rejected = []
+
+    # Only the very first request is rejected, a transient 504
+    def fetch_frame(job, key):
+        requested.append(key)
+        if not rejected:
+            rejected.append(key)
+            raise requests.HTTPError("504 Gateway Timeout", response=_Response(504))
+        return pd.DataFrame({"REGION": key.split(".")[1].split("+")})
+    monkeypatch.setattr(dhandler, "_fetch_frame", fetch_frame)
+
+    key = "1.101+102+103+104+105.M"
+    dhandler._fetch_adaptive(_job(), key)
+    assert dhandler.get_chunk_size("BA_SA2") == 3
+    dhandler._fetch_adaptive(_job(), key)
+    assert dhandler.get_chunk_size("BA_SA2") == 3
+    dhandler._fetch_adaptive(_job(), key)
+    assert dhandler.get_chunk_size("BA_SA2") == 6
+
+    # Chunks of 6 codes cover the whole key, so it goes out as one request again
+    del requested[:]
+    data = dhandler._fetch_adaptive(_job(), key)
+    assert requested == [key]
+    assert len(data) == 5
+
+def test_timeout_while_streaming_splits_the_query(cache_dir, monkeypatch):
+    def fetch_frame(job, key):
+        regions = key.split(".")[1].split("+")
+        if len(regions) > 2:
+            raise requests.ConnectionError(ReadTimeoutError(None, key, "Read timed out."))
+        return pd.DataFrame({"REGION": regions})
+    monkeypatch.setattr(dhandler, "_fetch_frame", fetch_frame)
+
+    data = dhandler._fetch_adaptive(_job(), "1.101+102+103+104+105.M")
+    assert len(data) == 5
+    assert dhandler.get_chunk_size("BA_SA2") == 2
+
+def test_evict_skips_other_json(cache_dir):
+    (cache_dir / "chunk_sizes.json").write_text('{"BA_SA2": 2}')
+    httpcache.fetch("https://example.test/data", session=_Session())
+    httpcache.evict(max_bytes=0)
+    assert (cache_dir / "chunk_sizes.json").exists()
+
+# Monthly observations of one series from start to 2021-12, as _fetch_frame returns them
+def _slice(job, key):
+    start = job.params.get("startPeriod", "2021-01")
+    periods = pd.period_range(start, "2021-12", freq="M").strftime("%Y-%m")
+    return schema.enforce(pd.DataFrame({"REGION": "AUS", "TIME_PERIOD": periods, "OBS_VALUE": 1.0}), job.resource_id)
+
+def _first_run(monkeypatch):
+    monkeypatch.setattr(dhandler, "_fetch_frame", _slice)
+    history = dhandler._extract_incremental(_job(), "1.AUS.M", False)
+    assert len(history) == 12
+    return history
+
+def test_incremental_no_records_keeps_history(cache_dir, monkeypatch):
+    history = _first_run(monkeypatch)
+
+    def no_records(job, key):
+        raise requests.HTTPError("404 NoRecordsFound", response=_Response(404))
+    monkeypatch.setattr(dhandler, "_fetch_frame", no_records)
+    pd.testing.assert_frame_equal(dhandler._extract_incremental(_job(), "1.AUS.M", False), history)
+
+    monkeypatch.setattr(dhandler, "_fetch_frame", lambda job, key: _slice(job, key).iloc[:0])
+    pd.testing.assert_frame_equal(dhandler._extract_incremental(_job(), "1.AUS.M", False), history)
+    assert statestore.get_watermark("BA_SA2", "1.AUS.M")[0] == "2021-12"
+
+def test_incremental_failed_slice_returns_history(cache_dir, monkeypatch):
+    history = _first_run(monkeypatch)
+
+    def reset(job, key):
+        raise requests.ConnectionError("Connection reset by peer")
+    monkeypatch.setattr(dhandler, "_fetch_frame", reset)
+    pd.testing.assert_frame_equal(dhandler._extract_incremental(_job(), "1.AUS.M", False), history)
+
+class _BrokenResponse(_Response):
+    def iter_content(self, chunk_size):
+        yield b"<mess"
+        raise requests.ConnectionError("Connection reset by peer")
+
+class _BrokenSession:
+    def get(self, url, params=None, headers=None, timeout=None, stream=False):
+        return _BrokenResponse(200)
+
+def test_interrupted_download_leaves_no_partial_file(cache_dir):
+    with pytest.raises(requests.ConnectionError):
+        httpcache.fetch("https://example.test/data", session=_BrokenSession())
+    assert os.listdir(cache_dir) == []
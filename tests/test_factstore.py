@@ -0,0 +1,40 @@
+import pandas as pd
+
+import factstore
+
+def _output(value):
+    return pd.DataFrame({
+        "State": ["Victoria", "Victoria", "Queensland"],
+        "Sector": ["Total Sector"] * 3,
+        "Month": ["2021-07", "2021-08", "2021-07"],
+        "Dwelling Units": [10.0, value, 30.0],
+        "Building Jobs Value": [1.5, 2.5, None],
+    })
+
+def _facts(connection):
+    return pd.read_sql("SELECT * FROM facts ORDER BY region, period, measure", connection)
+
+def test_reupsert_touches_only_changed_facts(tmp_path):
+    connection = factstore.connect(str(tmp_path / "facts.db"))
+    try:
+        assert factstore.bulk_load(connection, factstore.to_facts(_output(20.0), "build_app", "Month"), "run 1") == 5
+        # Unchanged values are not rewritten
+        assert factstore.upsert(connection, factstore.to_facts(_output(20.0), "build_app", "Month"), "run 2") == 0
+        assert set(_facts(connection)["updated_at"]) == {"run 1"}
+
+        assert factstore.upsert(connection, factstore.to_facts(_output(25.0), "build_app", "Month"), "run 3") == 1
+        facts = _facts(connection)
+        changed = facts["updated_at"] == "run 3"
+        assert facts.loc[changed, ["region", "period", "measure", "value"]].values.tolist() == [["Victoria", "2021-08", "Dwelling Units", 25.0]]
+        assert (facts.loc[~changed, "updated_at"] == "run 1").all()
+
+        history = pd.read_sql("SELECT region, period, measure, old_value, new_value, changed_at FROM fact_history", connection)
+        assert history.values.tolist() == [["Victoria", "2021-08", "Dwelling Units", 20.0, 25.0, "run 3"]]
+    finally:
+        connection.close()
+
+def test_write_facts_bulk_loads_then_upserts(tmp_path):
+    path = str(tmp_path / "facts.db")
+    assert factstore.write_facts(_output(20.0), "build_app", "Month", path) == 5
+    assert factstore.write_facts(_output(20.0), "build_app", "Month", path) == 0
+    assert factstore.write_facts(_output(21.0), "build_app", "Month", path) == 1
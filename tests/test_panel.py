@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+
+from panel import Panel
+from transform import rolling_sum, to_measure_columns
+
+DIMS = ["REGION", "BUILDING_TYPE"]
+
+# Long observations of 2 regions x 2 building types x 2 measures over 6 months, with gaps
+def _observations():
+    index = pd.MultiIndex.from_product(
+        [["NSW", "VIC"], ["Houses", "Total"], ["Units", "Value"], range(600, 606)],
+        names=DIMS + ["MEASURE", "TIME_PERIOD"],
+    )
+    data = index.to_frame(index=False)
+    data["OBS_VALUE"] = np.arange(len(data), dtype="float64")
+    data.loc[[3, 17], "OBS_VALUE"] = np.nan
+    data = data.drop(index=[30, 31]).reset_index(drop=True)
+    for col in DIMS + ["MEASURE"]:
+        data[col] = data[col].astype("category")
+    return data.sample(frac=1, random_state=0)
+
+def test_to_frame_matches_to_measure_columns():
+    data = _observations()
+    expected = to_measure_columns(data, DIMS)
+    pd.testing.assert_frame_equal(Panel.from_long(data, DIMS).to_frame(), expected, check_dtype=False)
+
+def test_rolling_sum_matches_the_frame_path():
+    data = _observations()
+    frame = to_measure_columns(data, DIMS)
+    expected = rolling_sum(frame, DIMS, ["Units", "Value"], window=3)
+    rolled = Panel.from_long(data, DIMS).rolling_sum(3).to_frame()
+    np.testing.assert_array_equal(rolled[["Units", "Value"]].to_numpy(), expected.to_numpy())
+
+def test_lookup_growth_and_join():
+    panel = Panel.from_long(_observations(), DIMS)
+    assert panel.get("VIC", "Total").loc[605, "Value"] == 47.0
+    growth = panel.growth().get("VIC", "Total")
+    assert growth.loc[605, "Value"] == 47.0 / 46.0 - 1.0
+    joined = panel.join(panel.select(["Units"], ["Year-End Units"]).rolling_sum(2))
+    assert list(joined.measures) == ["Units", "Value", "Year-End Units"]
+    assert joined.get("NSW", "Houses").loc[602, "Year-End Units"] == 3.0
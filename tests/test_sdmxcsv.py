@@ -0,0 +1,37 @@
+import os
+
+import pandas as pd
+import pytest
+
+import dhandler
+import httpcache
+import sdmxcsv
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+# The same BA_SA2 observations, one value missing, as an SDMX-ML and an SDMX-CSV message
+def _fetch(url, headers=None, **kwargs):
+    csv = (headers or {}).get("Accept") == sdmxcsv.SDMX_CSV
+    return os.path.join(FIXTURES, "ba_sa2.csv" if csv else "ba_sa2.xml")
+
+def _extract(ingest, layout):
+    job = dhandler._Job("test", "BA_SA2", 1, 0, (1, 1), None, ingest, layout, {})
+    return dhandler._fetch_frame(job, "1+2.1+2.M")
+
+@pytest.mark.parametrize("layout", ["long", "wide"])
+def test_csv_ingest_matches_sdmx_ml(monkeypatch, layout):
+    monkeypatch.setattr(httpcache, "fetch", _fetch)
+    expected = _extract("sdmx", layout)
+    pd.testing.assert_frame_equal(_extract("csv", layout), expected)
+
+def test_long_layout(monkeypatch):
+    monkeypatch.setattr(httpcache, "fetch", _fetch)
+    data = _extract("csv", "long")
+    assert list(data.columns) == ["MEASURE", "REGION", "TIME_PERIOD", "OBS_VALUE"]
+    assert len(data) == 7
+    assert data["OBS_VALUE"].isna().sum() == 1
+    assert data["MEASURE"].iloc[0] == "Number of dwelling units"
+
+def test_read_sdmx_csv_across_chunks():
+    path = os.path.join(FIXTURES, "ba_sa2.csv")
+    pd.testing.assert_frame_equal(sdmxcsv.read_sdmx_csv(path, chunk_rows=2), sdmxcsv.read_sdmx_csv(path))
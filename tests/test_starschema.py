@@ -0,0 +1,37 @@
+import pandas as pd
+
+import starschema
+
+def _output(states, months):
+    rows = [(state, month) for state in states for month in months]
+    return pd.DataFrame({
+        "State": [state for state, _ in rows],
+        "Building Type": "Houses",
+        "Month": [month for _, month in rows],
+        "Dwelling Units": range(len(rows)),
+    })
+
+def _keys(path):
+    fact = pd.read_csv(path)
+    return fact[["date_key", "region_key", "building_type_key"]]
+
+def test_surrogate_keys_are_stable_across_exports(tmp_path):
+    first = _output(["Victoria", "Queensland"], ["2021-07", "2021-08"])
+    keys = _keys(starschema.export_star(first, "build_app", "Month", str(tmp_path)))
+    regions = starschema.load_dimension("region", str(tmp_path))
+
+    # A later export with a new region and a month past the end of date.csv only appends members
+    second = pd.concat([_output(["Region Not In Any Codelist"], ["2099-01"]), first], ignore_index=True)
+    again = _keys(starschema.export_star(second, "build_app", "Month", str(tmp_path)))
+    pd.testing.assert_frame_equal(again.iloc[1:].reset_index(drop=True), keys)
+
+    grown = starschema.load_dimension("region", str(tmp_path))
+    pd.testing.assert_frame_equal(grown.iloc[:len(regions)], regions)
+    assert grown.iloc[-1]["region"] == "Region Not In Any Codelist"
+    assert again.loc[0, "region_key"] == grown.iloc[-1]["region_key"]
+    dates = starschema.load_dimension("date", str(tmp_path))
+    assert dates.loc[dates["date_key"] == again.loc[0, "date_key"], "Date"].item() == "2099-01-31"
+
+    # The dimensions are conformed: another builder gets the same keys for the same members
+    other = _keys(starschema.export_star(first.rename(columns={"Dwelling Units": "Value"}), "build_app_demolition", "Month", str(tmp_path)))
+    pd.testing.assert_frame_equal(other, keys)
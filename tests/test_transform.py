@@ -0,0 +1,18 @@
+import pandas as pd
+import pytest
+
+from transform import stitch_vintages
+
+KEYS = ["REGION"]
+
+def _vintage(periods, value):
+    return pd.DataFrame({"REGION": "AUS", "TIME_PERIOD": periods, "OBS_VALUE": value})
+
+def test_stitch_vintages_newest_wins_the_overlap():
+    stitched = stitch_vintages([_vintage([1, 2, 3], 1.0), _vintage([3, 4], 2.0)], KEYS)
+    assert list(stitched["TIME_PERIOD"]) == [1, 2, 3, 4]
+    assert list(stitched["OBS_VALUE"]) == [1.0, 1.0, 2.0, 2.0]
+
+def test_stitch_vintages_raises_on_a_failed_vintage():
+    with pytest.raises(ValueError, match=r"\[0\]"):
+        stitch_vintages([None, _vintage([3, 4], 2.0)], KEYS)
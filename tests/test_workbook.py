@@ -0,0 +1,43 @@
+import datetime
+
+import numpy as np
+import openpyxl
+
+import workbook
+
+DESCRIPTIONS = [
+    "Dwelling units approved for demolition ;  Houses ;  Victoria ;",
+    "Dwelling units approved for demolition ;  Houses ;  Australia ;",
+    "Dwelling units approved for demolition ;  Total (Type of Building) ;  Australia ;",
+]
+FIELDS = ["Measure", "Type of Building", "Region"]
+
+# A release workbook whose last date row ends in blank cells, which openpyxl does not write out
+def _make_workbook(path):
+    book = openpyxl.Workbook()
+    index = book.active
+    index.title = workbook.INDEX_SHEET
+    index.append([workbook.INDEX_HEADER, "Series Type", workbook.SERIES_ID])
+    for i, description in enumerate(DESCRIPTIONS):
+        index.append([description, "Original", f"A{i}"])
+    data = book.create_sheet(workbook.DATA_SHEET)
+    data.append([None, *DESCRIPTIONS])
+    for name in workbook.META_ROWS:
+        data.append([name, *(f"A{i}" if name == workbook.SERIES_ID else "Number" for i in range(len(DESCRIPTIONS)))])
+    data.append([datetime.datetime(2021, 9, 1), 10, 20, 30])
+    data.append([datetime.datetime(2021, 12, 1), 11, None, None])
+    book.save(path)
+    return path
+
+def test_read_series_pads_rows_ending_in_blank_cells(tmp_path):
+    path = _make_workbook(tmp_path / "87310087.xlsx")
+    data = workbook.read_series(path, FIELDS, freq="Q")
+    assert len(data) == 6
+    last = data[data["Date"] == "2021Q4"]
+    np.testing.assert_array_equal(last["Value"].to_numpy(), [11, np.nan, np.nan])
+
+def test_read_series_selected_columns_pads_rows(tmp_path):
+    path = _make_workbook(tmp_path / "87310087.xlsx")
+    data = workbook.read_series(path, FIELDS, freq="Q", select=["A2"])
+    assert list(data["Region"]) == ["Australia", "Australia"]
+    np.testing.assert_array_equal(data["Value"].to_numpy(), [30, np.nan])
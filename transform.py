@@ -0,0 +1,120 @@
+# Reshaping and window stages shared by the builders
+import numpy as np
+import pandas as pd
+
+from instrument import stage
+
+# Reshape long observations (one row per series, period and measure, as returned by
+# extract_data(..., layout='long')) into one row per series and period with a column per measure.
+# Like the old wide -> melt -> pivot round trip, every series gets a row for every period in the
+# data, so row-based windows (e.g. the 12 month year-end sums) always span consecutive periods.
+# Rows come out sorted by dims and period
+@stage("reshape")
+def to_measure_columns(data, dims, period="TIME_PERIOD", measure="MEASURE", value="OBS_VALUE"):
+    values = data.set_index(dims + [period, measure])[value].unstack(measure)
+    values = values.sort_index(axis=1)
+    values.columns = values.columns.astype(str)
+    values.columns.name = None
+
+    series = data[dims].drop_duplicates().sort_values(dims)
+    periods = np.sort(data[period].unique())
+    grid = pd.MultiIndex.from_frame(
+        series.loc[series.index.repeat(len(periods))].assign(**{period: np.tile(periods, len(series))})
+    )
+    return values.reindex(grid).reset_index()
+
+# Windowed sums of several measures over many groups in one vectorised pass, replacing
+# groupby(by)[columns].transform(lambda x: x.rolling(window, min_periods).sum()), which calls a
+# Python lambda once per group. Rows are put in group order (and by the order column within a
+# group, else in their current order) so every group is one contiguous block; the window is then
+# summed as `window` shifted adds that never reach back past the start of the row's block.
+# As with rolling(), a sum is NaN unless the window holds at least min_periods (default: window)
+# non-missing values, and rows whose group key is missing get NaN. The result is aligned with
+# data's index, with columns named after names (default: columns)
+@stage("rolling")
+def rolling_sum(data, by, columns, window, min_periods=None, order=None, names=None):
+    if min_periods is None:
+        min_periods = window
+    # ngroup() leaves rows with a missing key as NaN; give them group -1
+    group = data.groupby(by, sort=False, observed=True).ngroup().fillna(-1).to_numpy(dtype=np.int64)
+    if order is None:
+        perm = np.argsort(group, kind="stable")
+    else:
+        perm = np.lexsort((pd.factorize(data[order], sort=True)[0], group))
+
+    group = group[perm]
+    values = data[columns].to_numpy(dtype="float64")[perm]
+    present = ~np.isnan(values)
+    values = np.where(present, values, 0.0)
+
+    # Position of the first row of each row's group block
+    position = np.arange(len(group))
+    block_start = np.r_[True, group[1:] != group[:-1]] if len(group) else np.empty(0, dtype=bool)
+    first = np.maximum.accumulate(np.where(block_start, position, 0)) if len(group) else position
+
+    sums = values.copy()
+    counts = present.astype(np.int64)
+    for lag in range(1, window):
+        inside = (position - lag >= first)[:, None]
+        sums[lag:] += np.where(inside[lag:], values[:-lag], 0.0)
+        counts[lag:] += np.where(inside[lag:], present[:-lag], 0)
+
+    result = np.where(counts >= min_periods, sums, np.nan)
+    result[group < 0] = np.nan
+    out = np.empty_like(result)
+    out[perm] = result
+    return pd.DataFrame(out, index=data.index, columns=names or columns)
+
+# Stitch vintages of the same dataset (e.g. BA_SA2_2016-21 then BA_SA2), given as long frames
+# from oldest to newest, into one long frame. Each series (one value of `keys`) is a block of
+# periods per vintage; where the blocks overlap, precedence decides which vintage keeps the
+# overlapping periods: 'newest' (the default) keeps the older vintage only before the newer one
+# starts, 'oldest' keeps the newer vintage only after the older one ends. Only the per-series
+# start/end periods are looked up, so memory stays linear in the rows however many series there are
+@stage("stitch")
+def stitch_vintages(frames, keys, period="TIME_PERIOD", precedence="newest"):
+    if precedence not in ("newest", "oldest"):
+        raise ValueError(f"Unknown precedence {precedence!r}, expected 'newest' or 'oldest'")
+    # A vintage whose fetch failed comes back as None; stitching without it would quietly drop
+    # its periods from the output
+    if not frames:
+        raise ValueError("No vintages to stitch")
+    missing = [i for i, frame in enumerate(frames) if frame is None]
+    if missing:
+        raise ValueError(f"Vintage(s) {missing} of {len(frames)} missing, their fetch failed")
+    stitched = frames[0]
+    for newer in frames[1:]:
+        stitched = _stitch_pair(stitched, newer, keys, period, precedence)
+    return stitched
+
+def _stitch_pair(older, newer, keys, period, precedence):
+    if precedence == "newest":
+        winner, loser, bound, keep = newer, older, "min", np.less
+    else:
+        winner, loser, bound, keep = older, newer, "max", np.greater
+    # First (or last) period of each series in the winning vintage
+    bounds = winner.groupby(keys, sort=False, observed=True, dropna=False)[period].agg(bound)
+    series = pd.MultiIndex.from_frame(loser[keys]) if len(keys) > 1 else pd.Index(loser[keys[0]])
+    positions = bounds.index.get_indexer(series)
+    loser_periods = _comparable(loser[period])
+    cutover = _comparable(bounds)[np.maximum(positions, 0)] if len(bounds) else loser_periods
+    kept = (positions < 0) | keep(loser_periods, cutover)
+
+    blocks = [older[kept], newer] if precedence == "newest" else [older, newer[kept]]
+    return pd.concat(_align_categories(blocks), ignore_index=True)
+
+# Period ordinals (see schema.py) compare as integers, labels as strings
+def _comparable(periods):
+    if pd.api.types.is_integer_dtype(periods):
+        return periods.to_numpy()
+    return periods.astype(str).to_numpy()
+
+# Give categorical columns the same (sorted, merged) categories in every frame so they stay
+# categorical through pd.concat
+def _align_categories(frames):
+    for col in frames[0].columns:
+        dtypes = [frame[col].dtype for frame in frames if col in frame]
+        if len(dtypes) == len(frames) and all(isinstance(d, pd.CategoricalDtype) for d in dtypes) and len(set(dtypes)) > 1:
+            merged = pd.api.types.union_categoricals([frame[col] for frame in frames], sort_categories=True)
+            frames = [frame.assign(**{col: frame[col].cat.set_categories(merged.categories)}) for frame in frames]
+    return frames
@@ -0,0 +1,164 @@
+# Loader for ABS time-series workbooks (87xx-style .xlsx releases such as 87310087.xlsx), shared
+# by the xlsx-based builders. The Data sheets are streamed with openpyxl's read-only reader: the
+# first row holds each series' ';'-separated description, the next nine rows its metadata (unit,
+# series type, frequency, ... series ID) and the rest one row per date. Descriptions are split
+# once per series rather than once per cell, and the long frame is laid out from the value matrix
+# with NumPy (series by series, dates within a series, the same order melt gives).
+import numpy as np
+import openpyxl
+import pandas as pd
+
+from instrument import stage
+
+DATA_SHEET = "Data1"
+INDEX_SHEET = "Index"
+
+# First column of the Index sheet's header row, and the column identifying each series
+INDEX_HEADER = "Data Item Description"
+SERIES_ID = "Series ID"
+
+# Metadata rows between the description row and the first date row, in sheet order
+META_ROWS = ["Unit", "Series Type", "Data Type", "Frequency", "Collection Month", "Series Start", "Series End", "No. Obs", "Series ID"]
+
+def _open(path):
+    return openpyxl.load_workbook(path, read_only=True, data_only=True)
+
+# Split a description such as 'Dwelling units approved for demolition ;  Houses ;  Victoria ;'
+# into len(fields) parts; any further ';' stay in the last part
+def split_description(description, n_fields):
+    parts = str(description).split(";", n_fields - 1)
+    parts += [""] * (n_fields - len(parts))
+    return [part.strip("; ").strip() for part in parts]
+
+# Read one Data sheet: the series metadata (one row per series, the Description plus META_ROWS),
+# the dates and the [date, series] float64 value matrix. With columns (0-based series positions),
+# only those series are decoded and the rows are not read past the last of them
+def _read_data_sheet(sheet, columns=None):
+    sheet.reset_dimensions()
+    max_col = max(columns) + 2 if columns is not None and len(columns) else None
+    descriptions = next(sheet.iter_rows(max_row=1, max_col=max_col, values_only=True))[1:]
+    if columns is None:
+        n_series = len(descriptions)
+        while n_series and descriptions[n_series - 1] is None:
+            n_series -= 1
+        columns = range(n_series)
+        max_col = n_series + 1
+    pick = [column + 1 for column in columns]
+    # The read-only reader drops a row's trailing empty cells unless max_col pads it out
+    rows = sheet.iter_rows(min_row=2, max_col=max_col, values_only=True)
+
+    meta = {"Description": [descriptions[column] for column in columns]}
+    for name, row in zip(META_ROWS, rows):
+        meta[name] = [row[i] for i in pick]
+    dates, values = [], []
+    for row in rows:
+        if row and row[0] is not None:
+            dates.append(row[0])
+            values.append([row[i] for i in pick])
+
+    matrix = np.array(values, dtype="float64").reshape(len(values), len(pick))
+    return pd.DataFrame(meta), pd.to_datetime(dates), matrix
+
+# Series metadata of a Data sheet, with the description split into fields
+def read_metadata(path, fields, sheet=DATA_SHEET):
+    workbook = _open(path)
+    try:
+        metadata, _, _ = _read_data_sheet(workbook[sheet])
+    finally:
+        workbook.close()
+    return _with_fields(metadata, fields)
+
+def _with_fields(metadata, fields):
+    parts = [split_description(description, len(fields)) for description in metadata["Description"]]
+    return pd.concat([pd.DataFrame(parts, columns=fields, index=metadata.index, dtype=object), metadata], axis=1)
+
+# Catalogue of every series in the workbook from the Index sheet (Data Item Description, Series
+# Type, Series ID, Series Start, ... as ABS lays it out), with the description split into fields
+# and the Sheet/Column the series is stored in, found from the Series ID row of each Data sheet
+def read_catalogue(path, fields):
+    workbook = _open(path)
+    try:
+        return _catalogue(workbook, fields)
+    finally:
+        workbook.close()
+
+def _catalogue(workbook, fields):
+    rows = workbook[INDEX_SHEET].iter_rows(values_only=True)
+    for row in rows:
+        if row and row[0] == INDEX_HEADER:
+            header = [str(name).strip() if name is not None else f"Unnamed {i}" for i, name in enumerate(row)]
+            break
+    else:
+        raise ValueError(f"No '{INDEX_HEADER}' header row in the {INDEX_SHEET} sheet")
+    series_id = header.index(SERIES_ID)
+    entries = []
+    for row in rows:
+        if not row or len(row) <= series_id or row[series_id] is None:
+            break
+        entries.append(row[:len(header)])
+    catalogue = pd.DataFrame(entries, columns=header)
+
+    locations = {}
+    for name in workbook.sheetnames:
+        if not name.startswith("Data"):
+            continue
+        sheet = workbook[name]
+        sheet.reset_dimensions()
+        header_rows = list(sheet.iter_rows(max_row=1 + len(META_ROWS), values_only=True))
+        for column, sid in enumerate(header_rows[-1][1:]):
+            if sid is not None:
+                locations[sid] = (name, column)
+    catalogue["Sheet"] = [locations.get(sid, (None, None))[0] for sid in catalogue[SERIES_ID]]
+    catalogue["Column"] = [locations.get(sid, (None, None))[1] for sid in catalogue[SERIES_ID]]
+
+    parts = [split_description(description, len(fields)) for description in catalogue[INDEX_HEADER]]
+    return pd.concat([pd.DataFrame(parts, columns=fields, dtype=object), catalogue], axis=1)
+
+# Catalogue rows matching select: a list of series IDs, or {field: value or list of values} over
+# the parsed description fields and the Index columns (e.g. {'measure': 'Value of work not yet
+# commenced', 'Series Type': 'Original'})
+def _select(catalogue, select):
+    if isinstance(select, dict):
+        keep = np.ones(len(catalogue), dtype=bool)
+        for field, wanted in select.items():
+            wanted = [wanted] if isinstance(wanted, str) or not np.iterable(wanted) else list(wanted)
+            keep &= catalogue[field].isin(wanted).to_numpy()
+        return catalogue[keep]
+    return catalogue[catalogue[SERIES_ID].isin(list(select))]
+
+# Long frame of the series in a Data sheet: 'Date' (or the period label for freq, e.g. '2021Q3'
+# for freq='Q'), one column per description field and the float64 value column. With select
+# (see _select) the Index catalogue decides which series to read, from whichever Data sheets hold
+# them, and only those columns are decoded
+@stage("decode")
+def read_series(path, fields, value_name="Value", sheet=DATA_SHEET, freq=None, select=None):
+    workbook = _open(path)
+    try:
+        if select is None:
+            metadata, dates, matrix = _read_data_sheet(workbook[sheet])
+            return _to_long(_with_fields(metadata, fields), dates, matrix, fields, value_name, freq)
+
+        chosen = _select(_catalogue(workbook, fields), select)
+        missing = chosen[chosen["Sheet"].isna()]
+        if len(missing):
+            raise ValueError(f"Series not found in any Data sheet: {', '.join(missing[SERIES_ID].astype(str))}")
+        frames = []
+        for name, in_sheet in chosen.groupby("Sheet", sort=False):
+            columns = sorted(in_sheet["Column"].astype(int))
+            metadata, dates, matrix = _read_data_sheet(workbook[name], columns)
+            frames.append(_to_long(_with_fields(metadata, fields), dates, matrix, fields, value_name, freq))
+    finally:
+        workbook.close()
+    if not frames:
+        return pd.DataFrame(columns=["Date", *fields, value_name])
+    return pd.concat(frames, ignore_index=True)
+
+def _to_long(metadata, dates, matrix, fields, value_name, freq):
+    n_dates, n_series = matrix.shape
+    if freq is not None:
+        dates = dates.to_period(freq).astype(str)
+    data = {"Date": np.tile(np.asarray(dates), n_series)}
+    for field in fields:
+        data[field] = np.repeat(metadata[field].to_numpy(dtype=object), n_dates)
+    data[value_name] = matrix.T.reshape(-1)
+    return pd.DataFrame(data)
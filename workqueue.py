@@ -0,0 +1,134 @@
+# Persistent, resumable work queue for long crawls such as the SA2 build. Every planned
+# sub-request is recorded in a SQLite database with its status; each completed slice is written
+# to disk as soon as it arrives, so after a crash or network blip a rerun only fetches the
+# requests that are still outstanding. Progress is reported with throughput and an ETA.
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+
+import pandas as pd
+
+import httpcache
+from dhandler import extract_data
+
+QUEUE_DIR = "queues"
+
+def _now():
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+class WorkQueue:
+    def __init__(self, name):
+        self.name = name
+        self.root = os.path.join(httpcache.CACHE_DIR, QUEUE_DIR, name)
+        os.makedirs(self.root, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(os.path.join(self.root, "queue.db"), timeout=30, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                """CREATE TABLE IF NOT EXISTS tasks (
+                    task_id TEXT PRIMARY KEY,
+                    seq INTEGER NOT NULL,
+                    url TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    rows INTEGER,
+                    error TEXT,
+                    updated_at TEXT
+                )"""
+            )
+
+    def _execute(self, sql, params=()):
+        with self._lock, self._connection:
+            return self._connection.execute(sql, params).fetchall()
+
+    # Record the planned sub-requests (task id -> url); tasks already known keep their status
+    def plan(self, tasks):
+        start = self._execute("SELECT COALESCE(MAX(seq) + 1, 0) FROM tasks")[0][0]
+        for seq, (task_id, url) in enumerate(tasks.items(), start):
+            self._execute("INSERT OR IGNORE INTO tasks (task_id, seq, url, updated_at) VALUES (?, ?, ?, ?)", (task_id, seq, url, _now()))
+
+    def outstanding(self):
+        return self._execute("SELECT task_id, url FROM tasks WHERE status != 'done' ORDER BY seq")
+
+    def counts(self):
+        return dict(self._execute("SELECT status, COUNT(*) FROM tasks GROUP BY status"))
+
+    def _slice_path(self, task_id):
+        return os.path.join(self.root, f"{task_id}.pkl")
+
+    def complete(self, task_id, data):
+        path = self._slice_path(task_id)
+        data.to_pickle(path + ".tmp")
+        os.replace(path + ".tmp", path)
+        self._execute(
+            "UPDATE tasks SET status = 'done', attempts = attempts + 1, rows = ?, error = NULL, updated_at = ? WHERE task_id = ?",
+            (len(data), _now(), task_id),
+        )
+
+    def fail(self, task_id, error):
+        self._execute(
+            "UPDATE tasks SET status = 'failed', attempts = attempts + 1, error = ?, updated_at = ? WHERE task_id = ?",
+            (str(error), _now(), task_id),
+        )
+
+    # Completed slices in planned order, optionally only those whose task_id starts with prefix
+    def results(self, prefix=""):
+        done = self._execute(
+            "SELECT task_id FROM tasks WHERE status = 'done' AND substr(task_id, 1, ?) = ? ORDER BY seq",
+            (len(prefix), prefix),
+        )
+        return [pd.read_pickle(self._slice_path(task_id)) for (task_id,) in done]
+
+    def close(self):
+        self._connection.close()
+
+    # Forget every task and slice, e.g. to start the crawl over
+    def reset(self):
+        self.close()
+        shutil.rmtree(self.root, ignore_errors=True)
+
+# Print done/total, throughput and ETA as slices finish
+class Progress:
+    def __init__(self, total, done=0):
+        self.total = total
+        self.done = done
+        self.started = time.monotonic()
+        self.finished_here = 0
+
+    def update(self, label):
+        self.done += 1
+        self.finished_here += 1
+        elapsed = time.monotonic() - self.started
+        rate = self.finished_here / elapsed if elapsed > 0 else 0.0
+        remaining = self.total - self.done
+        eta = f"{remaining / rate:.0f}s" if rate > 0 else "unknown"
+        print(f"[{self.done}/{self.total}] {label} done, {rate * 60:.1f} requests/min, ETA {eta}")
+
+# Work through the outstanding tasks of a queue with extract_data, checkpointing each slice as
+# it arrives. Keyword arguments are passed on to extract_data. Returns the number of tasks
+# still outstanding afterwards (0 when the crawl is complete)
+def run(queue, max_workers=8, **kwargs):
+    tasks = queue.outstanding()
+    counts = queue.counts()
+    progress = Progress(sum(counts.values()), counts.get("done", 0))
+    if not tasks:
+        return 0
+    print(f"{queue.name}: {len(tasks)} of {progress.total} requests outstanding")
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(tasks))) as executor:
+        futures = {executor.submit(extract_data, url, **kwargs): task_id for task_id, url in tasks}
+        for future in as_completed(futures):
+            task_id = futures[future]
+            data = future.result()
+            if data is None:
+                queue.fail(task_id, "extract_data returned no data")
+                print(f"{task_id} failed, it will be retried on the next run")
+            else:
+                queue.complete(task_id, data)
+                progress.update(task_id)
+
+    return len(queue.outstanding())